@@ -0,0 +1,156 @@
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from PySide6.QtCore import QObject, QRunnable, QTimer, Signal
+from FileWorker import file_pool
+from scheduling_core.autosave import AutosaveStore
+
+# 最后一次修改后等待的时间（毫秒），连续的修改合并为一次写入
+DEBOUNCE_MS = 2000
+# 一直在修改时，距第一次未保存的修改最多等待的时间（毫秒）
+MAX_DELAY_MS = 30000
+# 两次写入之间的最小间隔（毫秒），限制大配置的写盘频率
+MIN_INTERVAL_MS = 10000
+# 连续失败这么多次后提示用户，并停止重试直到下一次修改
+MAX_FAILURES = 3
+
+# 写入失败时的异常类型（见 AutosaveStore.write）
+_WRITE_ERRORS = (OSError, ValueError, TypeError, OverflowError)
+
+
+class AutosaveSignals(QObject):
+    finished = Signal(str)  # 失败时为错误信息，成功时为空字符串
+
+
+class AutosaveTask(QRunnable):
+    """在文件线程池中写入快照，data 为 None 时删除快照
+
+    与手动保存、加载共用同一个单线程池，按提交顺序执行，删除不会被之前提交的写入覆盖。
+    """
+
+    def __init__(self, store: AutosaveStore, name: str, data: Optional[Dict], source_path: Optional[str]):
+        super().__init__()
+        # 由调用方持有任务对象，避免线程池结束后删除信号对象
+        self.setAutoDelete(False)
+        self.store = store
+        self.name = name
+        self.data = data
+        self.source_path = source_path
+        self.generation = 0
+        self.signals = AutosaveSignals()
+
+    def run(self):
+        if self.data is None:
+            self.store.discard(self.name)
+        else:
+            try:
+                self.store.write(self.name, self.data, self.source_path)
+            except _WRITE_ERRORS as e:
+                self.signals.finished.emit(str(e) or type(e).__name__)
+                return
+        self.signals.finished.emit("")
+
+
+class Autosaver(QObject):
+    """页面数据的自动保存：合并连续的修改，在后台写入崩溃恢复快照
+
+    页面每次修改数据后调用 mark_dirty()；停止修改 DEBOUNCE_MS 后写入，一直在修改时最迟
+    MAX_DELAY_MS 后写入，两次写入至少间隔 MIN_INTERVAL_MS。capture 在界面线程中调用，
+    返回 (快照数据, 来源文件)；快照数据在后台线程中编码，不能与界面共用会被修改的对象。
+    写入失败时间隔后重试，连续失败 MAX_FAILURES 次发出 failed 并等待下一次修改。
+    """
+
+    failed = Signal(str)  # 错误信息
+
+    def __init__(self, name: str, capture: Callable[[], Tuple[Dict, Optional[str]]],
+                 parent: Optional[QObject] = None, store: Optional[AutosaveStore] = None):
+        super().__init__(parent)
+        self.name = name
+        self.capture = capture
+        self.store = store or AutosaveStore()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._write)
+        # 第一次未写入快照的修改的时间，没有未写入的修改时为 None
+        self._dirty_since: Optional[float] = None
+        self._last_write = float('-inf')
+        # 已提交、尚未完成的任务
+        self._tasks: List[AutosaveTask] = []
+        self._writing = 0
+        # 每次 discard 后递增；之前提交的写入失败时不再重试
+        self._generation = 0
+        self._failures = 0
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty_since is not None
+
+    def mark_dirty(self):
+        if self._failures >= MAX_FAILURES:
+            # 已经提示过失败，新的修改再试一轮
+            self._failures = 0
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        self._schedule(now)
+
+    def _schedule(self, now: float):
+        if self._writing:
+            # 写入完成后再安排下一次，期间的修改合并到下一次写入
+            return
+        due = min(now + DEBOUNCE_MS / 1000, self._dirty_since + MAX_DELAY_MS / 1000)
+        due = max(due, self._last_write + MIN_INTERVAL_MS / 1000)
+        self._timer.start(max(0, int((due - now) * 1000)))
+
+    def _write(self):
+        if self._dirty_since is None or self._writing:
+            return
+        data, source_path = self.capture()
+        self._dirty_since = None
+        self._last_write = time.monotonic()
+        self._writing += 1
+        task = AutosaveTask(self.store, self.name, data, source_path)
+        task.generation = self._generation
+        self._submit(task)
+
+    def _submit(self, task: AutosaveTask):
+        self._tasks.append(task)
+        task.signals.finished.connect(lambda error: self._on_finished(task, error))
+        file_pool().start(task)
+
+    def _on_finished(self, task: AutosaveTask, error: str):
+        self._tasks.remove(task)
+        if task.data is None:
+            return
+        self._writing -= 1
+        if not error:
+            self._failures = 0
+        elif task.generation == self._generation:
+            self._failures += 1
+            if self._failures == MAX_FAILURES:
+                self.failed.emit(error)
+            elif self._dirty_since is None:
+                # 写入失败（如磁盘已满），保留修改标记，间隔后重试
+                self._dirty_since = time.monotonic()
+        if self._dirty_since is not None:
+            self._schedule(time.monotonic())
+
+    def discard(self):
+        """数据已经保存或重新加载：放弃未写入的修改，删除已有的快照"""
+        self._timer.stop()
+        self._dirty_since = None
+        self._generation += 1
+        self._failures = 0
+        self._submit(AutosaveTask(self.store, self.name, None, None))
+
+    def flush(self):
+        """退出前在界面线程中写入尚未写入的修改"""
+        self._timer.stop()
+        file_pool().waitForDone()
+        if self._dirty_since is None:
+            return
+        data, source_path = self.capture()
+        self._dirty_since = None
+        try:
+            self.store.write(self.name, data, source_path)
+        except _WRITE_ERRORS:
+            pass
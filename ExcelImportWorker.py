@@ -0,0 +1,58 @@
+import threading
+from PySide6.QtCore import QObject, Signal
+from scheduling_core.excel_import import ExcelImportError, iter_employee_batches
+
+
+class ExcelImportWorker(QObject):
+    """在后台线程中流式读取员工Excel，分批把数据交给界面线程"""
+    batch_ready = Signal(list)
+    progress = Signal(int, int)  # 已读行数, 总行数(未知时为0)
+    finished = Signal(int, list, list)  # 导入行数, 跳过的行号, 基础产出留空的行号
+    failed = Signal(str)
+
+    # 界面尚未处理的批次数上限，防止读取速度快于表格填充时内存持续增长
+    MAX_PENDING_BATCHES = 4
+
+    def __init__(self, file_path: str, batch_size: int = 1000):
+        super().__init__()
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self._cancelled = threading.Event()
+        self._pending = threading.Semaphore(self.MAX_PENDING_BATCHES)
+
+    def cancel(self):
+        """请求取消导入，可在任意线程调用"""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def batch_consumed(self):
+        """界面线程处理完一批数据后调用"""
+        self._pending.release()
+
+    def run(self):
+        imported = 0
+        skipped_rows = no_output_rows = []
+        try:
+            for batch, done, total, skipped_rows, no_output_rows in iter_employee_batches(
+                    self.file_path, self.batch_size, self.is_cancelled):
+                if batch:
+                    # 等待界面消化积压的批次，同时响应取消
+                    while not self._pending.acquire(timeout=0.1):
+                        if self.is_cancelled():
+                            break
+                    if self.is_cancelled():
+                        break
+                    self.batch_ready.emit(batch)
+                    imported += len(batch)
+                self.progress.emit(done, total)
+                if self.is_cancelled():
+                    break
+        except ExcelImportError as e:
+            self.failed.emit(str(e))
+            return
+        except Exception as e:
+            self.failed.emit(f"导入失败: {str(e)}")
+            return
+        self.finished.emit(imported, skipped_rows, no_output_rows)
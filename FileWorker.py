@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Callable, Optional
+from PySide6.QtWidgets import QMessageBox, QProgressDialog, QWidget
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from scheduling_core.config_data import ConfigDataError
+from scheduling_core.file_utils import Cancelled
+from scheduling_core.schedule_data import ScheduleDataError
+
+# 进度以千分比发送，避免大文件的字节数超出信号的整数范围
+PROGRESS_SCALE = 1000
+# 两次进度信号的最小间隔（秒），解析很快时不会让界面线程忙于刷新进度条
+PROGRESS_INTERVAL = 0.05
+# 超过这个时间（毫秒）仍未完成才显示进度窗口，小文件不会闪一下
+SHOW_PROGRESS_AFTER_MS = 300
+
+_pool: Optional[QThreadPool] = None
+
+
+def file_pool() -> QThreadPool:
+    """文件读写专用的单线程池：按提交顺序执行，也不会排在耗时的排班求解后面"""
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(1)
+    return _pool
+
+
+class FileTaskSignals(QObject):
+    progress = Signal(int)  # 千分比
+    finished = Signal(object)
+    failed = Signal(str, str)  # 标题, 内容
+    cancelled = Signal()
+
+
+class FileTask(QRunnable):
+    """在 QThreadPool 中解析或写出配置文件
+
+    job(progress, should_stop) 在后台线程运行，返回值通过 finished 交给界面线程，
+    界面线程只负责把结果放进表格和模型。
+    """
+
+    def __init__(self, job: Callable[[Callable[[int, int], None], Callable[[], bool]], object]):
+        super().__init__()
+        # 由调用方持有任务对象，避免线程池结束后删除信号对象
+        self.setAutoDelete(False)
+        self.job = job
+        self.signals = FileTaskSignals()
+        self._cancelled = threading.Event()
+        self._last_report = 0.0
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _report(self, done: int, total: int):
+        now = time.monotonic()
+        if done < total and now - self._last_report < PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        self.signals.progress.emit(done * PROGRESS_SCALE // total if total > 0 else PROGRESS_SCALE)
+
+    def run(self):
+        try:
+            result = self.job(self._report, self._cancelled.is_set)
+        except Cancelled:
+            self.signals.cancelled.emit()
+            return
+        except (ConfigDataError, ScheduleDataError) as e:
+            self.signals.failed.emit(e.title, e.message)
+            return
+        except Exception as e:
+            self.signals.failed.emit("文件读写错误", str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+def start_file_task(parent: QWidget, label: str, job, on_finished: Callable[[object], None],
+                    on_cancelled: Optional[Callable[[], None]] = None) -> FileTask:
+    """在后台运行 job，期间显示可取消的进度窗口；调用方需保存返回的任务对象直到任务结束
+
+    界面保持响应，但读写完成前页面被禁用，不能编辑正在保存或将被替换的数据。
+    进度窗口属于页面所在的窗口，页面被禁用时仍可以点击取消。
+    """
+    # 页面本身就是顶层窗口时不能禁用，否则进度窗口也会被禁用；此时由窗口模态阻止编辑
+    disable_page = not parent.isWindow()
+    dialog = QProgressDialog(label, "取消", 0, PROGRESS_SCALE, parent.window())
+    dialog.setWindowTitle("请稍候")
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(SHOW_PROGRESS_AFTER_MS)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    dialog.setValue(0)
+
+    task = FileTask(job)
+    dialog.canceled.connect(task.cancel)
+    dialog.canceled.connect(lambda: dialog.setLabelText("正在取消..."))
+    task.signals.progress.connect(dialog.setValue)
+
+    def close():
+        # 关闭进度窗口会发出 canceled，先断开
+        dialog.canceled.disconnect()
+        dialog.close()
+        dialog.deleteLater()
+        if disable_page:
+            parent.setEnabled(True)
+
+    def finished(result):
+        close()
+        on_finished(result)
+
+    def failed(title: str, message: str):
+        close()
+        QMessageBox.warning(parent, title, message)
+
+    def cancelled():
+        close()
+        if on_cancelled is not None:
+            on_cancelled()
+
+    task.signals.finished.connect(finished)
+    task.signals.failed.connect(failed)
+    task.signals.cancelled.connect(cancelled)
+    if disable_page:
+        parent.setEnabled(False)
+    file_pool().start(task)
+    return task
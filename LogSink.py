@@ -0,0 +1,163 @@
+import logging
+import os
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterable, Optional
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QPlainTextEdit
+
+# 日志目录，每个日志名一个滚动日志文件
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+
+
+class _LogFile:
+    """输出框对滚动日志文件的引用；同名的输出框共用一个 logger 和文件处理器，最后一个关闭时释放文件"""
+    _lock = threading.Lock()
+    # 日志名 -> 引用该日志文件的输出框数量
+    _users: Dict[str, int] = {}
+
+    def __init__(self, log_name: str, max_bytes: int, backup_count: int):
+        self.log_name = log_name
+        self.logger = logging.getLogger(f"{__name__}.{log_name}")
+        with self._lock:
+            if not self._users.get(log_name):
+                os.makedirs(LOG_DIR, exist_ok=True)
+                handler = RotatingFileHandler(os.path.join(LOG_DIR, f"{log_name}.log"),
+                                              maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+                handler.terminator = ""
+                self.logger.propagate = False
+                self.logger.setLevel(logging.INFO)
+                self.logger.addHandler(handler)
+            self._users[log_name] = self._users.get(log_name, 0) + 1
+        self._closed = False
+
+    def write(self, text: str):
+        self.logger.info(text)
+
+    def close(self):
+        """释放引用，可重复调用"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            users = self._users.pop(self.log_name) - 1
+            if users:
+                self._users[self.log_name] = users
+                return
+            for handler in list(self.logger.handlers):
+                self.logger.removeHandler(handler)
+                handler.close()
+
+
+class LogSink(QObject):
+    """输出框的缓冲写入器：任意线程写入，界面线程定时批量刷新；输出框只保留最近的行，所有输出同时写入滚动日志文件"""
+    _data_pending = Signal()
+
+    FLUSH_INTERVAL_MS = 100
+
+    def __init__(self, widget: QPlainTextEdit, max_lines: int = 10000, log_name: Optional[str] = None,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        super().__init__(widget)
+        self.widget = widget
+        self.widget.setReadOnly(True)
+        self.widget.setUndoRedoEnabled(False)
+        # 超过行数上限时输出框自动丢弃最早的行
+        self.widget.setMaximumBlockCount(max_lines)
+
+        self._lock = threading.Lock()
+        # 待显示的行，超过上限的旧行在刷新前就丢弃（反正也会被输出框移除）
+        self._display = deque(maxlen=max_lines)
+        self._file_chunks = []
+        self._log_name = log_name
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._log_file: Optional[_LogFile] = None
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        # 其他线程写入时通过排队信号在界面线程启动定时器
+        self._data_pending.connect(self._schedule_flush, Qt.QueuedConnection)
+
+    def write(self, text: str):
+        """追加文本，可在任意线程调用"""
+        if not text:
+            return
+        with self._lock:
+            was_empty = not self._display and not self._file_chunks
+            start = 0
+            while True:
+                end = text.find('\n', start)
+                if end < 0:
+                    if start < len(text):
+                        self._display.append(text[start:])
+                    break
+                self._display.append(text[start:end + 1])
+                start = end + 1
+            if self._log_name:
+                self._file_chunks.append(text)
+        if was_empty:
+            self._data_pending.emit()
+
+    def write_lines(self, lines: Iterable[str]):
+        self.write("".join(f"{line}\n" for line in lines))
+
+    def set_text(self, text: str):
+        """清空输出框后显示新文本"""
+        self.clear()
+        self.write(text)
+
+    def clear(self):
+        with self._lock:
+            self._display.clear()
+        self.widget.clear()
+
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self.FLUSH_INTERVAL_MS)
+
+    def flush(self):
+        """把缓冲的输出一次性写入输出框和日志文件（界面线程）"""
+        with self._lock:
+            text = "".join(self._display)
+            self._display.clear()
+            file_text = "".join(self._file_chunks)
+            self._file_chunks.clear()
+
+        if file_text:
+            self._write_file(file_text)
+        if not text:
+            return
+
+        scroll_bar = self.widget.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        # 在末尾插入，不移动用户的光标和选择；原本在底部时保持滚动到底部
+        cursor = QTextCursor(self.widget.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def close(self):
+        """写出缓冲的输出并释放日志文件，之后的输出只显示在输出框（界面线程）"""
+        self.flush()
+        with self._lock:
+            self._log_name = None
+            self._file_chunks.clear()
+        if self._log_file is not None:
+            self._log_file.close()
+
+    def _write_file(self, text: str):
+        if self._log_file is None:
+            try:
+                self._log_file = _LogFile(self._log_name, self._max_bytes, self._backup_count)
+            except OSError:
+                # 无法写日志文件时只在输出框显示
+                with self._lock:
+                    self._log_name = None
+                return
+            # 输出框销毁时一并释放，没有调用 close() 也不会留下打开的文件
+            self.destroyed.connect(self._log_file.close)
+        self._log_file.write(text)
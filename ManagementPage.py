@@ -2,12 +2,28 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QPushButton, QScrollArea, QDialog, QFormLayout,
     QTableWidget, QHeaderView, QLineEdit, QMessageBox,
-    QTableWidgetItem, QFileDialog, QAbstractScrollArea, QLabel
+    QTableWidgetItem, QFileDialog, QAbstractScrollArea, QLabel,
+    QTableView, QAbstractItemView, QProgressDialog
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QDoubleValidator
-from typing import Dict, List
+from PySide6.QtCore import Qt, QThread, QSignalBlocker
+from PySide6.QtGui import QDoubleValidator, QIntValidator
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+import os
 from yaml_ManagementDataManager import YamlManager
+from scheduling_core.production_store import ProductionColumns
+from ProductionTableModel import ProductionTableModel
+from ProductionFilterProxy import ProductionFilterProxy
+from TableFilter import ProductionFilterBar, TableFilterBar
+from ProductionSummaryPanel import ProductionSummaryPanel
+from ExcelImportWorker import ExcelImportWorker
+from FileWorker import start_file_task
+from Autosaver import Autosaver
+from scheduling_core import config_data
+from scheduling_core.excel_import import EMPLOYEE_FIELDS
+from scheduling_core.config_journal import ConfigJournal, add_op, delete_op
+from scheduling_core.config_index import ConfigIndex
+from scheduling_core.baseline_estimator import BaselineEstimator, BaselineTable, estimate
+from scheduling_core.autosave import Snapshot
 
 class ManagementPage(QWidget):
     def __init__(self):
@@ -17,6 +33,31 @@ class ManagementPage(QWidget):
         self.line_table = None
         self.special_station_table = None
         self.production_table = None
+        self.production_model = None
+        # 生产情况视图通过代理模型筛选和排序；各表格上方的筛选栏
+        self.production_proxy = None
+        self.filter_bars = {}
+        self.production_summary = None
+        # Excel导入使用的后台线程
+        self._import_thread = None
+        self._import_worker = None
+        self._import_progress = None
+        # 导入期间读到的员工，导入完成后才替换员工表，取消或失败时当前员工表不变
+        self._import_staged: List[Dict] = []
+        # 正在后台保存或加载配置文件的任务
+        self._file_task = None
+        # 当前配置文件及其操作日志；保存到同一文件时只追加变化的部分
+        self.config_path = None
+        self.journal = None
+        self._pending_ops = []
+        self._needs_full_save = True
+        # 员工、拉线、特殊工位的索引，与表格同步增删；表格第一列保存记录ID
+        self.config_index = ConfigIndex()
+        # 按生产情况估算员工基础产出，生产记录不变时复用上次结果
+        self.baseline_estimator = BaselineEstimator()
+        # 未保存的修改定期写入崩溃恢复快照
+        self.autosaver = Autosaver('management_page', self._autosave_data, self)
+        self.autosaver.failed.connect(self._on_autosave_failed)
         self.init_ui()
 
     def init_ui(self):
@@ -44,6 +85,12 @@ class ManagementPage(QWidget):
                 stretch_factor = 1 if title == "员工增添" else 1
                 row1_layout.setStretch(i, stretch_factor)
 
+        # 生产情况右侧显示按 P/N、设备、姓名等分组的统计
+        self.production_summary = ProductionSummaryPanel(self.production_model)
+        row2_layout.addWidget(self.production_summary)
+        row2_layout.setStretch(0, 2)
+        row2_layout.setStretch(1, 1)
+
         main_layout.addLayout(row1_layout)
         main_layout.addLayout(row2_layout)
 
@@ -103,25 +150,113 @@ class ManagementPage(QWidget):
         if file_path:
             self.file_path_label.setText(file_path)
             self.file_path_label.setToolTip(file_path)
+            # Excel路径不在操作日志中，下次保存写入完整快照
+            self._needs_full_save = True
+            self.autosaver.mark_dirty()
 
     def import_excel_data(self):
-        """导入Excel数据"""
+        """在后台线程中导入Excel员工数据"""
         file_path = self.file_path_label.text()
-        if file_path == "未选择文件":
+        if not file_path or file_path == "未选择文件":
             QMessageBox.warning(self, "警告", "请先选择Excel文件")
             return
+        if self._import_thread is not None:
+            QMessageBox.warning(self, "警告", "正在导入数据，请稍候")
+            return
 
-        try:
-            # TODO: 实现Excel数据导入逻辑
-            # 这里可以调用你的Excel导入函数
-            msg_box = QMessageBox()
-            msg_box.setIcon(QMessageBox.Icon.Information)
-            msg_box.setWindowTitle("提示")
-            msg_box.setText("Excel数据导入成功！")
-            msg_box.addButton(QMessageBox.StandardButton.Ok)
-            msg_box.exec()
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导入失败: {str(e)}")
+        self._import_staged = []
+        self._import_progress = QProgressDialog("正在导入员工数据...", "取消", 0, 0, self)
+        self._import_progress.setWindowTitle("导入Excel")
+        self._import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress.setMinimumDuration(0)
+        self._import_progress.setAutoClose(False)
+        self._import_progress.setAutoReset(False)
+        self._import_progress.canceled.connect(self._cancel_excel_import)
+
+        self._import_thread = QThread(self)
+        self._import_worker = ExcelImportWorker(file_path)
+        self._import_worker.moveToThread(self._import_thread)
+        self._import_thread.started.connect(self._import_worker.run)
+        self._import_worker.batch_ready.connect(self._stage_employee_batch)
+        self._import_worker.progress.connect(self._update_import_progress)
+        self._import_worker.finished.connect(self._on_excel_import_finished)
+        self._import_worker.failed.connect(self._on_excel_import_failed)
+        self._import_thread.start()
+        self._import_progress.show()
+
+    def _cancel_excel_import(self):
+        if self._import_worker is not None:
+            self._import_worker.cancel()
+
+    def _stage_employee_batch(self, batch: List[Dict]):
+        self._import_staged.extend(batch)
+        if self._import_worker is not None:
+            self._import_worker.batch_consumed()
+
+    def _replace_employees(self, employees: List[Dict]):
+        """用导入的花名册替换员工表，整张表只触发一次重绘"""
+        table = self.employee_table
+        self.config_index.employees.clear()
+        record_ids = self.config_index.employees.extend(employees)
+        table.setUpdatesEnabled(False)
+        with QSignalBlocker(table):  # 程序填充表格时不触发 itemChanged
+            table.setRowCount(0)
+            table.setRowCount(len(employees))
+            for row, emp in enumerate(employees):
+                for col, field in enumerate(EMPLOYEE_FIELDS):
+                    table.setItem(row, col, QTableWidgetItem(str(emp.get(field, ''))))
+                table.item(row, 0).setData(Qt.ItemDataRole.UserRole, record_ids[row])
+        table.setUpdatesEnabled(True)
+        # 下次保存需要写入完整快照
+        self._needs_full_save = True
+        self.autosaver.mark_dirty()
+
+    def _update_import_progress(self, done: int, total: int):
+        if self._import_progress is None:
+            return
+        if total > 0:
+            self._import_progress.setMaximum(total)
+            self._import_progress.setValue(min(done, total))
+        self._import_progress.setLabelText(f"正在导入员工数据... 已读取 {done} 行")
+
+    def _finish_excel_import(self):
+        self._import_thread.quit()
+        self._import_thread.wait()
+        self._import_worker.deleteLater()
+        self._import_thread.deleteLater()
+        self._import_thread = None
+        self._import_worker = None
+        self._import_progress.close()
+        self._import_progress.deleteLater()
+        self._import_progress = None
+        self._import_staged = []
+
+    @staticmethod
+    def _format_excel_rows(rows: List[int], limit: int = 10) -> str:
+        shown = "、".join(str(row) for row in rows[:limit])
+        return f"第 {shown} 等 {len(rows)} 行" if len(rows) > limit else f"第 {shown} 行"
+
+    def _on_excel_import_finished(self, imported: int, skipped_rows: List[int], no_output_rows: List[int]):
+        cancelled = self._import_worker.is_cancelled()
+        staged = self._import_staged
+        self._finish_excel_import()
+        if cancelled:
+            self.show_custom_message("提示", "导入已取消，员工表保持不变", QMessageBox.Icon.Information)
+            return
+        self._replace_employees(staged)
+        text = f"Excel数据导入成功！共导入 {imported} 条员工数据"
+        if skipped_rows:
+            text += (f"\n跳过 {len(skipped_rows)} 行缺少工号、姓名、设备编号、P/N或工位的数据："
+                     f"{self._format_excel_rows(skipped_rows)}")
+        if no_output_rows:
+            text += (f"\n{len(no_output_rows)} 行的基础产出为空或不是数字，已导入但基础产出留空："
+                     f"{self._format_excel_rows(no_output_rows)}，可以点击“估算产出”按生产记录补全")
+        icon = QMessageBox.Icon.Warning if skipped_rows or no_output_rows else QMessageBox.Icon.Information
+        self.show_custom_message("提示", text, icon)
+
+    def _on_excel_import_failed(self, message: str):
+        self._finish_excel_import()
+        QMessageBox.critical(self, "错误", message)
 
     def show_custom_message(self, title, text, icon):
         """显示统一风格的自定义消息框"""
@@ -205,15 +340,27 @@ class ManagementPage(QWidget):
 
         # 根据标题设置表头
         headers = self.get_table_headers(title)
-        table = self.create_table(headers)
+        if title == "生产情况":
+            # 生产记录可能有几十万行，使用模型/视图而不是逐格创建QTableWidgetItem
+            self.production_model = ProductionTableModel(self)
+            self.production_proxy = ProductionFilterProxy(self.production_model, self)
+            table = self.create_production_view(self.production_proxy)
+            filter_bar = ProductionFilterBar(self.production_proxy)
+        else:
+            table = self.create_table(headers)
+            filter_bar = TableFilterBar(table)
+        self.filter_bars[title] = filter_bar
 
         # Store table reference based on type
         if title == "员工增添":
             self.employee_table = table
+            table.itemChanged.connect(lambda item: self._on_table_item_changed('employees', item))
         elif title == "拉线增添":
             self.line_table = table
+            table.itemChanged.connect(lambda item: self._on_table_item_changed('lines', item))
         elif title == "特殊工位":
             self.special_station_table = table
+            table.itemChanged.connect(lambda item: self._on_table_item_changed('special_stations', item))
         elif title == "生产情况":
             self.production_table = table
 
@@ -246,15 +393,25 @@ class ManagementPage(QWidget):
 
         button_layout.addWidget(add_button)
         button_layout.addWidget(delete_button)
+        if title == "员工增添":
+            estimate_button = QPushButton("估算产出")
+            estimate_button.setFixedSize(80, 30)
+            estimate_button.setToolTip("按生产情况记录重新估算员工的基础产出")
+            estimate_button.clicked.connect(self.estimate_employee_outputs)
+            button_layout.addWidget(estimate_button)
 
         # 设置布局
         if title == "生产情况":
+            table_layout = QVBoxLayout()
+            table_layout.addWidget(filter_bar)
+            table_layout.addWidget(table)
             input_layout = QHBoxLayout()
-            input_layout.addWidget(table)
+            input_layout.addLayout(table_layout)
             input_layout.addLayout(button_layout)
             input_layout.setSpacing(20)  # 增加表格和按钮之间的间距
         else:
             input_layout = QVBoxLayout()
+            input_layout.addWidget(filter_bar)
             input_layout.addWidget(table)
             input_layout.addLayout(button_layout)
 
@@ -325,6 +482,45 @@ class ManagementPage(QWidget):
 
         return table
 
+    @staticmethod
+    def create_production_view(model):
+        """创建生产情况表格视图"""
+        view = QTableView()
+        view.setModel(model)
+
+        # 大数据量下不能按内容调整尺寸，由视图自身滚动
+        view.setSizeAdjustPolicy(QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        view.horizontalHeader().setDefaultSectionSize(120)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # 固定行高，避免视图逐行计算行高
+        view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        view.verticalHeader().setDefaultSectionSize(24)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        view.setMinimumHeight(200)
+        # 点击表头排序，排序在代理模型的后台线程中进行；初始不排序
+        view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        view.setSortingEnabled(True)
+
+        view.setStyleSheet("""
+            QTableView {
+                font-size: 12px;
+                gridline-color: #e0e0e0;
+            }
+            QHeaderView::section {
+                background-color: #e8f0fe;
+                padding: 5px;
+                font-size: 12px;
+                text-align: center;
+            }
+            QTableCornerButton::section,QHeaderView::section{
+                background-color:#e8f0fe;
+                padding:5px;
+            }
+        """)
+
+        return view
+
     @staticmethod
     def adjust_table_columns(table):
         """均匀分配列宽并考虑内容长度"""
@@ -379,6 +575,8 @@ class ManagementPage(QWidget):
         pn_input = QLineEdit()
         station_input = QLineEdit()
         production_input = QLineEdit()
+        production_input.setValidator(QIntValidator(0, 1000000))
+        production_input.setPlaceholderText("留空则按生产记录估算")
 
         # Add to layout
         layout.addRow("工号:", id_input)
@@ -391,35 +589,85 @@ class ManagementPage(QWidget):
         confirm_button = QPushButton("确定")
         confirm_button.clicked.connect(lambda: self.add_employee(
             id_input.text(), name_input.text(), device_input.text(),
-            pn_input.text(), station_input.text(), dialog
+            pn_input.text(), station_input.text(), production_input.text(), dialog
         ))
         layout.addWidget(confirm_button)
 
         dialog.exec()
 
-    def add_employee(self, emp_id, name, device, pn, station, dialog):
+    def add_employee(self, emp_id, name, device, pn, station, base_output, dialog):
         if not all([emp_id, name, device, pn, station]):
             QMessageBox.warning(dialog, "输入错误", "请填写所有字段")
             return
 
-        row = self.employee_table.rowCount()
-        self.employee_table.insertRow(row)
-        self.employee_table.setItem(row, 0, QTableWidgetItem(emp_id))
-        self.employee_table.setItem(row, 1, QTableWidgetItem(name))
-        self.employee_table.setItem(row, 2, QTableWidgetItem(device))
-        self.employee_table.setItem(row, 3, QTableWidgetItem(pn))
-        self.employee_table.setItem(row, 4, QTableWidgetItem(station))
+        if not base_output:
+            # 按生产记录估算 姓名×P/N 的基础产出，没有任何相关记录时为0
+            self._with_baseline_table(lambda table: self.add_employee(
+                emp_id, name, device, pn, station, str(table.base_output(name, pn)), dialog))
+            return
+        base_output = int(base_output)
+        record = {
+            '工号': emp_id,
+            '姓名': name,
+            '设备编号': device,
+            'P/N': pn,
+            '工位': station,
+            '基础产出': base_output
+        }
+        with QSignalBlocker(self.employee_table):
+            row = self.employee_table.rowCount()
+            self.employee_table.insertRow(row)
+            self.employee_table.setItem(row, 0, QTableWidgetItem(emp_id))
+            self.employee_table.setItem(row, 1, QTableWidgetItem(name))
+            self.employee_table.setItem(row, 2, QTableWidgetItem(device))
+            self.employee_table.setItem(row, 3, QTableWidgetItem(pn))
+            self.employee_table.setItem(row, 4, QTableWidgetItem(station))
+            self.employee_table.setItem(row, 5, QTableWidgetItem(str(base_output)))
+            self._set_record_id(self.employee_table, row, self.config_index.employees.add(record))
+        self._pending_ops.append(add_op('employees', record))
+        self.autosaver.mark_dirty()
         dialog.close()
 
     def delete_employee(self):
-        selected = self.employee_table.selectedItems()
-        if not selected:
-            self.show_custom_message("提示", "请先选择要删除的行", QMessageBox.Icon.Warning)
+        self._delete_selected_rows(self.employee_table, 'employees')
+
+    def _with_baseline_table(self, on_ready: Callable[[BaselineTable], None]):
+        """生产记录未变化时直接使用上次的估算结果，否则在后台线程按生产记录的副本重新估算"""
+        columns = self.production_model.columns()
+        table = self.baseline_estimator.cached(columns)
+        if table is not None:
+            on_ready(table)
             return
-
-        rows = {item.row() for item in selected}
-        for row in sorted(rows, reverse=True):
-            self.employee_table.removeRow(row)
+        snapshot = columns.copy()
+
+        def estimated(table: BaselineTable):
+            self.baseline_estimator.store(columns, snapshot.version, table)
+            on_ready(table)
+
+        self._file_task = start_file_task(self, "正在按生产记录估算基础产出...",
+                                          lambda progress, should_stop: estimate(snapshot), estimated)
+
+    def estimate_employee_outputs(self):
+        """用生产记录重新估算所有员工的基础产出；没有相关记录的员工保持原值"""
+        self._with_baseline_table(self._apply_baseline_table)
+
+    def _apply_baseline_table(self, table: BaselineTable):
+        employees = self.config_index.employees
+        updated = 0
+        with QSignalBlocker(self.employee_table):
+            for row in range(self.employee_table.rowCount()):
+                record_id = self.employee_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+                record = employees.get(record_id)
+                base_output = table.base_output(record['姓名'], record['P/N'], default=-1)
+                if base_output < 0 or base_output == record.get('基础产出'):
+                    continue
+                employees.update(record_id, {**record, '基础产出': base_output})
+                self.employee_table.setItem(row, 5, QTableWidgetItem(str(base_output)))
+                updated += 1
+        if updated:
+            self._needs_full_save = True
+            self.autosaver.mark_dirty()
+        self.show_custom_message("提示", f"已按生产记录更新 {updated} 名员工的基础产出", QMessageBox.Icon.Information)
 
 
     def open_add_line_dialog(self):
@@ -449,22 +697,24 @@ class ManagementPage(QWidget):
             QMessageBox.warning(dialog, "输入错误", "请填写所有字段")
             return
 
-        row = self.line_table.rowCount()
-        self.line_table.insertRow(row)
-        self.line_table.setItem(row, 0, QTableWidgetItem(pn))
-        self.line_table.setItem(row, 1, QTableWidgetItem(device))
-        self.line_table.setItem(row, 2, QTableWidgetItem(station))
+        record = {
+            '设备编号': device,
+            'P/N': pn,
+            '所需工位': station.split(',')
+        }
+        with QSignalBlocker(self.line_table):
+            row = self.line_table.rowCount()
+            self.line_table.insertRow(row)
+            self.line_table.setItem(row, 0, QTableWidgetItem(pn))
+            self.line_table.setItem(row, 1, QTableWidgetItem(device))
+            self.line_table.setItem(row, 2, QTableWidgetItem(station))
+            self._set_record_id(self.line_table, row, self.config_index.lines.add(record))
+        self._pending_ops.append(add_op('lines', record))
+        self.autosaver.mark_dirty()
         dialog.close()
 
     def delete_line(self):
-        selected = self.line_table.selectedItems()
-        if not selected:
-            self.show_custom_message("提示", "请先选择要删除的行", QMessageBox.Icon.Warning)
-            return
-
-        rows = {item.row() for item in selected}
-        for row in sorted(rows, reverse=True):
-            self.line_table.removeRow(row)
+        self._delete_selected_rows(self.line_table, 'lines')
 
     def open_add_special_station_dialog(self):
         dialog = QDialog(self)
@@ -488,20 +738,18 @@ class ManagementPage(QWidget):
             QMessageBox.warning(dialog, "输入错误", "请输入特殊工位类型")
             return
 
-        row = self.special_station_table.rowCount()
-        self.special_station_table.insertRow(row)
-        self.special_station_table.setItem(row, 0, QTableWidgetItem(station_type))
+        record = {'特殊工位类型': station_type}
+        with QSignalBlocker(self.special_station_table):
+            row = self.special_station_table.rowCount()
+            self.special_station_table.insertRow(row)
+            self.special_station_table.setItem(row, 0, QTableWidgetItem(station_type))
+            self._set_record_id(self.special_station_table, row, self.config_index.special_stations.add(record))
+        self._pending_ops.append(add_op('special_stations', record))
+        self.autosaver.mark_dirty()
         dialog.close()
 
     def delete_special_station(self):
-        selected = self.special_station_table.selectedItems()
-        if not selected:
-            self.show_custom_message("提示", "请先选择要删除的行", QMessageBox.Icon.Warning)
-            return
-
-        rows = {item.row() for item in selected}
-        for row in sorted(rows, reverse=True):
-            self.special_station_table.removeRow(row)
+        self._delete_selected_rows(self.special_station_table, 'special_stations')
 
     def open_add_production_dialog(self):
         dialog = QDialog(self)
@@ -571,27 +819,103 @@ class ManagementPage(QWidget):
             QMessageBox.warning(dialog, "输入错误", "产出和工时必须是数字")
             return
 
-        row = self.production_table.rowCount()
-        self.production_table.insertRow(row)
-        self.production_table.setItem(row, 0, QTableWidgetItem(batch))
-        self.production_table.setItem(row, 1, QTableWidgetItem(date))
-        self.production_table.setItem(row, 2, QTableWidgetItem(shift))
-        self.production_table.setItem(row, 3, QTableWidgetItem(pn))
-        self.production_table.setItem(row, 4, QTableWidgetItem(device))
-        self.production_table.setItem(row, 5, QTableWidgetItem(name))
-        self.production_table.setItem(row, 6, QTableWidgetItem(output))
-        self.production_table.setItem(row, 7, QTableWidgetItem(hours))
+        record = {
+            '排班批次': batch,
+            '日期': date,
+            '班次': shift,
+            'P/N': pn,
+            '设备': device,
+            '姓名': name,
+            '产出': float(output),
+            '工时': float(hours)
+        }
+        self.production_model.append_record(record)
+        self._pending_ops.append(add_op('productions', record))
+        self.autosaver.mark_dirty()
         dialog.close()
 
     def delete_production(self):
-        selected = self.production_table.selectedItems()
-        if not selected:
+        self._delete_selected_rows(self.production_table, 'productions')
+
+    def _delete_selected_rows(self, view: QAbstractItemView, section: str):
+        """删除视图中选中的行：合并为连续区间后每个区间只删除一次"""
+        ranges = self.selected_row_ranges(view)
+        if not ranges:
             self.show_custom_message("提示", "请先选择要删除的行", QMessageBox.Icon.Warning)
             return
 
-        rows = {item.row() for item in selected}
-        for row in sorted(rows, reverse=True):
-            self.production_table.removeRow(row)
+        if section == 'productions':
+            # 选中的是筛选/排序后的行，换算为源数据行号
+            rows = sorted(self.production_proxy.source_rows(
+                row for start, count in ranges for row in range(start, start + count)))
+            ranges = self.rows_to_ranges(rows)
+            self.remove_row_ranges(view, ranges)
+            self._pending_ops.append(delete_op(section, rows))
+            self.autosaver.mark_dirty()
+            return
+
+        # 筛选时跨过的隐藏行不删除
+        table_rows = [row for start, count in ranges for row in range(start, start + count)
+                      if not view.isRowHidden(row)]
+        if not table_rows:
+            return
+        records = self.config_index.section(section)
+        record_ids = self._record_ids(view, table_rows)
+        # 表格可能按某列排过序，操作日志记录的是配置列表中的位置
+        positions = records.positions(record_ids)
+        records.remove(record_ids)
+        self.remove_row_ranges(view, self.rows_to_ranges(table_rows))
+        self._pending_ops.append(delete_op(section, positions))
+        self.autosaver.mark_dirty()
+
+    @staticmethod
+    def selected_row_ranges(view: QAbstractItemView) -> List[Tuple[int, int]]:
+        """把选中的行合并为 (起始行, 行数) 区间，按起始行从大到小排列"""
+        spans = sorted((selection.top(), selection.bottom()) for selection in view.selectionModel().selection())
+        merged = []
+        for top, bottom in spans:
+            if merged and top <= merged[-1][1] + 1:
+                if bottom > merged[-1][1]:
+                    merged[-1][1] = bottom
+            else:
+                merged.append([top, bottom])
+        return [(top, bottom - top + 1) for top, bottom in reversed(merged)]
+
+    @staticmethod
+    def rows_to_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+        """把升序行号合并为 (起始行, 行数) 区间，按起始行从大到小排列"""
+        ranges = []
+        for row in rows:
+            if ranges and row == ranges[-1][0] + ranges[-1][1]:
+                ranges[-1][1] += 1
+            else:
+                ranges.append([row, 1])
+        return [(start, count) for start, count in reversed(ranges)]
+
+    @staticmethod
+    def remove_row_ranges(view: QAbstractItemView, ranges: List[Tuple[int, int]]):
+        """按区间删除行（行号为源模型中的行号），期间暂停重绘和视图信号"""
+        model = view.model()
+        proxied = isinstance(model, ProductionFilterProxy)
+        if proxied:
+            # 代理模型自行跟随源模型的删除，不需要暂停排序
+            model = model.sourceModel()
+        sorting = isinstance(view, QTableView) and view.isSortingEnabled() and not proxied
+        if sorting:
+            view.setSortingEnabled(False)
+        view.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(view):
+                if hasattr(model, 'remove_row_ranges'):
+                    model.remove_row_ranges(ranges)
+                else:
+                    # 从后往前删除，前面区间的行号不受影响
+                    for start, count in sorted(ranges, reverse=True):
+                        model.removeRows(start, count)
+        finally:
+            view.setUpdatesEnabled(True)
+            if sorting:
+                view.setSortingEnabled(True)
 
     @staticmethod
     def get_dialog_stylesheet():
@@ -638,143 +962,249 @@ class ManagementPage(QWidget):
                     }
         """
 
-    def save_config(self):
-        """保存当前配置到YAML文件"""
-        # 从表格收集数据
-        config = {
+    def get_config(self) -> Dict:
+        """从表格收集完整配置"""
+        return {
             'employees_excel_path': self.file_path_label.text() if self.file_path_label.text() != "未选择文件" else "",
             'employees': self.get_employee_data(),
             'lines': self.get_line_data(),
             'special_stations': self.get_special_station_data(),
-            'productions': self.get_production_data()
+            # 保存时逐条写出，不转换为字典列表
+            'productions': self.production_model.columns()
+        }
+
+    def get_scheduling_config(self) -> Dict:
+        """排班求解需要的配置（不含生产情况历史）"""
+        return {
+            'employees': self.get_employee_data(),
+            'lines': self.get_line_data(),
+            'special_stations': self.get_special_station_data()
         }
 
+    def _autosave_data(self) -> Tuple[Dict, str]:
+        """自动保存的快照：生产情况复制一份，后台写入时表格仍可修改"""
+        config = self.get_config()
+        config['productions'] = config['productions'].copy()
+        return config, self.config_path
+
+    def _on_autosave_failed(self, message: str):
+        QMessageBox.warning(self, "自动保存失败", f"未保存的修改无法写入自动保存文件，请尽快手动保存。\n{message}")
+
+    def restore_snapshot(self, snapshot: Snapshot):
+        """恢复自动保存的快照；快照与配置文件不一致，下次保存写入完整快照"""
+        self._fill_from_config(snapshot.data)
+        if snapshot.source_path:
+            self._set_config_path(snapshot.source_path)
+        self._needs_full_save = True
+
+    def _set_config_path(self, file_path: str):
+        """记录当前配置文件，之后的修改以日志形式追加到该文件"""
+        self.config_path = os.path.abspath(file_path)
+        self.journal = ConfigJournal(self.config_path)
+        self._pending_ops = []
+        self._needs_full_save = False
+
+    def save_config(self):
+        """保存当前配置到YAML文件；写出YAML在后台线程进行"""
         # 选择保存路径
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "保存配置文件", "", "YAML文件 (*.yml *.yaml)"
+            self, "保存配置文件", self.config_path or "", "YAML文件 (*.yml *.yaml)"
         )
 
         if file_path:
             if not file_path.endswith(('.yml', '.yaml')):
                 file_path += '.yml'
 
-            if YamlManager.save_to_yaml(config, file_path, self):
+            journaled = (self.journal is not None and not self._needs_full_save
+                         and os.path.abspath(file_path) == self.config_path and os.path.exists(file_path))
+            if journaled:
+                # 保存到当前文件：只追加本次的增删操作
+                if not YamlManager.append_to_journal(self.journal, self._pending_ops, self):
+                    return
+                self._pending_ops = []
+                self.autosaver.discard()
+                if not YamlManager.journal_needs_compaction(self.journal):
+                    self.show_custom_message("提示", "数据配置保存成功!", QMessageBox.Icon.Information)
+                    return
+
+            config = self.get_config()
+
+            def save(progress, should_stop):
+                config_data.save_config(config, file_path, progress, should_stop)
+
+            def saved(_):
+                self._set_config_path(file_path)
+                self.autosaver.discard()
                 self.show_custom_message("提示", "数据配置保存成功!", QMessageBox.Icon.Information)
 
+            def cancelled():
+                if journaled:
+                    # 修改已经写入日志，只是没有压缩为新快照
+                    self.show_custom_message("提示", "数据配置保存成功!", QMessageBox.Icon.Information)
+
+            self._file_task = start_file_task(self, "正在保存配置...", save, saved, cancelled)
+
     def load_config(self):
-        """从YAML文件加载配置"""
+        """从YAML文件加载配置；解析在后台线程进行，完成后一次性替换表格和模型"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "加载配置文件", "", "YAML文件 (*.yml *.yaml)"
         )
 
         if file_path:
-            config = YamlManager.load_from_yaml(file_path, self)
-            if config:
-                # 加载Excel路径
-                excel_path = config.get('employees_excel_path', "")
-                if excel_path:
-                    self.file_path_label.setText(excel_path)
-                    self.file_path_label.setToolTip(excel_path)
-                else:
-                    self.file_path_label.setText("未选择文件")
+            def load(progress, should_stop):
+                return config_data.load_config(file_path, progress, should_stop)
+
+            self._file_task = start_file_task(self, "正在加载配置...", load,
+                                              lambda loaded: self._apply_loaded_config(file_path, *loaded))
+
+    def _apply_loaded_config(self, file_path: str, config: Dict, warnings: List[str]):
+        for message in warnings:
+            QMessageBox.warning(self, "加载提示", message)
+        self._fill_from_config(config)
+        self._set_config_path(file_path)
+        if warnings:
+            # 日志中有无法应用的操作，之后的修改不能再追加到日志末尾
+            self._needs_full_save = True
+        self.autosaver.discard()
+        self.show_custom_message("加载成功", "配置已从YAML文件成功加载", QMessageBox.Icon.Information)
+
+    def _fill_from_config(self, config: Dict):
+        # 加载Excel路径
+        excel_path = config.get('employees_excel_path', "")
+        if excel_path:
+            self.file_path_label.setText(excel_path)
+            self.file_path_label.setToolTip(excel_path)
+        else:
+            self.file_path_label.setText("未选择文件")
 
-                # 加载其他数据
-                self.set_employee_data(config.get('employees', []))
-                self.set_line_data(config.get('lines', []))
-                self.set_special_station_data(config.get('special_stations', []))
-                self.set_production_data(config.get('productions', []))
-                self.show_custom_message("加载成功", "配置已从YAML文件成功加载", QMessageBox.Icon.Information)
+        # 加载其他数据
+        self.set_employee_data(config.get('employees', []))
+        self.set_line_data(config.get('lines', []))
+        self.set_special_station_data(config.get('special_stations', []))
+        self.set_production_data(config.get('productions', []))
 
     def get_employee_data(self) -> List[Dict]:
-        """从员工表格获取数据"""
-        data = []
-        for row in range(self.employee_table.rowCount()):
-            data.append({
-                '工号': self.employee_table.item(row, 0).text(),
-                '姓名': self.employee_table.item(row, 1).text(),
-                '设备编号': self.employee_table.item(row, 2).text(),
-                'P/N': self.employee_table.item(row, 3).text(),
-                '工位': self.employee_table.item(row, 4).text()
-            })
-        return data
+        """获取员工数据（索引与表格同步，按添加顺序，不随表格排序变化）"""
+        return self.config_index.employees.values()
 
     def get_line_data(self) -> List[Dict]:
-        """从拉线表格获取数据"""
-        data = []
-        for row in range(self.line_table.rowCount()):
-            data.append({
-                '设备编号': self.line_table.item(row, 1).text(),
-                'P/N': self.line_table.item(row, 0).text(),
-                '所需工位': self.line_table.item(row, 2).text().split(',')
-            })
-        return data
+        """获取拉线数据"""
+        return self.config_index.lines.values()
 
     def get_special_station_data(self) -> List[Dict]:
-        """从特殊工位表格获取数据"""
-        data = []
-        for row in range(self.special_station_table.rowCount()):
-            data.append({
-                '特殊工位类型': self.special_station_table.item(row, 0).text()
-            })
-        return data
+        """获取特殊工位数据"""
+        return self.config_index.special_stations.values()
+
+    def _read_table_row(self, section: str, row: int) -> Dict:
+        """从表格行读取记录（单元格被直接编辑后调用）"""
+        if section == 'employees':
+            table = self.employee_table
+            return {
+                '工号': table.item(row, 0).text(),
+                '姓名': table.item(row, 1).text(),
+                '设备编号': table.item(row, 2).text(),
+                'P/N': table.item(row, 3).text(),
+                '工位': table.item(row, 4).text(),
+                **self._read_base_output(row)
+            }
+        if section == 'lines':
+            table = self.line_table
+            return {
+                '设备编号': table.item(row, 1).text(),
+                'P/N': table.item(row, 0).text(),
+                '所需工位': table.item(row, 2).text().split(',')
+            }
+        return {'特殊工位类型': self.special_station_table.item(row, 0).text()}
+
+    def _read_base_output(self, row: int) -> Dict:
+        """员工表基础产出列；不是整数时保留记录中的原值"""
+        item = self.employee_table.item(row, 5)
+        try:
+            return {'基础产出': int(item.text())}
+        except (AttributeError, ValueError):
+            return {}
+
+    def _on_table_item_changed(self, section: str, item: QTableWidgetItem):
+        """单元格被编辑时更新索引中的记录；编辑不写入操作日志，下次保存写完整快照"""
+        table = item.tableWidget()
+        row = item.row()
+        first = table.item(row, 0)
+        record_id = first.data(Qt.ItemDataRole.UserRole) if first is not None else None
+        records = self.config_index.section(section)
+        if record_id is None or record_id not in records:
+            return
+        try:
+            record = self._read_table_row(section, row)
+        except AttributeError:
+            # 行中还有未填写的单元格
+            return
+        # 保留表格中没有显示的字段
+        records.update(record_id, {**records.get(record_id), **record})
+        self._needs_full_save = True
+        self.autosaver.mark_dirty()
+
+    @staticmethod
+    def _set_record_id(table: QTableWidget, row: int, record_id: int):
+        table.item(row, 0).setData(Qt.ItemDataRole.UserRole, record_id)
+
+    @staticmethod
+    def _record_ids(table: QTableWidget, rows: Iterable[int]) -> List[int]:
+        return [table.item(row, 0).data(Qt.ItemDataRole.UserRole) for row in rows]
 
     def get_production_data(self) -> List[Dict]:
         """从生产情况表格获取数据"""
-        data = []
-        for row in range(self.production_table.rowCount()):
-            data.append({
-                '排班批次': self.production_table.item(row, 0).text(),
-                '日期': self.production_table.item(row, 1).text(),
-                '班次': self.production_table.item(row, 2).text(),
-                'P/N': self.production_table.item(row, 3).text(),
-                '设备': self.production_table.item(row, 4).text(),
-                '姓名': self.production_table.item(row, 5).text(),
-                '产出': float(self.production_table.item(row, 6).text()),
-                '工时': float(self.production_table.item(row, 7).text())
-            })
-        return data
+        return self.production_model.columns().to_records()
+
+    def get_employee_productions(self, name: str) -> List[Dict]:
+        """某员工的全部生产记录"""
+        columns = self.production_model.columns()
+        return [columns.record(row) for row in columns.rows_for('姓名', name)]
 
     def set_employee_data(self, employees: List[Dict]):
         """设置员工表格数据"""
         self.employee_table.setRowCount(0)
-        for emp in employees:
-            row = self.employee_table.rowCount()
-            self.employee_table.insertRow(row)
-            self.employee_table.setItem(row, 0, QTableWidgetItem(emp['工号']))
-            self.employee_table.setItem(row, 1, QTableWidgetItem(emp['姓名']))
-            self.employee_table.setItem(row, 2, QTableWidgetItem(emp['设备编号']))
-            self.employee_table.setItem(row, 3, QTableWidgetItem(emp['P/N']))
-            self.employee_table.setItem(row, 4, QTableWidgetItem(emp['工位']))
+        self.config_index.employees.clear()
+        record_ids = self.config_index.employees.extend(employees)
+        with QSignalBlocker(self.employee_table):
+            for emp, record_id in zip(employees, record_ids):
+                row = self.employee_table.rowCount()
+                self.employee_table.insertRow(row)
+                self.employee_table.setItem(row, 0, QTableWidgetItem(emp['工号']))
+                self.employee_table.setItem(row, 1, QTableWidgetItem(emp['姓名']))
+                self.employee_table.setItem(row, 2, QTableWidgetItem(emp['设备编号']))
+                self.employee_table.setItem(row, 3, QTableWidgetItem(emp['P/N']))
+                self.employee_table.setItem(row, 4, QTableWidgetItem(emp['工位']))
+                self.employee_table.setItem(row, 5, QTableWidgetItem(str(emp.get('基础产出', ''))))
+                self._set_record_id(self.employee_table, row, record_id)
 
     def set_line_data(self, lines: List[Dict]):
         """设置拉线表格数据"""
         self.line_table.setRowCount(0)
-        for line in lines:
-            row = self.line_table.rowCount()
-            self.line_table.insertRow(row)
-            self.line_table.setItem(row, 0, QTableWidgetItem(line['P/N']))
-            self.line_table.setItem(row, 1, QTableWidgetItem(line['设备编号']))
-            self.line_table.setItem(row, 2, QTableWidgetItem(','.join(line['所需工位'])))
+        self.config_index.lines.clear()
+        record_ids = self.config_index.lines.extend(lines)
+        with QSignalBlocker(self.line_table):
+            for line, record_id in zip(lines, record_ids):
+                row = self.line_table.rowCount()
+                self.line_table.insertRow(row)
+                self.line_table.setItem(row, 0, QTableWidgetItem(line['P/N']))
+                self.line_table.setItem(row, 1, QTableWidgetItem(line['设备编号']))
+                self.line_table.setItem(row, 2, QTableWidgetItem(','.join(line['所需工位'])))
+                self._set_record_id(self.line_table, row, record_id)
 
     def set_special_station_data(self, stations: List[Dict]):
         """设置特殊工位表格数据"""
         self.special_station_table.setRowCount(0)
-        for station in stations:
-            row = self.special_station_table.rowCount()
-            self.special_station_table.insertRow(row)
-            self.special_station_table.setItem(row, 0, QTableWidgetItem(station['特殊工位类型']))
-
-    def set_production_data(self, productions: List[Dict]):
-        """设置生产情况表格数据"""
-        self.production_table.setRowCount(0)
-        for prod in productions:
-            row = self.production_table.rowCount()
-            self.production_table.insertRow(row)
-            self.production_table.setItem(row, 0, QTableWidgetItem(prod['排班批次']))
-            self.production_table.setItem(row, 1, QTableWidgetItem(prod['日期']))
-            self.production_table.setItem(row, 2, QTableWidgetItem(prod['班次']))
-            self.production_table.setItem(row, 3, QTableWidgetItem(prod['P/N']))
-            self.production_table.setItem(row, 4, QTableWidgetItem(prod['设备']))
-            self.production_table.setItem(row, 5, QTableWidgetItem(prod['姓名']))
-            self.production_table.setItem(row, 6, QTableWidgetItem(str(prod['产出'])))
-            self.production_table.setItem(row, 7, QTableWidgetItem(str(prod['工时'])))
\ No newline at end of file
+        self.config_index.special_stations.clear()
+        record_ids = self.config_index.special_stations.extend(stations)
+        with QSignalBlocker(self.special_station_table):
+            for station, record_id in zip(stations, record_ids):
+                row = self.special_station_table.rowCount()
+                self.special_station_table.insertRow(row)
+                self.special_station_table.setItem(row, 0, QTableWidgetItem(station['特殊工位类型']))
+                self._set_record_id(self.special_station_table, row, record_id)
+
+    def set_production_data(self, productions: Union[List[Dict], ProductionColumns]):
+        """设置生产情况表格数据（按列批量写入，只重置一次模型）"""
+        if not isinstance(productions, ProductionColumns):
+            productions = ProductionColumns.from_records(productions)
+        self.production_model.set_columns(productions)
@@ -1,14 +1,42 @@
+import os
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QLineEdit,
-    QPushButton, QFileDialog, QScrollArea, QTextEdit,
-    QSizePolicy
+    QPushButton, QFileDialog, QScrollArea, QPlainTextEdit,
+    QSizePolicy, QMessageBox
 )
+from TrainingRunner import STOP_FILE_ENV, TrainingRunner
+from LogSink import LogSink
+
+# (标签, 默认值, 命令行参数, 类型)
+TRAINING_PARAMS = [
+    (" Epochs ", "10", "--epochs", int), (" Batch Size ", "1", "--batch-size", int),
+    (" Learning Rate ", "0", "--lr", float), (" demand ", "10", "--demand", int),
+    (" product ", "10", "--product", int), (" workflow ", "6", "--workflow", int),
+    (" workers ", "2", "--workers", int), (" Equipment number ", "0", "--equipment-number", int)
+]
+# 路径标签对应的命令行参数，项目路径作为训练进程的工作目录
+PATH_ARGS = {" 数据集路径 ": "--data-path", " 模型文件保存路径 ": "--save-path"}
+
 
 class ModelTrainingPage(QWidget):
     def __init__(self):
         super().__init__()
         self.log_text = None  # 在 __init__ 中初始化实例属性
+        self.log_sink = None
+        self.path_edits = {}
+        self.param_edits = {}
+        self.start_button = None
+        self.stop_button = None
+        self.exit_button = None
+        # stderr 上一段输出是否以换行结束，下一段的第一行需要加前缀
+        self._stderr_line_start = True
+        self.runner = TrainingRunner(self)
+        self.runner.output.connect(self.append_log)
+        self.runner.started.connect(self._on_training_started)
+        self.runner.finished.connect(self._on_training_finished)
+        self.runner.failed.connect(self._on_training_failed)
         self.init_ui()
+        self._update_buttons()
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -34,6 +62,7 @@ class ModelTrainingPage(QWidget):
             h_layout = QHBoxLayout()
             label = QLabel(path)
             line_edit = QLineEdit()
+            self.path_edits[path] = line_edit
             button = QPushButton(" 选择路径 ")
             button.clicked.connect(lambda _, le=line_edit: self.select_file(le))
             h_layout.addWidget(label)
@@ -48,51 +77,110 @@ class ModelTrainingPage(QWidget):
         if file_path:
             line_edit.setText(file_path)
 
-    @staticmethod
-    def create_param_group():
+    def create_param_group(self):
         group_box = QGroupBox("参数设置")
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 20, 10, 10)
 
-        params = [
-            (" Epochs ", "10"), (" Batch Size ", "1"), (" Learning Rate ", "0"), (" demand ", "10"),
-            (" product ", "10"), (" workflow ", "6"), (" workers ", "2"), (" Equipment number ", "0")
-        ]
-
-        for i in range(0, len(params), 2):
+        for i in range(0, len(TRAINING_PARAMS), 2):
             row_layout = QHBoxLayout()
-            if i < len(params):
-                param1, default_value1 = params[i]
-                label1 = QLabel(param1)
-                line_edit1 = QLineEdit(default_value1)
-                row_layout.addWidget(label1)
-                row_layout.addWidget(line_edit1)
-            if i + 1 < len(params):
-                param2, default_value2 = params[i + 1]
-                label2 = QLabel(param2)
-                line_edit2 = QLineEdit(default_value2)
-                row_layout.addWidget(label2)
-                row_layout.addWidget(line_edit2)
+            for param, default_value, _, _ in TRAINING_PARAMS[i:i + 2]:
+                label = QLabel(param)
+                line_edit = QLineEdit(default_value)
+                self.param_edits[param] = line_edit
+                row_layout.addWidget(label)
+                row_layout.addWidget(line_edit)
             layout.addLayout(row_layout)
 
-        start_button = QPushButton("开始")
-        stop_button = QPushButton("停止")
-        exit_button = QPushButton("退出")
-        layout.addWidget(start_button)
-        layout.addWidget(stop_button)
-        layout.addWidget(exit_button)
+        self.start_button = QPushButton("开始")
+        self.stop_button = QPushButton("停止")
+        self.exit_button = QPushButton("退出")
+        self.start_button.clicked.connect(self.start_training)
+        self.stop_button.clicked.connect(self.runner.stop)  # 请求训练脚本退出
+        self.stop_button.setToolTip(
+            f"创建环境变量 {STOP_FILE_ENV} 指向的文件，请求训练脚本保存后退出（Linux/macOS同时发送SIGTERM）；\n"
+            f"Windows上训练脚本需要检查该文件才能停止，{TrainingRunner.STOP_GRACE_PERIOD_MS // 1000} 秒内未退出时强制结束")
+        self.exit_button.clicked.connect(self.runner.kill)  # 立即结束训练进程
+        layout.addWidget(self.start_button)
+        layout.addWidget(self.stop_button)
+        layout.addWidget(self.exit_button)
         group_box.setLayout(layout)
         return group_box
 
+    def get_training_args(self):
+        """把参数输入框转换为 train.py 的命令行参数，输入无效时抛出 ValueError"""
+        args = []
+        for param, _, arg, value_type in TRAINING_PARAMS:
+            text = self.param_edits[param].text().strip()
+            try:
+                value = value_type(text)
+            except ValueError:
+                raise ValueError(f"{param.strip()} 应该是{'整数' if value_type is int else '数字'}")
+            if value < 0:
+                raise ValueError(f"{param.strip()} 不能为负数")
+            args += [arg, str(value)]
+        for path, arg in PATH_ARGS.items():
+            text = self.path_edits[path].text().strip()
+            if text:
+                args += [arg, text]
+        return args
+
+    def start_training(self):
+        script_path = self.path_edits[" train.py路径 "].text().strip()
+        if not script_path or not os.path.isfile(script_path):
+            QMessageBox.warning(self, "输入错误", "请先选择有效的 train.py 路径")
+            return
+        try:
+            args = self.get_training_args()
+        except ValueError as e:
+            QMessageBox.warning(self, "输入错误", str(e))
+            return
+
+        project_path = self.path_edits[" 项目路径 "].text().strip()
+        if project_path and not os.path.isdir(project_path):
+            project_path = os.path.dirname(project_path)
+        self.log_sink.clear()
+        self._stderr_line_start = True
+        self.append_log(f"启动训练: {script_path} {' '.join(args)}\n", False)
+        self.runner.start(script_path, args, project_path)
+        self._update_buttons()
+
+    def append_log(self, text: str, is_error: bool):
+        if is_error:
+            # 输出框是纯文本，stderr 的每一行加前缀与普通输出区分
+            lines = text.splitlines(keepends=True)
+            text = "".join(line if i == 0 and not self._stderr_line_start else f"[stderr] {line}"
+                           for i, line in enumerate(lines))
+            self._stderr_line_start = text.endswith('\n')
+        self.log_sink.write(text)
+
+    def _update_buttons(self):
+        running = self.runner.is_running()
+        self.start_button.setEnabled(not running)
+        self.stop_button.setEnabled(running)
+        self.exit_button.setEnabled(running)
+
+    def _on_training_started(self):
+        self._update_buttons()
+
+    def _on_training_finished(self, exit_code: int, status: str):
+        self.append_log(f"\n{status}\n", False)
+        self._update_buttons()
+
+    def _on_training_failed(self, message: str):
+        self.append_log(f"{message}\n", True)
+        self._update_buttons()
+
     def create_log_group(self):
         group_box = QGroupBox("结果输出")
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 20, 10, 10)
 
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = QPlainTextEdit()
         self.log_text.setStyleSheet("background-color: #e8f0fe;")
         self.log_text.setPlaceholderText("结果将在此显示...")
+        # 训练日志批量刷新，输出框只保留最近的行，完整日志写入 logs/training.log
+        self.log_sink = LogSink(self.log_text, log_name='training')
 
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -0,0 +1,296 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+from PySide6.QtCore import (
+    Qt, QAbstractProxyModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal
+)
+from ProductionTableModel import ProductionTableModel
+from scheduling_core.production_filter import ProductionQuery, ProductionSearchIndex, filter_rows, sort_rows
+from scheduling_core.production_store import PRODUCTION_FIELDS
+
+
+class ProductionFilterSignals(QObject):
+    finished = Signal(int, object, float, bool)  # 任务编号, 行号数组, 耗时, 数据是否已变化
+    failed = Signal(int, str)
+
+
+class ProductionFilterTask(QRunnable):
+    """在后台线程计算筛选和排序后的行号；有更新的任务时提前放弃
+
+    在数据的副本上计算，界面线程同时追加或删除行不会影响计算；数据版本变化时结果作废。
+    """
+
+    def __init__(self, proxy: 'ProductionFilterProxy', generation: int):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.proxy = proxy
+        self.generation = generation
+        self.source = proxy.sourceModel().columns()
+        self.columns = self.source.copy()
+        self.version = self.source.version
+        self.query = proxy.query
+        self.sort_key = proxy.sort_key
+        self.signals = ProductionFilterSignals()
+
+    def _stale(self) -> bool:
+        return self.proxy.generation != self.generation
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            rows = None
+            if not self.query.is_empty():
+                rows = filter_rows(self.columns, self.query, self.proxy.search_index, should_stop=self._stale)
+            if self.sort_key is not None and not self._stale():
+                column, descending = self.sort_key
+                rows = sort_rows(self.columns, rows, PRODUCTION_FIELDS[column], descending)
+        except Exception as e:
+            # 任何异常都要通知界面线程，否则代理一直等待这个任务
+            self.signals.failed.emit(self.generation, str(e) or type(e).__name__)
+            return
+        # 计算期间数据已变化时结果作废；任务编号保持不变，界面线程据此移除任务
+        outdated = self.source.version != self.version
+        self.signals.finished.emit(self.generation, None if outdated else rows,
+                                   time.perf_counter() - start, outdated)
+
+
+class ProductionFilterProxy(QAbstractProxyModel):
+    """生产情况的筛选/排序代理模型
+
+    代理行到源行的映射保存为行号数组，在后台线程中计算；没有筛选和排序时直接对应源模型。
+    只筛选不排序时映射保持升序，源模型追加或删除行时就地更新映射，不必重新筛选。
+    """
+
+    # 筛选结果: 显示行数, 总行数, 耗时(秒)
+    filter_finished = Signal(int, int, float)
+    filter_failed = Signal(str)
+
+    def __init__(self, source: ProductionTableModel, parent=None):
+        super().__init__(parent)
+        self.query = ProductionQuery()
+        self.sort_key: Optional[Tuple[int, bool]] = None  # (列, 是否降序)
+        self.search_index = ProductionSearchIndex()
+        self.generation = 0
+        self._rows: Optional[array] = None
+        self._reverse: Optional[dict] = None
+        self._pending_removal: Optional[Tuple[int, int]] = None
+        self._pending_ranges: Optional[List[Tuple[int, int]]] = None
+        self._tasks = {}
+        # 同时只计算一个筛选，过期的任务很快放弃
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self.setSourceModel(source)
+        source.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        source.rowsInserted.connect(self._on_rows_inserted)
+        source.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        source.rowsRemoved.connect(self._on_rows_removed)
+        source.ranges_about_to_be_removed.connect(self._on_ranges_about_to_be_removed)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._on_model_reset)
+        source.dataChanged.connect(self._on_data_changed)
+
+    # ---- 筛选与排序 ----
+
+    def is_filtered(self) -> bool:
+        return self._rows is not None
+
+    def _sorted(self) -> bool:
+        return self.sort_key is not None
+
+    def set_query(self, query: ProductionQuery):
+        self.query = query
+        self.refresh()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.sort_key = None if column < 0 else (column, order == Qt.SortOrder.DescendingOrder)
+        self.refresh()
+
+    def refresh(self):
+        """按当前条件重新计算映射"""
+        self.generation += 1
+        if self.query.is_empty() and self.sort_key is None:
+            self._set_rows(None)
+            self.filter_finished.emit(self.rowCount(), self.sourceModel().rowCount(), 0.0)
+            return
+        task = ProductionFilterTask(self, self.generation)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.failed.connect(self._on_task_failed)
+        self._tasks[self.generation] = task
+        self._pool.start(task)
+
+    def _on_task_finished(self, generation: int, rows, elapsed: float, outdated: bool):
+        self._tasks.pop(generation, None)
+        if generation != self.generation:
+            return
+        if outdated:
+            # 计算期间数据变化，按最新数据重新计算
+            self.refresh()
+            return
+        self._set_rows(rows if rows is not None else array('I', range(self.sourceModel().rowCount())))
+        self.filter_finished.emit(self.rowCount(), self.sourceModel().rowCount(), elapsed)
+
+    def _on_task_failed(self, generation: int, message: str):
+        self._tasks.pop(generation, None)
+        if generation == self.generation:
+            self.filter_failed.emit(message)
+
+    def _set_rows(self, rows: Optional[array]):
+        self.beginResetModel()
+        self._rows = rows
+        self._reverse = None
+        self.endResetModel()
+
+    # ---- 行映射 ----
+
+    def source_row(self, row: int) -> int:
+        return row if self._rows is None else self._rows[row]
+
+    def source_rows(self, rows) -> List[int]:
+        if self._rows is None:
+            return list(rows)
+        return [self._rows[row] for row in rows]
+
+    def _proxy_row(self, source_row: int) -> int:
+        if self._rows is None:
+            return source_row
+        if not self._sorted():
+            pos = bisect_left(self._rows, source_row)
+            return pos if pos < len(self._rows) and self._rows[pos] == source_row else -1
+        if self._reverse is None:
+            self._reverse = {row: pos for pos, row in enumerate(self._rows)}
+        return self._reverse.get(source_row, -1)
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self.source_row(proxy_index.row()), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self._proxy_row(source_index.row())
+        return self.index(row, source_index.column()) if row >= 0 else QModelIndex()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.sourceModel().rowCount() if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self.sourceModel().columns().value(self.source_row(index.row()), index.column()))
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Vertical and role == Qt.ItemDataRole.DisplayRole:
+            # 行号显示源数据中的行号，筛选后仍能对应原始记录
+            return str(self.source_row(section) + 1)
+        return self.sourceModel().headerData(section, orientation, role)
+
+    # ---- 跟随源模型变化 ----
+
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+            return
+        if self._sorted() or first != len(self.sourceModel().columns()) - (last - first + 1):
+            self.refresh()
+            return
+        # 追加的行只需筛选新行本身
+        columns = self.sourceModel().columns()
+        try:
+            added = filter_rows(columns, self.query, self.search_index, first, last + 1)
+        except ValueError:
+            return
+        if added:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+        self.filter_finished.emit(self.rowCount(), self.sourceModel().rowCount(), 0.0)
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            return
+        self._pending_removal = (first, last)
+        if self._sorted():
+            self.beginResetModel()
+            return
+        lo, hi = bisect_left(self._rows, first), bisect_right(self._rows, last)
+        if hi > lo:
+            self.beginRemoveRows(QModelIndex(), lo, hi - 1)
+
+    def _on_rows_removed(self, parent, first, last):
+        if self._rows is None:
+            self.endRemoveRows()
+            return
+        self._pending_removal = None
+        count = last - first + 1
+        if self._sorted():
+            self._rows = array('I', (row if row < first else row - count
+                                     for row in self._rows if not first <= row <= last))
+            self._reverse = None
+            self.endResetModel()
+        else:
+            lo, hi = bisect_left(self._rows, first), bisect_right(self._rows, last)
+            tail = array('I', (row - count for row in self._rows[hi:]))
+            self._rows = self._rows[:lo] + tail
+            if hi > lo:
+                self.endRemoveRows()
+        self.filter_finished.emit(self.rowCount(), self.sourceModel().rowCount(), 0.0)
+
+    def _on_ranges_about_to_be_removed(self, ranges: List[Tuple[int, int]]):
+        # 源模型随后按区间重置，重置后据此调整映射
+        self._pending_ranges = ranges
+
+    def _on_model_reset(self):
+        ranges, self._pending_ranges = self._pending_ranges, None
+        if self._rows is not None and ranges is not None:
+            self._rows = self._remap_after_removal(self._rows, ranges)
+            self._reverse = None
+            self.endResetModel()
+            self.filter_finished.emit(self.rowCount(), self.sourceModel().rowCount(), 0.0)
+            return
+        if self._rows is not None:
+            # 数据整体替换，筛选结果出来之前不显示任何行
+            self._rows = array('I')
+            self._reverse = None
+        self.endResetModel()
+        if self._rows is not None:
+            self.refresh()
+
+    @staticmethod
+    def _remap_after_removal(rows: array, ranges: List[Tuple[int, int]]) -> array:
+        """删除若干 (起始行, 行数) 区间后，保留的行号前移"""
+        starts = sorted(ranges)
+        bounds = [start for start, _ in starts]
+        removed_before = [0]
+        for _, count in starts:
+            removed_before.append(removed_before[-1] + count)
+        result = array('I')
+        for row in rows:
+            pos = bisect_right(bounds, row) - 1
+            if pos >= 0 and row < starts[pos][0] + starts[pos][1]:
+                continue
+            result.append(row - removed_before[pos + 1] if pos >= 0 else row)
+        return result
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
\ No newline at end of file
@@ -0,0 +1,167 @@
+from typing import List, Optional, Tuple
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtWidgets import (
+    QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QTableView, QHeaderView, QAbstractItemView
+)
+from scheduling_core.production_analytics import DIMENSIONS, ProductionAnalytics
+from ProductionTableModel import ProductionTableModel
+
+PERCENTILES = (50, 90)
+STAT_HEADERS = ["记录数", "总产出", "总工时", "每小时产出", "平均每小时产出"] + [f"P{q}" for q in PERCENTILES]
+
+
+def _format_number(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.2f}".rstrip('0').rstrip('.')
+
+
+class ProductionSummaryModel(QAbstractTableModel):
+    """生产统计表格模型，只在显示某行时计算该分组的分位数"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.analytics: Optional[ProductionAnalytics] = None
+        self._row_count = 0
+        self._group_version = -1
+
+    def set_analytics(self, analytics: ProductionAnalytics):
+        self.beginResetModel()
+        self.analytics = analytics
+        self._row_count = len(analytics.groups)
+        self._group_version = analytics.group_version
+        self.endResetModel()
+
+    def groups_changed(self) -> bool:
+        return self.analytics is not None and self.analytics.group_version != self._group_version
+
+    def refresh(self):
+        """统计更新后刷新：分组数量变化时重置，否则只通知数据变化"""
+        if self.analytics is None:
+            return
+        if self.groups_changed():
+            self.set_analytics(self.analytics)
+        elif self._row_count:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._row_count - 1, self.columnCount() - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.analytics is None:
+            return 0
+        return len(self.analytics.fields) + len(STAT_HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.analytics is None:
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() >= len(self.analytics.fields):
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        keys = self.analytics.sorted_keys()
+        if index.row() >= len(keys):
+            # 分组已减少，模型重置前视图仍可能按旧的行数取数据
+            return None
+        row = self.analytics.row(keys[index.row()], PERCENTILES)
+        values = list(row.key) + [row.count, row.output, row.hours, row.rate, row.mean_rate, *row.percentiles]
+        value = values[index.column()]
+        return value if isinstance(value, str) else _format_number(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or self.analytics is None:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return (list(self.analytics.fields) + STAT_HEADERS)[section]
+        return str(section + 1)
+
+
+class ProductionSummaryPanel(QGroupBox):
+    """生产统计面板：按所选维度显示产出、工时和每小时产出分布，随生产记录增删增量更新"""
+
+    # 连续的增删合并为一次刷新
+    REFRESH_DELAY_MS = 100
+
+    def __init__(self, production_model: ProductionTableModel, parent=None):
+        super().__init__("生产统计", parent)
+        self.production_model = production_model
+        self.analytics: Optional[ProductionAnalytics] = None
+        self._ranges_removed = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 20, 10, 10)
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(QLabel("统计维度"))
+        self.dimension_combo = QComboBox()
+        self.dimension_combo.addItems(list(DIMENSIONS))
+        self.dimension_combo.currentTextChanged.connect(self.set_dimension)
+        top_layout.addWidget(self.dimension_combo)
+        top_layout.addStretch()
+        layout.addLayout(top_layout)
+
+        self.total_label = QLabel()
+        layout.addWidget(self.total_label)
+
+        self.summary_model = ProductionSummaryModel(self)
+        self.summary_view = QTableView()
+        self.summary_view.setModel(self.summary_model)
+        self.summary_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.summary_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.summary_view.verticalHeader().setDefaultSectionSize(24)
+        self.summary_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        layout.addWidget(self.summary_view)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        production_model.rowsInserted.connect(self._on_rows_inserted)
+        production_model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        production_model.ranges_about_to_be_removed.connect(self._on_ranges_about_to_be_removed)
+        production_model.modelReset.connect(self._on_model_reset)
+        self.set_dimension(self.dimension_combo.currentText())
+
+    def set_dimension(self, name: str):
+        self.analytics = ProductionAnalytics(self.production_model.columns(), DIMENSIONS[name])
+        self.summary_model.set_analytics(self.analytics)
+        self._update_total()
+
+    def _schedule_refresh(self):
+        if self.summary_model.groups_changed():
+            # 分组增减时立即重置表格，行数与分组保持一致
+            self._refresh_timer.stop()
+            self.refresh()
+            return
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_DELAY_MS)
+
+    def _on_rows_inserted(self, parent, first: int, last: int):
+        self.analytics.add_rows(first, last + 1)
+        self._schedule_refresh()
+
+    def _on_rows_about_to_be_removed(self, parent, first: int, last: int):
+        self.analytics.remove_rows(first, last + 1)
+        self._schedule_refresh()
+
+    def _on_ranges_about_to_be_removed(self, ranges: List[Tuple[int, int]]):
+        # 模型随后会重置，这些行已经从统计中减去，不需要重新计算
+        for start, count in ranges:
+            self.analytics.remove_rows(start, start + count)
+        self._ranges_removed = True
+
+    def _on_model_reset(self):
+        if self._ranges_removed:
+            self._ranges_removed = False
+        else:
+            self.analytics.rebuild(self.production_model.columns())
+        self._schedule_refresh()
+
+    def refresh(self):
+        self.summary_model.refresh()
+        self._update_total()
+
+    def _update_total(self):
+        total = self.analytics.total()
+        self.total_label.setText(
+            f"共 {total.count} 条记录，总产出 {_format_number(total.output)}，"
+            f"总工时 {_format_number(total.hours)}，每小时产出 {_format_number(total.rate)}")
@@ -0,0 +1,68 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from typing import Dict, List, Tuple
+from scheduling_core.production_store import PRODUCTION_FIELDS, ProductionColumns
+
+
+class ProductionTableModel(QAbstractTableModel):
+    """生产情况表格模型，数据保存在 ProductionColumns 中，只在显示时取值"""
+
+    # 一次删除的区间多于此数时重置模型，列数据只整理一遍
+    RESET_RANGE_THRESHOLD = 32
+    # 按区间重置删除前发出，参数为 [(起始行, 行数), ...]，此时数据尚未删除
+    ranges_about_to_be_removed = Signal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = ProductionColumns()
+
+    def columns(self) -> ProductionColumns:
+        return self._columns
+
+    def set_columns(self, columns: ProductionColumns):
+        """整体替换数据，只触发一次模型重置"""
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+
+    def append_record(self, record: Dict):
+        row = len(self._columns)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._columns.append_record(record)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(PRODUCTION_FIELDS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self._columns.value(index.row(), index.column()))
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return PRODUCTION_FIELDS[section]
+        return str(section + 1)
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or row < 0 or row + count > len(self._columns):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._columns.remove_range(row, count)
+        self.endRemoveRows()
+        return True
+
+    def remove_row_ranges(self, ranges: List[Tuple[int, int]]):
+        """删除多个互不相交的 (起始行, 行数) 区间"""
+        if len(ranges) <= self.RESET_RANGE_THRESHOLD:
+            for start, count in sorted(ranges, reverse=True):
+                self.removeRows(start, count)
+            return
+        self.ranges_about_to_be_removed.emit(list(ranges))
+        self.beginResetModel()
+        self._columns.remove_ranges(ranges)
+        self.endResetModel()
\ No newline at end of file
@@ -0,0 +1,223 @@
+import time
+from typing import Dict, List, Optional
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox, QLabel, QLineEdit,
+    QPushButton, QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView, QPlainTextEdit,
+    QAbstractItemView, QMessageBox
+)
+from PySide6.QtCore import QThreadPool
+from PySide6.QtGui import QBrush, QColor, QFont
+from SchedulingWorker import ScenarioTask
+from scheduling_core.result_cache import ResultCache
+from scheduling_core.scenarios import ScenarioOutcome, build_scenarios, default_workers, scenario_metrics
+from scheduling_core.scheduling_engine import STATUS_TEXT
+
+
+def _parse_numbers(text: str) -> List[float]:
+    """解析以逗号分隔的数字，允许中文逗号和空格"""
+    parts = text.replace('，', ',').replace(' ', ',').split(',')
+    try:
+        return [float(part) for part in parts if part]
+    except ValueError:
+        raise ValueError("请输入有效的数字")
+
+
+class ScenarioDialog(QDialog):
+    """方案对比：由当前排班参数生成多个变体，并行求解后并排显示关键指标"""
+
+    METRIC_HEADERS = ["方案", "状态", "缺口合计", "满足率", "使用人数", "开线次数", "求解耗时(秒)", "完成时刻(秒)"]
+    BEST_ROW_COLOR = QColor("#d4edda")
+
+    def __init__(self, schedule: Dict, config: Dict, time_limit: Optional[float] = None,
+                 cache: Optional[ResultCache] = None, parent=None):
+        super().__init__(parent)
+        self.schedule = schedule
+        self.config = config
+        self.time_limit = time_limit
+        self.cache = cache
+        # 与求解结果的键一致，P/N统一按字符串显示
+        self.pns = list(dict.fromkeys(str(item['P_N']) for item in schedule['demands']))
+        self._task: Optional[ScenarioTask] = None
+        self._rows: Dict[str, int] = {}
+        self._outcomes: Dict[int, ScenarioOutcome] = {}
+        self._started_at = 0.0
+        self.setWindowTitle("方案对比")
+        self.resize(1100, 650)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #e8f0fe;
+            }
+            QLineEdit, QSpinBox {
+                background-color: white;
+                border: 1px solid #ccc;
+                border-radius: 3px;
+                padding: 3px;
+                min-width: 150px;
+                color: black;
+                font-size: 14px;
+                font-family: "Microsoft YaHei";
+            }
+            QLabel {
+                font-size: 14px;
+                color: #000;
+            }
+        """)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        settings_group = QGroupBox("方案设置")
+        form = QFormLayout()
+        form.setContentsMargins(10, 20, 10, 10)
+        self.day_hours_edit = QLineEdit(f"{float(self.schedule['day_shift_hours']):g}")
+        self.day_hours_edit.setToolTip("多个白班时长用逗号分隔，夜班时长 = 一周工作总时间 - 白班时长")
+        self.demand_edit = QLineEdit("-10, 0, 10")
+        self.demand_edit.setToolTip("多个需求变化百分比用逗号分隔，所有P/N的需求同时按该比例调整")
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, default_workers(1 << 16))
+        self.workers_spin.setValue(self.workers_spin.maximum())
+        form.addRow(f"白班时间(总 {float(self.schedule['total_work_hours']):g} 小时):", self.day_hours_edit)
+        form.addRow("需求变化(%):", self.demand_edit)
+        form.addRow("并行进程数:", self.workers_spin)
+        settings_group.setLayout(form)
+        layout.addWidget(settings_group)
+
+        button_layout = QHBoxLayout()
+        self.run_button = QPushButton("开始对比")
+        self.run_button.clicked.connect(self.run_scenarios)
+        button_layout.addWidget(self.run_button)
+        self.cancel_button = QPushButton("取消")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_scenarios)
+        button_layout.addWidget(self.cancel_button)
+        self.status_label = QLabel("")
+        button_layout.addWidget(self.status_label, 1)
+        layout.addLayout(button_layout)
+
+        # 每个方案一行，关键指标之后是各P/N的需求缺口
+        headers = self.METRIC_HEADERS + [f"缺口 {pn}" for pn in self.pns]
+        self.result_table = QTableWidget(0, len(headers))
+        self.result_table.setHorizontalHeaderLabels(headers)
+        self.result_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.result_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.result_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.result_table.itemSelectionChanged.connect(self._show_selected_detail)
+        layout.addWidget(self.result_table, 2)
+
+        self.detail_text = QPlainTextEdit()
+        self.detail_text.setReadOnly(True)
+        self.detail_text.setStyleSheet("background-color: white;")
+        self.detail_text.setPlaceholderText("选择一个方案查看排班明细...")
+        layout.addWidget(self.detail_text, 1)
+
+    def run_scenarios(self):
+        if self._task is not None:
+            return
+        try:
+            day_hours = _parse_numbers(self.day_hours_edit.text())
+            factors = [1 + percent / 100 for percent in _parse_numbers(self.demand_edit.text())]
+            scenarios = build_scenarios(self.schedule, day_hours, factors or [1.0])
+        except ValueError as e:
+            QMessageBox.warning(self, "输入错误", str(e))
+            return
+
+        self._rows = {}
+        self._outcomes = {}
+        self.detail_text.clear()
+        self.result_table.setRowCount(len(scenarios))
+        for row, scenario in enumerate(scenarios):
+            self._rows[scenario.name] = row
+            self.result_table.setItem(row, 0, QTableWidgetItem(scenario.name))
+            self.result_table.setItem(row, 1, QTableWidgetItem("等待求解"))
+            for col in range(2, self.result_table.columnCount()):
+                self.result_table.setItem(row, col, QTableWidgetItem(""))
+
+        self._task = ScenarioTask(scenarios, self.config, self.time_limit, self.workers_spin.value(), self.cache)
+        self._task.signals.outcome.connect(self._on_outcome)
+        self._task.signals.finished.connect(self._on_finished)
+        self._task.signals.failed.connect(self._on_failed)
+        self.run_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self._started_at = time.perf_counter()
+        self.status_label.setText(f"正在求解 {len(scenarios)} 个方案...")
+        QThreadPool.globalInstance().start(self._task)
+
+    def cancel_scenarios(self):
+        if self._task is not None:
+            self._task.cancel()
+            self.status_label.setText("正在取消...")
+
+    def _set_cell(self, row: int, col: int, text: str):
+        self.result_table.item(row, col).setText(text)
+
+    def _on_outcome(self, outcome: ScenarioOutcome):
+        row = self._rows[outcome.scenario.name]
+        self._outcomes[row] = outcome
+        self._set_cell(row, 7, f"{outcome.wall_time:.2f}")
+        result = outcome.result
+        if result is None:
+            self._set_cell(row, 1, outcome.error)
+            return
+        metrics = scenario_metrics(result)
+        status = STATUS_TEXT.get(result.status, result.status)
+        self._set_cell(row, 1, f"{status}（缓存）" if result.from_cache else status)
+        self._set_cell(row, 2, f"{metrics['objective']:g}")
+        self._set_cell(row, 3, f"{metrics['fill_rate']:.1%}")
+        self._set_cell(row, 4, str(metrics['employees_used']))
+        self._set_cell(row, 5, str(metrics['runs']))
+        self._set_cell(row, 6, f"{metrics['solve_time']:.3f}")
+        for offset, pn in enumerate(self.pns):
+            self._set_cell(row, len(self.METRIC_HEADERS) + offset, f"{result.shortfall(pn):g}")
+        self.status_label.setText(f"已完成 {len(self._outcomes)}/{len(self._rows)} 个方案")
+        if self.result_table.currentRow() == row:
+            self._show_selected_detail()
+
+    def _finish(self):
+        self._task = None
+        self.run_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    def _on_finished(self, cancelled: bool):
+        self._finish()
+        elapsed = time.perf_counter() - self._started_at
+        done = f"{len(self._outcomes)}/{len(self._rows)}"
+        if cancelled:
+            self.status_label.setText(f"已取消，完成 {done} 个方案，用时 {elapsed:.2f} 秒")
+        else:
+            self.status_label.setText(f"全部完成 {done} 个方案，用时 {elapsed:.2f} 秒")
+        self._highlight_best()
+
+    def _on_failed(self, message: str):
+        self._finish()
+        self.status_label.setText("")
+        QMessageBox.warning(self, "方案对比错误", message)
+
+    def _highlight_best(self):
+        """标出需求缺口最小（相同时用人最少）的方案"""
+        solved = [(scenario_metrics(outcome.result), row) for row, outcome in self._outcomes.items()
+                  if outcome.result is not None]
+        if not solved:
+            return
+        _, best = min(solved, key=lambda item: (item[0]['objective'], item[0]['employees_used'], item[1]))
+        font = QFont()
+        font.setBold(True)
+        for col in range(self.result_table.columnCount()):
+            item = self.result_table.item(best, col)
+            item.setBackground(QBrush(self.BEST_ROW_COLOR))
+            item.setFont(font)
+
+    def _show_selected_detail(self):
+        outcome = self._outcomes.get(self.result_table.currentRow())
+        if outcome is None:
+            self.detail_text.clear()
+        elif outcome.result is None:
+            self.detail_text.setPlainText(outcome.error)
+        else:
+            self.detail_text.setPlainText(outcome.result.format_text())
+
+    def done(self, result: int):
+        # 关闭窗口时不再启动剩余方案
+        self.cancel_scenarios()
+        super().done(result)
\ No newline at end of file
@@ -1,19 +1,49 @@
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QLineEdit,
-    QPushButton, QFileDialog, QScrollArea, QTextEdit, QDialog, QFormLayout,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+    QPushButton, QFileDialog, QScrollArea, QPlainTextEdit, QDialog, QFormLayout,
+    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QCheckBox
 )
-from PySide6.QtCore import Qt
-from yaml_ScheduleDataManager import ScheduleDataManager
+from PySide6.QtCore import Qt, QThreadPool, QSignalBlocker
+from SchedulingWorker import SchedulingTask
+from FileWorker import start_file_task
+from Autosaver import Autosaver
+from ScenarioDialog import ScenarioDialog
+from LogSink import LogSink
+from scheduling_core.autosave import Snapshot
+from scheduling_core.result_cache import ResultCache
+from scheduling_core.schedule_data import load_schedule, save_schedule
+from scheduling_core.scheduling_session import SchedulingSession
 
 
 class SchedulingPage(QWidget):
+    # 单次排班求解的时间上限（秒），超时后返回当前最好结果
+    SOLVE_TIME_LIMIT = 60.0
+
     def __init__(self):
         super().__init__()
         self.line_edits = {}  # 初始化字典
         self.product_table = None  # 初始化表格
+        # P/N -> 产品表第一列的单元格（按行顺序），删除产品时直接定位行；单元格被编辑后重建
+        self._product_items: Optional[Dict[str, List[QTableWidgetItem]]] = {}
         self.scheduling_result_text = None  # 初始化文本编辑框
+        self.result_sink = None
+        self.generate_button = None
+        self.cancel_button = None
+        # 返回管理界面当前配置的函数，由主界面设置
+        self.config_provider: Optional[Callable[[], Dict]] = None
+        self._scheduling_task = None
+        self._scenario_dialog = None
+        # 正在后台保存或加载参数文件的任务
+        self._file_task = None
+        # 相同的排班参数和管理配置直接返回之前的结果
+        self.result_cache = ResultCache()
+        # 保留上一次的求解状态，小幅修改排班参数后增量求解
+        self.scheduling_session = SchedulingSession(self.result_cache)
+        self.incremental_check = None
+        # 未保存的修改定期写入崩溃恢复快照
+        self.autosaver = Autosaver('scheduling_page', self._autosave_data, self)
+        self.autosaver.failed.connect(self._on_autosave_failed)
         self.init_ui()  # 然后在init_ui中创建实际对象
 
     def init_ui(self):
@@ -41,6 +71,7 @@ class SchedulingPage(QWidget):
             label = QLabel(label_text)
             line_edit = QLineEdit("0")
             self.line_edits[field_name] = line_edit  # 保存引用
+            line_edit.textEdited.connect(self.autosaver.mark_dirty)
             row_layout.addWidget(label)
             row_layout.addWidget(line_edit)
             input_layout.addLayout(row_layout)
@@ -77,6 +108,7 @@ class SchedulingPage(QWidget):
         self.product_table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.product_table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
+        self.product_table.itemChanged.connect(self._on_product_item_changed)
         product_layout.addWidget(self.product_table)
 
         button_layout = QVBoxLayout()
@@ -99,10 +131,11 @@ class SchedulingPage(QWidget):
         output_layout = QVBoxLayout()
         output_layout.setContentsMargins(10, 20, 10, 10)
 
-        self.scheduling_result_text = QTextEdit()
-        self.scheduling_result_text.setReadOnly(True)
+        self.scheduling_result_text = QPlainTextEdit()
         self.scheduling_result_text.setStyleSheet("background-color: #e8f0fe;")
         self.scheduling_result_text.setPlaceholderText("排班结果将在此显示...")
+        # 大规模排班结果分批刷新到结果框，完整结果写入 logs/scheduling.log
+        self.result_sink = LogSink(self.scheduling_result_text, max_lines=50000, log_name='scheduling')
 
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -114,9 +147,25 @@ class SchedulingPage(QWidget):
         # 按钮布局
         button_layout = QHBoxLayout()
 
-        generate_button = QPushButton("生成排班结果")
-        generate_button.clicked.connect(self.generate_scheduling_result)
-        button_layout.addWidget(generate_button)
+        self.generate_button = QPushButton("生成排班结果")
+        self.generate_button.clicked.connect(self.generate_scheduling_result)
+        button_layout.addWidget(self.generate_button)
+
+        self.cancel_button = QPushButton("取消排班")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_scheduling)
+        button_layout.addWidget(self.cancel_button)
+
+        self.incremental_check = QCheckBox("增量求解")
+        self.incremental_check.setChecked(True)
+        self.incremental_check.setToolTip("管理配置不变时，在上一次排班结果的基础上只调整受影响的产品；"
+                                          "取消勾选则重新完整求解")
+        button_layout.addWidget(self.incremental_check)
+
+        scenario_button = QPushButton("方案对比")
+        scenario_button.setToolTip("按不同的班次划分和需求变化并行求解多个方案并对比")
+        scenario_button.clicked.connect(self.open_scenario_dialog)
+        button_layout.addWidget(scenario_button)
 
         save_button = QPushButton("保存参数配置")
         save_button.clicked.connect(self.save_to_file)
@@ -155,7 +204,7 @@ class SchedulingPage(QWidget):
             return None
 
     def save_to_file(self):
-        """保存当前数据到文件"""
+        """保存当前数据到文件；写出YAML在后台线程进行"""
         data = self.get_current_data()
         if not data:
             return
@@ -164,75 +213,90 @@ class SchedulingPage(QWidget):
             self, "保存排班数据", "", "YAML文件 (*.yaml *.yml)")
 
         if file_path:
-            if ScheduleDataManager.save_to_yaml(data, file_path):
-                # 创建自定义消息框
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle("提示")
-                msg_box.setText("排班数据保存成功!")
-                msg_box.setIcon(QMessageBox.Icon.Information)
-
-                # 设置消息框整体样式
-                msg_box.setStyleSheet("""
-                    /* 主消息框样式 */
-                    QMessageBox {
-                        background-color: #e8f0fe;
-                        font-family: "Microsoft YaHei";
-                        min-width: 300px;
-                        min-height: 150px;
-                        padding: 15px;
-                    }
+            def save(progress, should_stop):
+                save_schedule(data, file_path, progress, should_stop)
+
+            def saved(_):
+                self.autosaver.discard()
+                self._show_saved_message()
+
+            self._file_task = start_file_task(self, "正在保存排班数据...", save, saved)
+
+    def _show_saved_message(self, _=None):
+        """显示保存成功的提示"""
+        # 创建自定义消息框
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("提示")
+        msg_box.setText("排班数据保存成功!")
+        msg_box.setIcon(QMessageBox.Icon.Information)
+
+        # 设置消息框整体样式
+        msg_box.setStyleSheet("""
+            /* 主消息框样式 */
+            QMessageBox {
+                background-color: #e8f0fe;
+                font-family: "Microsoft YaHei";
+                min-width: 300px;
+                min-height: 150px;
+                padding: 15px;
+            }
 
-                    /* 图标容器样式 */
-                    QMessageBox QLabel#qt_msgboxex_icon_label {
-                        padding-left: 10px;  /* 图标左内边距 */
-                    }
+            /* 图标容器样式 */
+            QMessageBox QLabel#qt_msgboxex_icon_label {
+                padding-left: 10px;  /* 图标左内边距 */
+            }
 
-                    /* 消息文本标签样式 */
-                    QMessageBox QLabel#qt_msgbox_label {
-                        color: #000;
-                        font-size: 14px;
-                        margin: 10px 10px 10px 20px;  /* 上右下左，增加左边距 */
-                        padding-left: 5px;  /* 文字左内边距 */
-                    }
+            /* 消息文本标签样式 */
+            QMessageBox QLabel#qt_msgbox_label {
+                color: #000;
+                font-size: 14px;
+                margin: 10px 10px 10px 20px;  /* 上右下左，增加左边距 */
+                padding-left: 5px;  /* 文字左内边距 */
+            }
 
-                    /* 按钮默认状态样式 */
-                    QMessageBox QPushButton {
-                        background-color: #367fa9;
-                        color: white;
-                        border: 1px solid #2a5f7f;
-                        border-radius: 3px;
-                        padding: 3px 10px;
-                        min-width: 50px;
-                        min-height: 20px;
-                        font-size: 12px;
-                        margin: 5px;
-                    }
+            /* 按钮默认状态样式 */
+            QMessageBox QPushButton {
+                background-color: #367fa9;
+                color: white;
+                border: 1px solid #2a5f7f;
+                border-radius: 3px;
+                padding: 3px 10px;
+                min-width: 50px;
+                min-height: 20px;
+                font-size: 12px;
+                margin: 5px;
+            }
 
-                    /* 按钮悬停状态样式 */
-                    QMessageBox QPushButton:hover {
-                        background-color: #285f7f;
-                        border: 1px solid #1e4a63;
-                    }
+            /* 按钮悬停状态样式 */
+            QMessageBox QPushButton:hover {
+                background-color: #285f7f;
+                border: 1px solid #1e4a63;
+            }
 
-                    /* 按钮按下状态样式 */
-                    QMessageBox QPushButton:pressed {
-                        background-color: #1e4a63;
-                    }
-                """)
+            /* 按钮按下状态样式 */
+            QMessageBox QPushButton:pressed {
+                background-color: #1e4a63;
+            }
+        """)
 
-                # 获取按钮
-                msg_box.addButton("确定", QMessageBox.ButtonRole.AcceptRole)
-                msg_box.exec()
+        # 获取按钮
+        msg_box.addButton("确定", QMessageBox.ButtonRole.AcceptRole)
+        msg_box.exec()
 
     def load_from_file(self):
-        """从文件加载数据到界面"""
+        """从文件加载数据到界面；解析在后台线程进行"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "加载排班数据", "", "YAML文件 (*.yaml *.yml)")
 
         if file_path:
-            data = ScheduleDataManager.load_from_yaml(file_path)
-            if data:
+            def load(progress, should_stop):
+                return load_schedule(file_path, progress, should_stop)
+
+            def loaded(data):
                 self.load_data_to_ui(data)
+                self.autosaver.discard()
+
+            self._file_task = start_file_task(self, "正在加载排班数据...", load, loaded)
 
     def load_data_to_ui(self, data: Dict):
         """将数据加载到界面"""
@@ -242,12 +306,36 @@ class SchedulingPage(QWidget):
         self.line_edits['night_shift_hours'].setText(str(data['night_shift_hours']))
 
         # 清空并重新填充产品表
+        self._fill_product_table([[str(demand['P_N']), str(demand['demand'])] for demand in data['demands']])
+
+    def _fill_product_table(self, rows: List[List[str]]):
         self.product_table.setRowCount(0)
-        for demand in data['demands']:
-            row = self.product_table.rowCount()
-            self.product_table.insertRow(row)
-            self.product_table.setItem(row, 0, QTableWidgetItem(demand['P_N']))
-            self.product_table.setItem(row, 1, QTableWidgetItem(str(demand['demand'])))
+        self._product_items = {}
+        with QSignalBlocker(self.product_table):
+            for p_n, demand in rows:
+                row = self.product_table.rowCount()
+                self.product_table.insertRow(row)
+                self.product_table.setItem(row, 0, QTableWidgetItem(p_n))
+                self.product_table.setItem(row, 1, QTableWidgetItem(demand))
+                self._index_product_item(self.product_table.item(row, 0))
+
+    def _autosave_data(self) -> Tuple[Dict, None]:
+        """自动保存的快照：保存输入框和表格中的原始文本，未填写完整的输入也能恢复"""
+        table = self.product_table
+        rows = [[table.item(row, col).text() if table.item(row, col) is not None else ""
+                 for col in range(2)] for row in range(table.rowCount())]
+        fields = {field: line_edit.text() for field, line_edit in self.line_edits.items()}
+        return {'fields': fields, 'demands': rows}, None
+
+    def _on_autosave_failed(self, message: str):
+        QMessageBox.warning(self, "自动保存失败", f"未保存的修改无法写入自动保存文件，请尽快手动保存。\n{message}")
+
+    def restore_snapshot(self, snapshot: Snapshot):
+        """恢复自动保存的快照"""
+        for field, text in snapshot.data['fields'].items():
+            if field in self.line_edits:
+                self.line_edits[field].setText(text)
+        self._fill_product_table(snapshot.data['demands'])
 
     def open_add_product_dialog(self):
         dialog = QDialog(self)
@@ -294,9 +382,12 @@ class SchedulingPage(QWidget):
             if name and quantity:
                 float(quantity)  # 验证是否为数字
                 row_position = self.product_table.rowCount()
-                self.product_table.insertRow(row_position)
-                self.product_table.setItem(row_position, 0, QTableWidgetItem(name))
-                self.product_table.setItem(row_position, 1, QTableWidgetItem(quantity))
+                with QSignalBlocker(self.product_table):
+                    self.product_table.insertRow(row_position)
+                    self.product_table.setItem(row_position, 0, QTableWidgetItem(name))
+                    self.product_table.setItem(row_position, 1, QTableWidgetItem(quantity))
+                self._index_product_item(self.product_table.item(row_position, 0))
+                self.autosaver.mark_dirty()
                 dialog.close()
         except ValueError:
             QMessageBox.warning(dialog, "输入错误", "请输入有效的数字")
@@ -339,26 +430,92 @@ class SchedulingPage(QWidget):
         dialog.exec()
 
     def delete_product(self, name, dialog):
-        for row in range(self.product_table.rowCount()):
-            item = self.product_table.item(row, 0)
-            if item and item.text() == name:
-                self.product_table.removeRow(row)
-                break
+        if self._product_items is None:
+            self._product_items = {}
+            for row in range(self.product_table.rowCount()):
+                self._index_product_item(self.product_table.item(row, 0))
+        items = self._product_items.get(name)
+        if items:
+            # 删除该P/N的第一行
+            item = items.pop(0)
+            if not items:
+                del self._product_items[name]
+            self.product_table.removeRow(item.row())
+            self.autosaver.mark_dirty()
         dialog.close()
 
+    def _index_product_item(self, item: Optional[QTableWidgetItem]):
+        if item is not None and self._product_items is not None:
+            self._product_items.setdefault(item.text(), []).append(item)
+
+    def _on_product_item_changed(self, item: QTableWidgetItem):
+        if item.column() == 0:
+            self._product_items = None
+        self.autosaver.mark_dirty()
+
+    def set_config_provider(self, provider: Callable[[], Dict]):
+        """设置获取管理配置（员工、拉线、特殊工位）的函数"""
+        self.config_provider = provider
+
+    def _get_scheduling_config(self) -> Optional[Dict]:
+        """管理界面的当前配置；缺少员工或拉线时提示并返回 None"""
+        config = self.config_provider() if self.config_provider else None
+        if not config or not config.get('employees') or not config.get('lines'):
+            QMessageBox.warning(self, "排班错误", "请先在管理界面添加或加载员工和拉线配置")
+            return None
+        return config
+
     def generate_scheduling_result(self):
+        """在线程池中求解排班，界面保持响应"""
+        if self._scheduling_task is not None:
+            return
+
         data = self.get_current_data()
         if not data:
             return
 
-        # 这里只是示例，实际应根据排班算法生成结果
-        result_text = "排班结果：\n\n"
-        result_text += f"总工作时间: {data['total_work_hours']} 小时\n"
-        result_text += f"白班时间: {data['day_shift_hours']} 小时\n"
-        result_text += f"夜班时间: {data['night_shift_hours']} 小时\n\n"
-        result_text += "产品需求:\n"
-
-        for demand in data['demands']:
-            result_text += f"- {demand['P_N']}: {demand['demand']} 件\n"
+        config = self._get_scheduling_config()
+        if config is None:
+            return
 
-        self.scheduling_result_text.setText(result_text)
\ No newline at end of file
+        self._scheduling_task = SchedulingTask(data, config, self.SOLVE_TIME_LIMIT, self.scheduling_session,
+                                               self.incremental_check.isChecked())
+        self._scheduling_task.signals.finished.connect(self._on_scheduling_finished)
+        self._scheduling_task.signals.failed.connect(self._on_scheduling_failed)
+        self.generate_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.result_sink.set_text("正在生成排班结果...\n")
+        QThreadPool.globalInstance().start(self._scheduling_task)
+
+    def open_scenario_dialog(self):
+        """以当前排班参数为基础打开方案对比窗口"""
+        data = self.get_current_data()
+        if not data:
+            return
+        if not data['demands']:
+            QMessageBox.warning(self, "排班错误", "请先添加产品需求")
+            return
+        config = self._get_scheduling_config()
+        if config is None:
+            return
+        self._scenario_dialog = ScenarioDialog(data, config, self.SOLVE_TIME_LIMIT, self.result_cache, self)
+        self._scenario_dialog.exec()
+
+    def cancel_scheduling(self):
+        if self._scheduling_task is not None:
+            self._scheduling_task.cancel()
+
+    def _finish_scheduling(self):
+        self._scheduling_task = None
+        self.generate_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    def _on_scheduling_finished(self, result):
+        self._finish_scheduling()
+        self.result_sink.clear()
+        self.result_sink.write_lines(result.iter_text_lines())
+
+    def _on_scheduling_failed(self, message: str):
+        self._finish_scheduling()
+        self.result_sink.clear()
+        QMessageBox.warning(self, "排班错误", message)
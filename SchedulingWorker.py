@@ -0,0 +1,93 @@
+import threading
+from typing import Dict, List, Optional
+from PySide6.QtCore import QObject, QRunnable, Signal
+from scheduling_core.result_cache import ResultCache
+from scheduling_core.scheduling_engine import solve
+from scheduling_core.scheduling_session import SchedulingSession
+from scheduling_core.scenarios import Scenario, iter_scenario_results
+
+
+class SchedulingSignals(QObject):
+    finished = Signal(object)  # ScheduleResult
+    failed = Signal(str)
+
+
+class SchedulingTask(QRunnable):
+    """在 QThreadPool 中运行排班求解，支持取消和超时
+
+    传入 session 时通过它求解（结果缓存、增量求解）；同一 session 同时只能有一个任务使用。
+    """
+
+    def __init__(self, schedule: Dict, config: Dict, time_limit: Optional[float] = None,
+                 session: Optional[SchedulingSession] = None, incremental: bool = True):
+        super().__init__()
+        # 由调用方持有任务对象，避免线程池结束后删除信号对象
+        self.setAutoDelete(False)
+        self.schedule = schedule
+        self.config = config
+        self.time_limit = time_limit
+        self.session = session
+        self.incremental = incremental
+        self.signals = SchedulingSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            if self.session is None:
+                result = solve(self.schedule, self.config, self._cancelled.is_set, self.time_limit)
+            else:
+                result = self.session.solve(self.schedule, self.config, self._cancelled.is_set,
+                                            self.time_limit, self.incremental)
+        except (KeyError, TypeError, ValueError) as e:
+            self._discard_session()
+            self.signals.failed.emit(f"排班数据无效: {str(e)}")
+            return
+        except Exception as e:
+            self._discard_session()
+            self.signals.failed.emit(f"排班求解失败: {str(e)}")
+            return
+        self.signals.finished.emit(result)
+
+    def _discard_session(self):
+        # 求解中途出错时增量状态可能不完整
+        if self.session is not None:
+            self.session.reset()
+
+
+class ScenarioSignals(QObject):
+    outcome = Signal(object)  # ScenarioOutcome，每完成一个方案发出一次
+    finished = Signal(bool)  # 是否被取消
+    failed = Signal(str)
+
+
+class ScenarioTask(QRunnable):
+    """在 QThreadPool 中调度多个排班方案，方案本身在进程池中并行求解"""
+
+    def __init__(self, scenarios: List[Scenario], config: Dict, time_limit: Optional[float] = None,
+                 max_workers: Optional[int] = None, cache: Optional[ResultCache] = None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.scenarios = scenarios
+        self.config = config
+        self.time_limit = time_limit
+        self.max_workers = max_workers
+        self.cache = cache
+        self.signals = ScenarioSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            for outcome in iter_scenario_results(self.scenarios, self.config, self.time_limit,
+                                                 self.max_workers, self._cancelled.is_set, self.cache):
+                self.signals.outcome.emit(outcome)
+        except Exception as e:
+            # 进程池无法启动等错误；单个方案的求解错误随 outcome 返回
+            self.signals.failed.emit(f"方案求解失败: {str(e)}")
+            return
+        self.signals.finished.emit(self._cancelled.is_set())
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""启动耗时记录：设置环境变量 AI_SCHEDULING_TRACE=<文件路径> 后，记录导入、界面创建和首次绘制的时间
+
+输出为 Chrome Trace Event 格式的JSON，可在 chrome://tracing 或 Perfetto 中查看。
+本模块在导入PySide6之前导入，未启用时所有方法都不做任何事。
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+TRACE_ENV = 'AI_SCHEDULING_TRACE'
+
+
+class StartupTrace:
+    def __init__(self, file_path: Optional[str] = None):
+        self.file_path = file_path
+        self.start = time.perf_counter()
+        self.events: List[Dict] = []
+        self._painted = set()
+        self._filters = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.file_path)
+
+    def _timestamp(self, at: Optional[float] = None) -> float:
+        return ((time.perf_counter() if at is None else at) - self.start) * 1e6
+
+    def mark(self, name: str):
+        """记录一个时间点"""
+        if not self.enabled:
+            return
+        self.events.append({'name': name, 'ph': 'i', 's': 'g', 'ts': self._timestamp(),
+                            'pid': os.getpid(), 'tid': threading.get_ident()})
+
+    @contextmanager
+    def span(self, name: str):
+        """记录一段代码的耗时"""
+        if not self.enabled:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append({'name': name, 'ph': 'X', 'ts': self._timestamp(begin),
+                                'dur': (time.perf_counter() - begin) * 1e6,
+                                'pid': os.getpid(), 'tid': threading.get_ident()})
+
+    def watch_first_paint(self, widget, name: str):
+        """在控件第一次绘制完成时记录时间点"""
+        if not self.enabled:
+            return
+        from PySide6.QtCore import QEvent, QObject, QTimer
+
+        trace = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint and name not in trace._painted:
+                    trace._painted.add(name)
+                    # 绘制事件处理完成后再记录
+                    QTimer.singleShot(0, lambda: trace.mark(name))
+                    obj.removeEventFilter(self)
+                return False
+
+        paint_filter = FirstPaintFilter(widget)
+        self._filters.append(paint_filter)
+        widget.installEventFilter(paint_filter)
+
+    def write(self):
+        if not self.enabled:
+            return
+        try:
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False, indent=1)
+        except OSError:
+            pass
+
+    def summary(self) -> str:
+        lines = []
+        for event in sorted(self.events, key=lambda e: e['ts']):
+            text = f"{event['ts'] / 1000:9.1f} ms  {event['name']}"
+            if 'dur' in event:
+                text += f" ({event['dur'] / 1000:.1f} ms)"
+            lines.append(text)
+        return "\n".join(lines)
+
+
+trace = StartupTrace(os.environ.get(TRACE_ENV) or None)
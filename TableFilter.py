@@ -0,0 +1,213 @@
+from typing import List, Optional
+from PySide6.QtWidgets import (
+    QWidget, QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton, QTableWidget
+)
+from PySide6.QtCore import Qt, QTimer, Signal
+from ProductionFilterProxy import ProductionFilterProxy
+from scheduling_core.production_filter import ProductionQuery
+
+# 停止输入这么久之后才开始筛选
+FILTER_DELAY_MS = 200
+
+FILTER_BAR_STYLE = """
+    QLineEdit, QComboBox {
+        background-color: white;
+        border: 1px solid #ccc;
+        border-radius: 3px;
+        padding: 2px;
+        font-size: 12px;
+    }
+    QLabel {
+        font-size: 12px;
+    }
+"""
+
+
+class ProductionFilterBar(QWidget):
+    """生产情况筛选栏：日期范围、班次、P/N、姓名和关键词，结果在后台线程计算"""
+
+    def __init__(self, proxy: ProductionFilterProxy, parent=None):
+        super().__init__(parent)
+        self.proxy = proxy
+        self.setStyleSheet(FILTER_BAR_STYLE)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.date_from_edit = self._add_edit(layout, "日期", "起始，如 2024-01-01", 110)
+        self.date_to_edit = self._add_edit(layout, "至", "结束", 110)
+        layout.addWidget(QLabel("班次"))
+        self.shift_combo = QComboBox()
+        self.shift_combo.addItems(["全部", "白班", "夜班"])
+        self.shift_combo.currentIndexChanged.connect(self._schedule)
+        layout.addWidget(self.shift_combo)
+        self.pn_edit = self._add_edit(layout, "P/N", "包含", 100)
+        self.name_edit = self._add_edit(layout, "姓名", "包含", 100)
+        self.text_edit = self._add_edit(layout, "搜索", "多个关键词用空格分隔", 160)
+
+        clear_button = QPushButton("清除")
+        clear_button.clicked.connect(self.clear)
+        layout.addWidget(clear_button)
+        self.count_label = QLabel("")
+        layout.addWidget(self.count_label, 1)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FILTER_DELAY_MS)
+        self._timer.timeout.connect(self.apply)
+
+        proxy.filter_finished.connect(self._on_filter_finished)
+        proxy.filter_failed.connect(self._on_filter_failed)
+        for signal in (proxy.rowsInserted, proxy.rowsRemoved, proxy.modelReset):
+            signal.connect(self._update_count)
+
+    def _add_edit(self, layout: QHBoxLayout, label: str, placeholder: str, width: int) -> QLineEdit:
+        layout.addWidget(QLabel(label))
+        edit = QLineEdit()
+        edit.setPlaceholderText(placeholder)
+        edit.setFixedWidth(width)
+        edit.setClearButtonEnabled(True)
+        edit.textChanged.connect(self._schedule)
+        layout.addWidget(edit)
+        return edit
+
+    def query(self) -> ProductionQuery:
+        shift = self.shift_combo.currentText() if self.shift_combo.currentIndex() > 0 else ''
+        return ProductionQuery(self.date_from_edit.text(), self.date_to_edit.text(), shift,
+                               self.pn_edit.text(), self.name_edit.text(), self.text_edit.text())
+
+    def _schedule(self, *args):
+        self._timer.start()
+
+    def apply(self):
+        self._timer.stop()
+        query = self.query()
+        if query != self.proxy.query:
+            self.count_label.setText("正在筛选...")
+            self.proxy.set_query(query)
+
+    def clear(self):
+        for edit in (self.date_from_edit, self.date_to_edit, self.pn_edit, self.name_edit, self.text_edit):
+            edit.blockSignals(True)
+            edit.clear()
+            edit.blockSignals(False)
+        self.shift_combo.blockSignals(True)
+        self.shift_combo.setCurrentIndex(0)
+        self.shift_combo.blockSignals(False)
+        self.apply()
+
+    def _update_count(self, *args):
+        total = self.proxy.sourceModel().rowCount()
+        if self.proxy.is_filtered() and not self.proxy.query.is_empty():
+            self.count_label.setText(f"显示 {self.proxy.rowCount()} / {total} 行")
+        else:
+            self.count_label.setText(f"共 {total} 行")
+
+    def _on_filter_finished(self, shown: int, total: int, elapsed: float):
+        self._update_count()
+        if elapsed >= 0.001 and not self.proxy.query.is_empty():
+            self.count_label.setText(f"{self.count_label.text()}（{elapsed * 1000:.0f} ms）")
+
+    def _on_filter_failed(self, message: str):
+        self.count_label.setText(message)
+
+
+class TableFilterBar(QWidget):
+    """QTableWidget 的搜索栏：隐藏不含全部关键词的行；点击表头按该列排序
+
+    每行的小写文本在第一次搜索时生成并缓存，表格内容或行顺序变化后重新生成。
+    """
+
+    filter_changed = Signal(int, int)  # 显示行数, 总行数
+
+    def __init__(self, table: QTableWidget, parent=None):
+        super().__init__(parent)
+        self.table = table
+        self._row_texts: Optional[List[str]] = None
+        self._hidden: List[bool] = []
+        self.setStyleSheet(FILTER_BAR_STYLE)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(QLabel("搜索"))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("多个关键词用空格分隔")
+        self.search_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.search_edit, 1)
+        self.count_label = QLabel("")
+        layout.addWidget(self.count_label)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FILTER_DELAY_MS)
+        self._timer.timeout.connect(self.apply)
+        self.search_edit.textChanged.connect(lambda: self._timer.start())
+
+        model = table.model()
+        for signal in (model.rowsInserted, model.rowsRemoved, model.modelReset, model.layoutChanged,
+                       model.dataChanged):
+            signal.connect(self._invalidate)
+        # 程序填充表格时会屏蔽 itemChanged 等信号，插入行的信号仍然会发出
+        header = table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.sectionClicked.connect(self.sort_by_column)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def _invalidate(self, *args):
+        self._row_texts = None
+        self._hidden = []
+        if self.search_edit.text().strip():
+            self._timer.start()
+
+    def _build_row_texts(self) -> List[str]:
+        table = self.table
+        columns = range(table.columnCount())
+        texts = []
+        for row in range(table.rowCount()):
+            parts = []
+            for col in columns:
+                item = table.item(row, col)
+                if item is not None:
+                    parts.append(item.text())
+            # 用制表符分隔各列，关键词不会跨列匹配
+            texts.append('\t'.join(parts).lower())
+        return texts
+
+    def apply(self):
+        self._timer.stop()
+        words = self.search_edit.text().lower().split()
+        if self._row_texts is None:
+            self._row_texts = self._build_row_texts() if words else None
+        texts = self._row_texts or []
+        table = self.table
+        count = table.rowCount()
+        if len(self._hidden) != count:
+            self._hidden = [table.isRowHidden(row) for row in range(count)]
+        shown = 0
+        table.setUpdatesEnabled(False)
+        try:
+            for row in range(count):
+                hide = bool(words) and not all(word in texts[row] for word in words)
+                if hide != self._hidden[row]:
+                    table.setRowHidden(row, hide)
+                    self._hidden[row] = hide
+                shown += not hide
+        finally:
+            table.setUpdatesEnabled(True)
+        self.count_label.setText(f"显示 {shown} / {count} 行" if words else "")
+        self.filter_changed.emit(shown, count)
+
+    def sort_by_column(self, column: int):
+        """再次点击同一列时切换升序/降序"""
+        if column == self._sort_column:
+            self._sort_order = (Qt.SortOrder.DescendingOrder if self._sort_order == Qt.SortOrder.AscendingOrder
+                                else Qt.SortOrder.AscendingOrder)
+        else:
+            self._sort_column = column
+            self._sort_order = Qt.SortOrder.AscendingOrder
+        header = self.table.horizontalHeader()
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(column, self._sort_order)
+        # 只排一次，不开启持续排序：程序逐格填充新行时行不会移动
+        self.table.sortItems(column, self._sort_order)
+        self._invalidate()
+        self.apply()
\ No newline at end of file
@@ -0,0 +1,139 @@
+import codecs
+import os
+import sys
+import tempfile
+from typing import List, Optional
+from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, Signal
+
+
+# 训练进程的环境变量，值为停止文件的路径；该文件出现时训练脚本应保存检查点后退出
+STOP_FILE_ENV = 'TRAINING_STOP_FILE'
+
+
+class TrainingRunner(QObject):
+    """用 QProcess 在子进程中运行 train.py，输出通过信号逐段送回界面，不阻塞事件循环
+
+    停止时创建 STOP_FILE_ENV 指向的文件，并在Linux/macOS上发送SIGTERM。Windows上的控制台程序
+    收不到 terminate() 的关闭请求，只能通过停止文件退出；训练脚本不检查该文件时，等待
+    STOP_GRACE_PERIOD_MS 后强制结束。
+    """
+    output = Signal(str, bool)  # 文本, 是否来自stderr
+    started = Signal()
+    finished = Signal(int, str)  # 退出码, 结束说明
+    failed = Signal(str)
+
+    # 请求停止后等待训练脚本自行退出（保存检查点等）的时间，超时后强制结束
+    STOP_GRACE_PERIOD_MS = 10000
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.process = None
+        self._stop_requested = False
+        self._killed = False
+        self._decoders = {}
+        self._stop_file = ""
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.timeout.connect(self.kill)
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.state() != QProcess.NotRunning
+
+    def start(self, script_path: str, args: List[str], working_dir: str = ""):
+        if self.is_running():
+            self.failed.emit("训练进程已在运行")
+            return
+
+        self._stop_requested = False
+        self._killed = False
+        # 子进程输出按UTF-8增量解码，避免多字节字符被拆到两段输出中
+        self._decoders = {
+            False: codecs.getincrementaldecoder('utf-8')(errors='replace'),
+            True: codecs.getincrementaldecoder('utf-8')(errors='replace'),
+        }
+
+        process = QProcess(self)
+        process.setProgram(sys.executable)
+        # -u: 子进程不缓冲输出，日志实时显示
+        process.setArguments(['-u', script_path, *args])
+        process.setWorkingDirectory(working_dir or os.path.dirname(os.path.abspath(script_path)))
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert('PYTHONIOENCODING', 'utf-8')
+        self._stop_file = os.path.join(tempfile.gettempdir(), f"training-stop-{os.getpid()}-{id(process):x}")
+        self._remove_stop_file()
+        environment.insert(STOP_FILE_ENV, self._stop_file)
+        process.setProcessEnvironment(environment)
+
+        process.readyReadStandardOutput.connect(self._read_stdout)
+        process.readyReadStandardError.connect(self._read_stderr)
+        process.started.connect(self.started)
+        process.errorOccurred.connect(self._on_error)
+        process.finished.connect(self._on_finished)
+        self.process = process
+        process.start()
+
+    def stop(self):
+        """请求训练进程退出，超过等待时间仍未退出时强制结束"""
+        if not self.is_running() or self._stop_requested:
+            return
+        self._stop_requested = True
+        try:
+            with open(self._stop_file, 'w', encoding='utf-8'):
+                pass
+        except OSError:
+            pass
+        if sys.platform != 'win32':
+            self.process.terminate()
+        self._kill_timer.start(self.STOP_GRACE_PERIOD_MS)
+
+    def kill(self):
+        """立即强制结束训练进程"""
+        if not self.is_running():
+            return
+        self._killed = True
+        self.process.kill()
+
+    def _remove_stop_file(self):
+        try:
+            os.remove(self._stop_file)
+        except OSError:
+            pass
+
+    def _read_stdout(self):
+        self._emit_output(bytes(self.process.readAllStandardOutput()), False)
+
+    def _read_stderr(self):
+        self._emit_output(bytes(self.process.readAllStandardError()), True)
+
+    def _emit_output(self, data: bytes, is_error: bool):
+        text = self._decoders[is_error].decode(data)
+        if text:
+            self.output.emit(text, is_error)
+
+    def _on_error(self, error):
+        if error == QProcess.FailedToStart:
+            self.failed.emit(f"无法启动训练进程: {self.process.errorString()}")
+            self.process.deleteLater()
+            self.process = None
+
+    def _on_finished(self, exit_code: int, exit_status):
+        self._kill_timer.stop()
+        self._remove_stop_file()
+        self._read_stdout()
+        self._read_stderr()
+        for is_error, decoder in self._decoders.items():
+            text = decoder.decode(b'', final=True)
+            if text:
+                self.output.emit(text, is_error)
+
+        if self._killed:
+            status = "训练进程已被强制结束"
+        elif self._stop_requested:
+            status = "训练进程已停止"
+        elif exit_status == QProcess.CrashExit:
+            status = "训练进程异常退出"
+        else:
+            status = f"训练进程已结束，退出码 {exit_code}"
+        self.process.deleteLater()
+        self.process = None
+        self.finished.emit(exit_code, status)
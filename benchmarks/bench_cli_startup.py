@@ -0,0 +1,52 @@
+"""命令行入口启动开销基准测试：确认 scheduling_core 不会导入Qt，并统计 --help 的启动时间
+
+用法: python benchmarks/bench_cli_startup.py [--runs 10] [--budget-ms 300]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHECK_QT_FREE = (
+    "import sys, scheduling_core.cli, scheduling_core.config_data, "
+    "scheduling_core.schedule_data, scheduling_core.scheduling_engine; "
+    "print(','.join(m for m in ('PySide6', 'PyQt5', 'PyQt6') if m in sys.modules))"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=300.0, help="启动时间中位数上限")
+    args = parser.parse_args()
+
+    loaded = subprocess.run([sys.executable, '-c', CHECK_QT_FREE], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout.strip()
+    if loaded:
+        print(f"错误: scheduling_core 导入了Qt模块: {loaded}")
+        return 1
+
+    baseline = []
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], cwd=ROOT, check=True)
+        baseline.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'scheduling_core', '--help'], cwd=ROOT,
+                       stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+
+    median_ms = statistics.median(timings) * 1000
+    print(f"python 空启动: {statistics.median(baseline) * 1000:.1f} ms, "
+          f"scheduling_core --help: {median_ms:.1f} ms (预算 {args.budget_ms:.0f} ms)")
+    return 0 if median_ms <= args.budget_ms else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
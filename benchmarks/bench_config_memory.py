@@ -0,0 +1,75 @@
+"""管理配置内存基准测试：加载后常驻内存（tracemalloc统计）对比
+
+字典形式为直接解析YAML得到的记录字典；紧凑形式为 load_config 的结果，
+分别测试从YAML解析和从二进制缓存读取两种情况，并列出加载过程中的峰值。
+
+用法: python benchmarks/bench_config_memory.py [--rows 50000 200000] [--employees 5000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_factory, generate_productions  # noqa: E402
+from scheduling_core import config_cache, yaml_backend  # noqa: E402
+from scheduling_core.config_data import load_config, save_config  # noqa: E402
+
+
+def _measure(load):
+    """返回 (常驻字节数, 峰值字节数)；结果在测量结束前一直被引用"""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def _load_yaml_dicts(file_path: str):
+    with open(file_path, 'rb') as f:
+        return yaml_backend.load(f.read())['config']
+
+
+def _load_compact_from_yaml(file_path: str):
+    try:
+        os.remove(config_cache.cache_path(file_path))
+    except OSError:
+        pass
+    # 写缓存不计入：先删除缓存文件再加载，加载后会重新写入
+    return load_config(file_path)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[50_000, 200_000])
+    parser.add_argument('--employees', type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            file_path = os.path.join(directory, f'config_{rows}.yml')
+            _, config = generate_factory(args.employees, 100)
+            config['productions'] = generate_productions(rows)
+            save_config(config, file_path)
+            del config
+
+            print(f"{rows} 条生产记录, {args.employees} 名员工:")
+            dicts, dicts_peak = _measure(lambda: _load_yaml_dicts(file_path))
+            results = [
+                ("字典形式(YAML)", dicts, dicts_peak),
+                ("紧凑形式(YAML)", *_measure(lambda: _load_compact_from_yaml(file_path))),
+                ("紧凑形式(缓存)", *_measure(lambda: load_config(file_path)[0])),
+            ]
+            for label, current, peak in results:
+                print(f"  {label:<12} 常驻 {current / 2**20:8.1f} MB ({current / rows:6.0f} 字节/行, "
+                      f"{dicts / current:5.1f}x)  峰值 {peak / 2**20:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""增量求解基准测试：小幅修改排班参数后，增量求解与完整求解的耗时和目标值对比
+
+用法: python benchmarks/bench_incremental_solve.py [--employees 200000] [--pns 2000]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_factory  # noqa: E402
+from scheduling_core.config_index import ConfigIndex  # noqa: E402
+from scheduling_core.scheduling_engine import IncrementalSolver, solve  # noqa: E402
+
+
+def _edits(schedule):
+    """(说明, 修改后的排班参数)，每次修改都基于上一次的结果"""
+    demands = schedule['demands']
+    first, middle = demands[0]['P_N'], demands[len(demands) // 2]['P_N']
+
+    def with_demand(data, pn, factor):
+        return dict(data, demands=[dict(item, demand=item['demand'] * factor) if item['P_N'] == pn else item
+                                   for item in data['demands']])
+
+    edited = with_demand(schedule, first, 1.5)
+    yield f"{first} 需求 +50%", edited
+    edited = with_demand(edited, middle, 0.5)
+    yield f"{middle} 需求 -50%", edited
+    edited = dict(edited, day_shift_hours=edited['day_shift_hours'] - 2,
+                  night_shift_hours=edited['night_shift_hours'] + 2)
+    yield "白班 -2 小时、夜班 +2 小时", edited
+    edited = dict(edited, demands=[item for item in edited['demands'] if item['P_N'] != first])
+    yield f"删除 {first}", edited
+
+
+def _check(result, config):
+    """同一员工只排一次，且工位与岗位一致"""
+    counts = Counter(assignment.employee_id for assignment in result.assignments)
+    if counts and counts.most_common(1)[0][1] > 1:
+        return "有员工被重复安排"
+    stations = {employee['工号']: employee['工位'] for employee in config['employees']}
+    if any(stations[a.employee_id] != a.station for a in result.assignments):
+        return "有员工被安排到不符的工位"
+    return "分配有效"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--employees', type=int, default=200_000)
+    parser.add_argument('--pns', type=int, default=2000)
+    args = parser.parse_args()
+
+    schedule, config = generate_factory(args.employees, args.pns)
+    index = ConfigIndex.from_config(config)
+    solver = IncrementalSolver(config, index)
+    start = time.perf_counter()
+    solver.solve(schedule)
+    print(f"{args.employees} 名员工, {args.pns} 个P/N, 首次完整求解 {time.perf_counter() - start:.2f}s")
+
+    for label, edited in _edits(schedule):
+        start = time.perf_counter()
+        incremental = solver.resolve(edited)
+        incremental_time = time.perf_counter() - start
+        full = solve(edited, config, index=index)
+        print(f"[{label}] 增量 {incremental_time * 1000:.0f} ms (缺口 {incremental.objective:g}, "
+              f"{incremental.employees_used} 人, {_check(incremental, config)}) / "
+              f"完整 {full.solve_time * 1000:.0f} ms (缺口 {full.objective:g}, {full.employees_used} 人)")
+
+
+if __name__ == '__main__':
+    main()
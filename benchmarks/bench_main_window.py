@@ -0,0 +1,77 @@
+"""主界面启动基准测试：按需创建标签页与一次性创建全部页面的首个窗口绘制时间对比
+
+每种模式在独立进程中运行，计时从导入 main 开始，到主界面第一次绘制结束（含页面模块的导入）。
+用法: python benchmarks/bench_main_window.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ('eager', 'lazy', 'lazy+prebuild')
+
+
+def run_child(mode: str):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    sys.path.insert(0, ROOT)
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication([])
+    start = time.perf_counter()
+    import main
+
+    window = main.MainWindow(prebuild_pages=(mode == 'lazy+prebuild'))
+    if mode == 'eager':
+        window.build_all_pages()
+    constructed = time.perf_counter() - start
+    timings = {}
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint' not in timings:
+                # 绘制事件处理完成后再记录
+                QTimer.singleShot(0, lambda: timings.setdefault('first_paint', time.perf_counter() - start))
+            return False
+
+    paint_filter = FirstPaint()
+    window.installEventFilter(paint_filter)
+    window.show()
+    while 'first_paint' not in timings:
+        app.processEvents()
+    if mode == 'lazy+prebuild':
+        # 预创建在首次绘制之后进行，记录全部页面就绪的时间
+        while not all(window.is_page_built(attr) for attr, _, _, _ in main.PAGES):
+            app.processEvents()
+        timings['all_pages'] = time.perf_counter() - start
+    timings['construct'] = constructed
+    print(json.dumps(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    for mode in MODES:
+        samples = []
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode],
+                                    cwd=ROOT, capture_output=True, text=True, check=True).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+        summary = ", ".join(f"{key}={statistics.median(s[key] for s in samples) * 1000:.0f} ms"
+                            for key in samples[0])
+        print(f"{mode:>14}: {summary}")
+
+
+if __name__ == '__main__':
+    main()
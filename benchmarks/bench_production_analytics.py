@@ -0,0 +1,49 @@
+"""生产统计基准测试：全量分组计算与单行增删的增量更新耗时
+
+用法: python benchmarks/bench_production_analytics.py [--rows 100000 1000000] [--updates 1000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_productions  # noqa: E402
+from scheduling_core.production_analytics import DIMENSIONS, ProductionAnalytics  # noqa: E402
+from scheduling_core.production_store import ProductionColumns  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--updates', type=int, default=1000)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        records = generate_productions(rows)
+        columns = ProductionColumns.from_records(records)
+        for name, fields in DIMENSIONS.items():
+            start = time.perf_counter()
+            analytics = ProductionAnalytics(columns, fields)
+            rebuild = time.perf_counter() - start
+
+            # 只计统计更新本身，不计列数据的增删
+            update = 0.0
+            for record in records[:args.updates]:
+                columns.append_record(record)
+                start = time.perf_counter()
+                analytics.add_rows(len(columns) - 1, len(columns))
+                update += time.perf_counter() - start
+            for _ in range(args.updates):
+                start = time.perf_counter()
+                analytics.remove_rows(0, 1)
+                update += time.perf_counter() - start
+                columns.remove_range(0, 1)
+            update /= 2 * args.updates
+            print(f"{rows:>9} 行 [{name}] {len(analytics.groups)} 组: 全量计算 {rebuild:.2f}s, "
+                  f"单行增删 {update * 1e6:.0f} µs")
+
+
+if __name__ == '__main__':
+    main()
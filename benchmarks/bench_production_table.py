@@ -0,0 +1,77 @@
+"""生产情况表格打开耗时基准测试
+
+用法: QT_QPA_PLATFORM=offscreen python benchmarks/bench_production_table.py [--rows 100000 1000000] [--legacy]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem  # noqa: E402
+from benchmarks.datagen import generate_productions  # noqa: E402
+from ManagementPage import ManagementPage  # noqa: E402
+
+
+def bench_model_view(app, page, records):
+    start = time.perf_counter()
+    page.set_production_data(records)
+    filled = time.perf_counter()
+    page.production_table.viewport().repaint()
+    app.processEvents()
+    painted = time.perf_counter()
+    page.get_production_data()
+    exported = time.perf_counter()
+    return {
+        'set_production_data': filled - start,
+        'first_paint': painted - filled,
+        'get_production_data': exported - painted,
+    }
+
+
+def bench_legacy_widget(app, records):
+    """原先逐行 insertRow + setItem 的写法，仅用于对比"""
+    table = QTableWidget()
+    table.setColumnCount(8)
+    table.show()
+    start = time.perf_counter()
+    for prod in records:
+        row = table.rowCount()
+        table.insertRow(row)
+        table.setItem(row, 0, QTableWidgetItem(prod['排班批次']))
+        table.setItem(row, 1, QTableWidgetItem(prod['日期']))
+        table.setItem(row, 2, QTableWidgetItem(prod['班次']))
+        table.setItem(row, 3, QTableWidgetItem(prod['P/N']))
+        table.setItem(row, 4, QTableWidgetItem(prod['设备']))
+        table.setItem(row, 5, QTableWidgetItem(prod['姓名']))
+        table.setItem(row, 6, QTableWidgetItem(str(prod['产出'])))
+        table.setItem(row, 7, QTableWidgetItem(str(prod['工时'])))
+    app.processEvents()
+    return {'set_production_data': time.perf_counter() - start}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--legacy', action='store_true', help='同时测量旧的QTableWidget写法（只建议在小数据量下使用）')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    page = ManagementPage()
+    page.resize(1200, 800)
+    page.show()
+    app.processEvents()
+
+    for rows in args.rows:
+        records = generate_productions(rows)
+        result = bench_model_view(app, page, records)
+        print(f"[model/view] {rows:>9} 行: " + ", ".join(f"{k}={v:.3f}s" for k, v in result.items()))
+        if args.legacy:
+            result = bench_legacy_widget(app, records)
+            print(f"[legacy]     {rows:>9} 行: " + ", ".join(f"{k}={v:.3f}s" for k, v in result.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""批量删除行基准测试：逐行 removeRow 与按连续区间删除的对比
+
+分别测试连续选中（一个区间）和隔行选中（每行一个区间）两种选择方式。
+用法: QT_QPA_PLATFORM=offscreen python benchmarks/bench_row_deletion.py [--rows 100000] [--delete 10000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import QItemSelection, QItemSelectionModel  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from benchmarks.datagen import generate_productions  # noqa: E402
+from ManagementPage import ManagementPage  # noqa: E402
+
+
+def select_rows(view, rows):
+    model = view.model()
+    selection = QItemSelection()
+    last_column = model.columnCount() - 1
+    for row in rows:
+        selection.select(model.index(row, 0), model.index(row, last_column))
+    view.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+
+
+def legacy_delete(page, view):
+    """原先的写法：选中行逐行 removeRow"""
+    rows = {index.row() for index in view.selectionModel().selectedRows()}
+    for row in sorted(rows, reverse=True):
+        view.model().removeRow(row)
+
+
+def run(app, page, records, rows, legacy: bool) -> float:
+    page.set_production_data(records)
+    view = page.production_table
+    select_rows(view, rows)
+    app.processEvents()
+    start = time.perf_counter()
+    if legacy:
+        legacy_delete(page, view)
+    else:
+        page.delete_production()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    assert len(page.production_model.columns()) == len(records) - len(rows)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--delete', type=int, default=10_000)
+    parser.add_argument('--legacy-max', type=int, default=2_000,
+                        help="逐行删除最多测试的行数，超过时按比例估算")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    page = ManagementPage()
+    page.show_custom_message = lambda *a: None
+    page.resize(1200, 800)
+    page.show()
+    records = generate_productions(args.rows)
+
+    selections = {
+        '连续': list(range(1000, 1000 + args.delete)),
+        '隔行': list(range(0, args.delete * 2, 2)),
+    }
+    for name, rows in selections.items():
+        ranged = run(app, page, records, rows, legacy=False)
+        legacy_rows = rows[:args.legacy_max]
+        legacy = run(app, page, records, legacy_rows, legacy=True)
+        estimate = "" if len(legacy_rows) == len(rows) else f"（按 {len(legacy_rows)} 行估算）"
+        legacy *= len(rows) / len(legacy_rows)
+        print(f"{name}删除 {len(rows)}/{args.rows} 行: 区间删除 {ranged:.3f}s, 逐行删除 {legacy:.2f}s{estimate}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""方案对比基准测试：多个排班方案依次求解与进程池并行求解的耗时
+
+用法: python benchmarks/bench_scenarios.py [--employees 20000] [--pns 200] [--workers 4]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_factory  # noqa: E402
+from scheduling_core.config_index import ConfigIndex  # noqa: E402
+from scheduling_core.scenarios import build_scenarios, default_workers, iter_scenario_results  # noqa: E402
+from scheduling_core.scheduling_engine import solve  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--employees', type=int, default=20_000)
+    parser.add_argument('--pns', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    schedule, config = generate_factory(args.employees, args.pns)
+    scenarios = build_scenarios(schedule, [30, 40, 50], [0.9, 1.0, 1.1])
+    workers = args.workers or default_workers(len(scenarios))
+
+    # 依次求解时同样只建立一次索引，只比较并行本身带来的差异
+    start = time.perf_counter()
+    index = ConfigIndex.from_config(config)
+    for scenario in scenarios:
+        solve(scenario.schedule, config, index=index)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    outcomes = list(iter_scenario_results(scenarios, config, max_workers=workers))
+    parallel = time.perf_counter() - start
+    errors = [outcome.error for outcome in outcomes if outcome.result is None]
+
+    print(f"{len(scenarios)} 个方案, {args.employees} 名员工, {args.pns} 个P/N")
+    print(f"依次求解: {sequential:.2f}s")
+    print(f"并行求解({workers} 进程，含进程启动): {parallel:.2f}s, 加速 {sequential / parallel:.1f}x")
+    if errors:
+        print(f"求解出错: {errors[0]}")
+
+
+if __name__ == '__main__':
+    main()
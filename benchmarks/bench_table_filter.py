@@ -0,0 +1,48 @@
+"""生产情况筛选与排序基准测试：典型筛选条件、关键词搜索和按列排序的耗时
+
+用法: python benchmarks/bench_table_filter.py [--rows 100000 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_productions  # noqa: E402
+from scheduling_core.production_filter import (  # noqa: E402
+    ProductionQuery, ProductionSearchIndex, filter_rows, sort_rows
+)
+from scheduling_core.production_store import ProductionColumns  # noqa: E402
+
+QUERIES = [
+    ("日期范围", ProductionQuery(date_from='2024-03-01', date_to='2024-03-31')),
+    ("班次+P/N", ProductionQuery(shift='夜班', pn='pn-01')),
+    ("姓名", ProductionQuery(name='员工0012')),
+    ("关键词", ProductionQuery(text='dev-01 白班')),
+    ("组合条件", ProductionQuery(date_from='2024-06-01', date_to='2024-08-31', shift='白班', text='pn-00')),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        columns = ProductionColumns.from_records(generate_productions(rows))
+        index = ProductionSearchIndex()
+        print(f"{rows} 行:")
+        for label, query in QUERIES:
+            start = time.perf_counter()
+            matched = filter_rows(columns, query, index)
+            elapsed = time.perf_counter() - start
+            print(f"  筛选 {label:<6} {len(matched):>8} 行 {elapsed * 1000:8.1f} ms")
+        for field in ('日期', '产出'):
+            start = time.perf_counter()
+            sort_rows(columns, None, field, descending=True)
+            print(f"  按 {field} 排序全部行 {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
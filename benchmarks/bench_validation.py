@@ -0,0 +1,55 @@
+"""数据校验基准测试：管理配置和排班参数的校验吞吐量（条/秒）
+
+每种规模分别测试全部有效的数据，以及末尾有一条错误记录、需要逐个查找出错行的数据。
+
+用法: python benchmarks/bench_validation.py [--rows 10000 100000 1000000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_factory, generate_productions  # noqa: E402
+from scheduling_core.schema import validate_config, validate_schedule  # noqa: E402
+
+
+def _best_time(validate, document, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, records: int, elapsed: float):
+    print(f"  {label:<14} {elapsed * 1000:9.1f} ms  {records / elapsed:>14,.0f} 条/秒")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        schedule, config = generate_factory(rows, 50)
+        config['productions'] = generate_productions(rows)
+        config_records = sum(len(config[key]) for key in ('employees', 'lines', 'special_stations', 'productions'))
+        schedule['demands'] = [{'P_N': f'PN-{i:07d}', 'demand': float(i % 1000 + 1)} for i in range(rows)]
+        print(f"{rows} 行:")
+
+        _report("管理配置", config_records, _best_time(validate_config, config, args.repeat))
+        _report("排班参数", rows, _best_time(validate_schedule, schedule, args.repeat))
+
+        # 最后一条记录出错，整列快速检查失败后逐个查找
+        config['productions'][-1]['产出'] = '无'
+        schedule['demands'][-1]['demand'] = 0
+        _report("管理配置(有错)", config_records, _best_time(validate_config, config, args.repeat))
+        _report("排班参数(有错)", rows, _best_time(validate_schedule, schedule, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""管理配置YAML读写基准测试：纯Python与libyaml、整体dump与流式写出、二进制缓存对比
+
+用法: python benchmarks/bench_yaml_io.py [--rows 10000 100000]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yaml  # noqa: E402
+from scheduling_core import config_cache  # noqa: E402
+from scheduling_core import yaml_backend  # noqa: E402
+from benchmarks.datagen import generate_productions  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"libyaml 可用: {yaml_backend.LIBYAML_AVAILABLE}")
+    for rows in args.rows:
+        config = {
+            'employees_excel_path': "",
+            'employees': [],
+            'lines': [],
+            'special_stations': [],
+            'productions': generate_productions(rows)
+        }
+
+        dump_py, text = timed(lambda: yaml.dump({'config': config}, allow_unicode=True, sort_keys=False))
+        results = {'dump[python]': dump_py}
+        if yaml_backend.LIBYAML_AVAILABLE:
+            results['dump[libyaml]'], _ = timed(lambda: yaml_backend.dump({'config': config}))
+
+        def streaming():
+            buffer = io.StringIO()
+            yaml_backend.dump_document_streaming(buffer, 'config', config, ('productions',))
+            return buffer
+        results['dump[libyaml+streaming]'], _ = timed(streaming)
+
+        results['load[python]'], _ = timed(lambda: yaml.load(text, Loader=yaml.SafeLoader))
+        if yaml_backend.LIBYAML_AVAILABLE:
+            results['load[libyaml]'], _ = timed(lambda: yaml_backend.load(text))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'config.yml')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            results['cache[store]'], _ = timed(lambda: config_cache.store(file_path, config))
+            results['load[cache]'], _ = timed(lambda: config_cache.load(file_path))
+
+        print(f"{rows:>9} 行 ({len(text.encode('utf-8')) / 1e6:.1f} MB): "
+              + ", ".join(f"{k}={v:.2f}s" for k, v in results.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""基准测试使用的模拟数据生成"""
+import random
+from typing import Dict, List, Tuple
+
+STATIONS = ['上料', '焊接', '检测', '包装', '组装', '测试']
+
+
+def generate_factory(employees: int, pns: int, seed: int = 1) -> Tuple[Dict, Dict]:
+    """随机生成 (排班参数, 管理配置)：每个P/N三条拉线，员工随机分配到拉线的某个工位"""
+    rng = random.Random(seed)
+    names = [f'PN-{i:04d}' for i in range(pns)]
+    lines = [{'设备编号': f'D{i}-{k}', 'P/N': pn, '所需工位': rng.sample(STATIONS, 4)}
+             for i, pn in enumerate(names) for k in range(3)]
+    staff = []
+    for i in range(employees):
+        line = rng.choice(lines)
+        staff.append({'工号': str(100000 + i), '姓名': f'员工{i:05d}', '设备编号': line['设备编号'],
+                      'P/N': line['P/N'], '工位': rng.choice(line['所需工位']), '基础产出': rng.randint(5, 30)})
+    config = {'employees_excel_path': '', 'employees': staff, 'lines': lines,
+              'special_stations': [{'特殊工位类型': '焊接'}], 'productions': []}
+    schedule = {'total_work_hours': 60, 'day_shift_hours': 40, 'night_shift_hours': 20,
+                'demands': [{'P_N': pn, 'demand': float(rng.randint(500, 3000))} for pn in names]}
+    return schedule, config
+
+
+def generate_productions(count: int, seed: int = 0) -> List[Dict]:
+    """生成 count 条生产情况记录，取值分布接近车间实际数据"""
+    rng = random.Random(seed)
+    pns = [f"PN-{i:04d}" for i in range(200)]
+    devices = [f"DEV-{i:03d}" for i in range(80)]
+    names = [f"员工{i:05d}" for i in range(3000)]
+    records = []
+    for i in range(count):
+        records.append({
+            '排班批次': f"B{i // 500:05d}",
+            '日期': f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            '班次': '白班' if rng.random() < 0.6 else '夜班',
+            'P/N': rng.choice(pns),
+            '设备': rng.choice(devices),
+            '姓名': rng.choice(names),
+            '产出': float(rng.randint(50, 400)),
+            '工时': float(rng.choice([8, 10, 11, 12]))
+        })
+    return records
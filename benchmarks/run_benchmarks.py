@@ -0,0 +1,265 @@
+"""界面数据路径的基准测试套件：用模拟数据计时主要操作，结果保存为JSON并与基线对比
+
+无界面运行（QT_QPA_PLATFORM=offscreen），包括：
+* ManagementPage 各表格的 set_*_data / get_*_data；
+* SchedulingPage 的 load_data_to_ui / get_current_data；
+* YamlManager、ScheduleDataManager 的保存和加载（管理配置分别测试解析YAML和读取二进制缓存）；
+* validate_config 在 1k/10k/100k/1M 条生产记录下的耗时。
+每项重复 --repeat 次，记录最短和中位耗时。与基线比较时只看最短耗时：比基线慢超过 --threshold
+且绝对差值超过 --min-delta-ms 的项记为回归，有回归时以状态码1退出。
+基线与本机的平台、CPU数量或libyaml设置不同时耗时没有可比性，只打印对比和警告，不判定回归；
+请在本机用 --save-baseline 生成基线。
+
+用法:
+  python benchmarks/run_benchmarks.py                                  # 运行并与 benchmarks/baseline.json 对比
+  python benchmarks/run_benchmarks.py --output results.json            # 同时保存本次结果
+  python benchmarks/run_benchmarks.py --save-baseline                  # 用本次结果更新基线
+  python benchmarks/run_benchmarks.py --quick --filter management      # 只运行最小规模、名称含 management 的项
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import __version__ as PYSIDE_VERSION  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from benchmarks.datagen import generate_factory, generate_productions  # noqa: E402
+from scheduling_core import config_cache, yaml_backend  # noqa: E402
+from scheduling_core.schema import validate_config  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+FORMAT_VERSION = 1
+# 这些环境信息不同时，与基线的耗时对比不作为回归判定
+COMPARABLE_ENVIRONMENT = ('platform', 'machine', 'cpus', 'libyaml')
+
+# 各组的数据规模（行数）；--quick 时每组只运行最小的规模
+SIZES = {
+    'employees': [1_000, 10_000],
+    'productions': [10_000, 100_000],
+    'demands': [100, 1_000],
+    'special_stations': [100, 1_000],
+    'yaml_productions': [10_000, 100_000],
+    'validate': [1_000, 10_000, 100_000, 1_000_000],
+}
+
+
+class Case(NamedTuple):
+    name: str
+    rows: int
+    run: Callable[[], object]
+    # 每次计时前调用，不计入耗时（例如删除缓存文件）
+    before: Optional[Callable[[], None]] = None
+
+
+def _time_case(case: Case, repeat: int) -> Dict:
+    samples = []
+    for _ in range(repeat):
+        if case.before is not None:
+            case.before()
+        gc.collect()
+        start = time.perf_counter()
+        case.run()
+        samples.append(time.perf_counter() - start)
+    return {'rows': case.rows, 'best': min(samples), 'median': statistics.median(samples), 'repeat': repeat}
+
+
+def _sizes(group: str, quick: bool) -> List[int]:
+    return SIZES[group][:1] if quick else SIZES[group]
+
+
+# ---- 测试项 ----
+
+def management_cases(quick: bool) -> Iterator[Case]:
+    from ManagementPage import ManagementPage
+    page = ManagementPage()
+    for rows in _sizes('employees', quick):
+        _, config = generate_factory(rows, max(1, rows // 30))
+        for section, setter, getter in (
+                ('employees', page.set_employee_data, page.get_employee_data),
+                ('lines', page.set_line_data, page.get_line_data)):
+            records = config[section]
+            yield Case(f'management.set_{section}', len(records), lambda s=setter, r=records: s(r))
+            yield Case(f'management.get_{section}', len(records), getter)
+    for rows in _sizes('special_stations', quick):
+        stations = [{'特殊工位类型': f'工位{i}'} for i in range(rows)]
+        yield Case('management.set_special_stations', rows, lambda s=stations: page.set_special_station_data(s))
+        yield Case('management.get_special_stations', rows, page.get_special_station_data)
+    for rows in _sizes('productions', quick):
+        records = generate_productions(rows)
+        yield Case('management.set_productions', rows, lambda r=records: page.set_production_data(r))
+        yield Case('management.get_productions', rows, page.get_production_data)
+    page.deleteLater()
+
+
+def scheduling_cases(quick: bool) -> Iterator[Case]:
+    from SchedulingPage import SchedulingPage
+    page = SchedulingPage()
+    for rows in _sizes('demands', quick):
+        data = {'total_work_hours': 60.0, 'day_shift_hours': 40.0, 'night_shift_hours': 20.0,
+                'demands': [{'P_N': f'PN-{i:05d}', 'demand': float(i % 1000 + 1)} for i in range(rows)]}
+        yield Case('scheduling.load_data_to_ui', rows, lambda d=data: page.load_data_to_ui(d))
+        yield Case('scheduling.get_current_data', rows, page.get_current_data)
+    page.deleteLater()
+
+
+def file_cases(quick: bool, directory: str) -> Iterator[Case]:
+    from yaml_ManagementDataManager import YamlManager
+    from yaml_ScheduleDataManager import ScheduleDataManager
+
+    for rows in _sizes('yaml_productions', quick):
+        _, config = generate_factory(1000, 30)
+        config['productions'] = generate_productions(rows)
+        file_path = os.path.join(directory, f'config_{rows}.yml')
+
+        def drop_cache(path=file_path):
+            try:
+                os.remove(config_cache.cache_path(path))
+            except OSError:
+                pass
+
+        yield Case('yaml_manager.save', rows, lambda c=config, p=file_path: YamlManager.save_to_yaml(c, p))
+        yield Case('yaml_manager.load[yaml]', rows, lambda p=file_path: YamlManager.load_from_yaml(p), drop_cache)
+        # 上一项最后一次加载已重建缓存
+        yield Case('yaml_manager.load[cache]', rows, lambda p=file_path: YamlManager.load_from_yaml(p))
+
+    for rows in _sizes('demands', quick):
+        schedule, _ = generate_factory(0, rows)
+        file_path = os.path.join(directory, f'schedule_{rows}.yml')
+        yield Case('schedule_manager.save', rows, lambda s=schedule, p=file_path: ScheduleDataManager.save_to_yaml(s, p))
+        yield Case('schedule_manager.load', rows, lambda p=file_path: ScheduleDataManager.load_from_yaml(p))
+
+
+def validation_cases(quick: bool) -> Iterator[Case]:
+    for rows in _sizes('validate', quick):
+        _, config = generate_factory(1000, 30)
+        config['productions'] = generate_productions(rows)
+        yield Case('validate_config', rows, lambda c=config: validate_config(c))
+
+
+# ---- 结果与基线 ----
+
+def case_key(name: str, rows: int) -> str:
+    return f'{name}[{rows}]'
+
+
+def environment() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'pyside6': PYSIDE_VERSION,
+        'libyaml': yaml_backend.LIBYAML_AVAILABLE,
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def run_suite(args) -> Dict:
+    app = QApplication.instance() or QApplication([])
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # 页面的自动保存和排班结果缓存写入临时目录，不影响本机数据
+        os.environ['AI_SCHEDULING_AUTOSAVE_DIR'] = os.path.join(directory, 'autosave')
+        os.environ['AI_SCHEDULING_CACHE_DIR'] = os.path.join(directory, 'results')
+        groups = [management_cases(args.quick), scheduling_cases(args.quick),
+                  file_cases(args.quick, directory), validation_cases(args.quick)]
+        for cases in groups:
+            for case in cases:
+                key = case_key(case.name, case.rows)
+                if args.filter and not any(word in key for word in args.filter):
+                    continue
+                results[key] = _time_case(case, args.repeat)
+                # 处理计时期间积压的事件（如模型重置后的重新布局），不计入下一项
+                app.processEvents()
+                print(f"  {key:<44} 最短 {results[key]['best'] * 1000:10.2f} ms  "
+                      f"中位 {results[key]['median'] * 1000:10.2f} ms", flush=True)
+    return {'version': FORMAT_VERSION, 'environment': environment(), 'results': results}
+
+
+def environment_differences(current: Dict, baseline: Dict) -> List[str]:
+    """本次运行与基线在 COMPARABLE_ENVIRONMENT 上的差异说明"""
+    now = current.get('environment', {})
+    then = baseline.get('environment', {})
+    return [f"{key}: 基线 {then.get(key, '未知')}，本机 {now.get(key)}"
+            for key in COMPARABLE_ENVIRONMENT if then.get(key) != now.get(key)]
+
+
+def compare(current: Dict, baseline: Dict, threshold: float, min_delta: float) -> List[str]:
+    """打印与基线的对比，返回回归的测试项"""
+    regressions = []
+    old_results = baseline.get('results', {})
+    print(f"\n与基线对比（基线记录于 {baseline.get('environment', {}).get('date', '未知时间')}）:")
+    for key, result in current['results'].items():
+        old = old_results.get(key)
+        if old is None:
+            print(f"  {key:<44} 新增")
+            continue
+        change = result['best'] / old['best'] - 1 if old['best'] > 0 else 0.0
+        delta = result['best'] - old['best']
+        mark = ""
+        if change > threshold and delta > min_delta:
+            mark = "  <-- 回归"
+            regressions.append(key)
+        elif change < -threshold and -delta > min_delta:
+            mark = "  改善"
+        print(f"  {key:<44} {old['best'] * 1000:10.2f} -> {result['best'] * 1000:10.2f} ms "
+              f"({change:+7.1%}){mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--quick', action='store_true', help='每组只运行最小的数据规模')
+    parser.add_argument('--filter', nargs='+', help='只运行名称包含任一关键字的测试项')
+    parser.add_argument('--output', help='本次结果的JSON文件路径')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='基线JSON文件路径')
+    parser.add_argument('--save-baseline', action='store_true', help='用本次结果覆盖基线')
+    parser.add_argument('--threshold', type=float, default=0.25, help='比基线慢多少（比例）算回归')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help='绝对差值小于此值时不算回归')
+    args = parser.parse_args()
+
+    print(f"Python {platform.python_version()}, PySide6 {PYSIDE_VERSION}, libyaml: {yaml_backend.LIBYAML_AVAILABLE}")
+    current = run_suite(args)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n基线已保存到 {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"\n没有基线文件 {args.baseline}，使用 --save-baseline 创建")
+        return
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms / 1000)
+    differences = environment_differences(current, baseline)
+    if differences:
+        print("\n警告: 基线记录于不同的环境，耗时对比仅供参考，不判定回归:")
+        for line in differences:
+            print(f"  {line}")
+        print(f"请在本机运行 --save-baseline 生成基线（{args.baseline}）")
+        return
+    if regressions:
+        print(f"\n{len(regressions)} 项比基线慢 {args.threshold:.0%} 以上: {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n没有发现性能回归")
+
+
+if __name__ == '__main__':
+    main()
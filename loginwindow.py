@@ -1,12 +1,11 @@
-from PySide6.QtWidgets import QApplication, QFrame, QHBoxLayout, QVBoxLayout, QLabel, \
-    QLineEdit, QPushButton
-from PySide6 import QtGui, QtCore
-import main  # 导入主界面所在的模块
+import multiprocessing
 
-app = QApplication([])
+from StartupTrace import trace  # 最先导入，才能记录PySide6的导入耗时
 
-pixmap_logo = QtGui.QPixmap('icons/logo.png')
-app.setWindowIcon(pixmap_logo)
+with trace.span("import PySide6"):
+    from PySide6.QtWidgets import QApplication, QFrame, QHBoxLayout, QVBoxLayout, QLabel, \
+        QLineEdit, QPushButton
+    from PySide6 import QtGui, QtCore
 
 
 class LoginWindow(QFrame):
@@ -36,6 +35,9 @@ class LoginWindow(QFrame):
 
         layout.addStretch()  # layout 结尾 `addStretch`
 
+        self.main_window = None
+        self._warm_up_scheduled = False
+
     def titleLayout(self):
         layout = QHBoxLayout()
 
@@ -118,13 +120,49 @@ class LoginWindow(QFrame):
 
         return box
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._warm_up_scheduled:
+            # 登录界面第一次绘制之后，在空闲时预先导入并创建主界面
+            self._warm_up_scheduled = True
+            QtCore.QTimer.singleShot(0, self.warm_up_main_window)
+
+    def warm_up_main_window(self):
+        """用户输入账号密码时创建主界面（隐藏），其余标签页在空闲时逐个创建"""
+        if self.main_window is not None:
+            return
+        with trace.span("import main"):
+            import main  # 导入主界面所在的模块
+        with trace.span("construct MainWindow"):
+            self.main_window = main.MainWindow(prebuild_pages=True)
+        trace.mark("main window warmed up")
+
     def show_main_window(self):
-        self.main_window = main.MainWindow()  # 创建主界面实例
+        trace.mark("login clicked")
+        self.warm_up_main_window()
+        trace.watch_first_paint(self.main_window, "main window first paint")
         self.main_window.show()  # 显示主界面
         self.hide()  # 隐藏登录界面
+        # 主界面显示后再询问是否恢复上次未保存的修改
+        QtCore.QTimer.singleShot(0, self.main_window.restore_autosave)
+
+
+def main():
+    app = QApplication([])
+
+    pixmap_logo = QtGui.QPixmap('icons/logo.png')
+    app.setWindowIcon(pixmap_logo)
+
+    with trace.span("construct LoginWindow"):
+        lw = LoginWindow()
+    trace.watch_first_paint(lw, "login window first paint")
+    lw.show()
 
+    app.aboutToQuit.connect(trace.write)
+    app.exec()
 
-lw = LoginWindow()
-lw.show()
 
-app.exec()
\ No newline at end of file
+if __name__ == '__main__':
+    # 打包成exe后方案对比的工作进程也从这里启动
+    multiprocessing.freeze_support()
+    main()
\ No newline at end of file
@@ -1,14 +1,25 @@
+import importlib
 import sys
+import time
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QTabWidget
+    QApplication, QWidget, QVBoxLayout, QTabWidget, QMessageBox
 )
+from PySide6.QtCore import QTimer
 from PySide6 import QtGui
-from SchedulingPage import SchedulingPage
-from ModelTrainingPage import ModelTrainingPage
-from ManagementPage import ManagementPage
+from StartupTrace import trace
+
+# (属性名, 标签标题, 模块名, 类名)，页面在第一次切换到对应标签时才导入和创建
+PAGES = [
+    ('model_training_page', "模型训练界面", 'ModelTrainingPage', 'ModelTrainingPage'),
+    ('scheduling_page', "排班界面", 'SchedulingPage', 'SchedulingPage'),
+    ('management_page', "管理界面", 'ManagementPage', 'ManagementPage'),
+]
+# 空闲预创建时，每创建一个页面后让出事件循环的时间（毫秒）
+PREBUILD_INTERVAL_MS = 100
+
 
 class MainWindow(QWidget):
-    def __init__(self):
+    def __init__(self, prebuild_pages: bool = False):
         super().__init__()
         self.setWindowTitle('智能排班系统')
         self.setMinimumSize(800, 600)  # 改为不是固定尺寸
@@ -16,14 +27,16 @@ class MainWindow(QWidget):
         # 创建 QTabWidget 用于切换界面
         self.tab_widget = QTabWidget()
 
-        # 创建页面并添加到 QTabWidget
-        self.model_training_page = ModelTrainingPage()
-        self.management_page = ManagementPage()
-        self.scheduling_page = SchedulingPage()
-
-        self.tab_widget.addTab(self.model_training_page, "模型训练界面")
-        self.tab_widget.addTab(self.scheduling_page, "排班界面")
-        self.tab_widget.addTab(self.management_page, "管理界面")
+        # 先放入空的占位页面，切换到标签时再创建真正的页面
+        self._pages = {}
+        self._placeholders = []
+        for attr, title, _, _ in PAGES:
+            placeholder = QWidget()
+            layout = QVBoxLayout(placeholder)
+            layout.setContentsMargins(0, 0, 0, 0)
+            self._placeholders.append(placeholder)
+            self.tab_widget.addTab(placeholder, title)
+        self.tab_widget.currentChanged.connect(self.ensure_page_at)
 
         # 主布局
         main_layout = QVBoxLayout()
@@ -34,6 +47,89 @@ class MainWindow(QWidget):
         # 应用美化样式
         self.apply_stylesheet()
 
+        self.ensure_page_at(self.tab_widget.currentIndex())
+        if prebuild_pages:
+            self._prebuild_timer = QTimer(self)
+            self._prebuild_timer.setSingleShot(True)
+            self._prebuild_timer.timeout.connect(self._prebuild_next_page)
+            self._prebuild_timer.start(PREBUILD_INTERVAL_MS)
+
+    @property
+    def model_training_page(self):
+        return self.ensure_page('model_training_page')
+
+    @property
+    def scheduling_page(self):
+        return self.ensure_page('scheduling_page')
+
+    @property
+    def management_page(self):
+        return self.ensure_page('management_page')
+
+    def is_page_built(self, attr: str) -> bool:
+        return attr in self._pages
+
+    def ensure_page_at(self, index: int):
+        if 0 <= index < len(PAGES):
+            self.ensure_page(PAGES[index][0])
+
+    def ensure_page(self, attr: str):
+        """返回页面，未创建时导入模块并创建到对应的占位页面中"""
+        page = self._pages.get(attr)
+        if page is not None:
+            return page
+
+        index = next(i for i, entry in enumerate(PAGES) if entry[0] == attr)
+        _, _, module_name, class_name = PAGES[index]
+        with trace.span(f"build {class_name}"):
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            page = page_class()
+        self._pages[attr] = page
+        self._placeholders[index].layout().addWidget(page)
+
+        if attr == 'scheduling_page':
+            # 排班界面从管理界面获取员工、拉线等配置，需要时才创建管理界面
+            page.set_config_provider(lambda: self.management_page.get_scheduling_config())
+        return page
+
+    def restore_autosave(self):
+        """上次有未保存的修改就退出或崩溃时，询问是否恢复自动保存的快照"""
+        from scheduling_core.autosave import AutosaveStore
+        store = AutosaveStore()
+        titles = {attr: title for attr, title, _, _ in PAGES}
+        snapshots = [snapshot for snapshot in store.snapshots() if snapshot.name in titles]
+        if not snapshots:
+            return
+        saved_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshots[0].saved_at))
+        pages = "、".join(titles[snapshot.name] for snapshot in snapshots)
+        answer = QMessageBox.question(
+            self, "恢复数据", f"检测到未保存的修改（{pages}，最后自动保存于 {saved_at}），是否恢复？")
+        for snapshot in snapshots:
+            if answer == QMessageBox.StandardButton.Yes:
+                self.ensure_page(snapshot.name).restore_snapshot(snapshot)
+            else:
+                store.discard(snapshot.name)
+
+    def closeEvent(self, event):
+        # 退出前写入尚未自动保存的修改，下次启动时可以恢复
+        for page in self._pages.values():
+            autosaver = getattr(page, 'autosaver', None)
+            if autosaver is not None:
+                autosaver.flush()
+        super().closeEvent(event)
+
+    def build_all_pages(self):
+        for attr, _, _, _ in PAGES:
+            self.ensure_page(attr)
+
+    def _prebuild_next_page(self):
+        # 每次只创建一个页面，避免长时间阻塞界面
+        for attr, _, _, _ in PAGES:
+            if attr not in self._pages:
+                self.ensure_page(attr)
+                self._prebuild_timer.start(PREBUILD_INTERVAL_MS)
+                return
+
     def apply_stylesheet(self):
         self.setStyleSheet('''
             QWidget {
@@ -91,7 +187,9 @@ if __name__ == "__main__":
     pixmap_logo = QtGui.QPixmap('icons/logo.png')
     app.setWindowIcon(pixmap_logo)
 
-    mw = MainWindow()
+    # 传入 --prebuild-tabs 时在空闲时间预先创建其余标签页
+    mw = MainWindow(prebuild_pages='--prebuild-tabs' in sys.argv)
     mw.showMinimized()  # 初始以最小化窗口显示
+    mw.restore_autosave()
 
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""排班系统的数据读写、校验与求解核心，不依赖Qt，可在命令行和批处理任务中使用
+
+界面代码（各Page与yaml_*Manager）在此基础上增加Qt提示框和后台线程。
+命令行入口: python -m scheduling_core --help
+"""
+__version__ = '1.0.0'
@@ -0,0 +1,70 @@
+"""崩溃恢复用的自动保存快照（不依赖Qt）
+
+每个页面未保存的修改写入自动保存目录中各自的快照文件，每个页面只保留最新的一份。
+快照沿用配置缓存的二进制格式（见 config_cache），几十万条生产记录也只是几个数组的拷贝；
+写入时先写临时文件、fsync 后再改名，进程在任何时候崩溃，留下的都是完整的旧快照或新快照。
+数据正常保存或重新加载后删除快照，下次启动时仍存在的快照就是没有保存的修改。
+"""
+import os
+import struct
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from . import config_cache
+
+AUTOSAVE_DIR_ENV = 'AI_SCHEDULING_AUTOSAVE_DIR'
+DEFAULT_AUTOSAVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'autosave')
+SUFFIX = '.autosave'
+
+
+class Snapshot(NamedTuple):
+    name: str
+    saved_at: float  # time.time()
+    source_path: Optional[str]  # 修改前加载或保存的文件，没有时为 None
+    data: Dict
+
+
+class AutosaveStore:
+    """自动保存目录；name 为页面名称，每个名称对应一个快照文件"""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or os.environ.get(AUTOSAVE_DIR_ENV) or DEFAULT_AUTOSAVE_DIR
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name + SUFFIX)
+
+    def write(self, name: str, data: Dict, source_path: Optional[str] = None):
+        """写入快照并替换同名的旧快照；无法写入时抛出 OSError/ValueError/TypeError/OverflowError"""
+        os.makedirs(self.directory, exist_ok=True)
+        config_cache.write_file(self._path(name), data,
+                                {'name': name, 'saved_at': time.time(), 'source_path': source_path})
+
+    def read(self, name: str) -> Optional[Snapshot]:
+        """读取快照，不存在或损坏时返回 None"""
+        try:
+            header, payload = config_cache.read_file(self._path(name))
+            return Snapshot(name, float(header['saved_at']), header['source_path'],
+                            config_cache.decode(header, payload))
+        except (ValueError, KeyError, TypeError, IndexError, struct.error, UnicodeDecodeError, OSError):
+            return None
+
+    def snapshots(self) -> List[Snapshot]:
+        """目录中所有可以读取的快照，最新的在前；损坏的快照直接删除"""
+        try:
+            names = [entry[:-len(SUFFIX)] for entry in os.listdir(self.directory) if entry.endswith(SUFFIX)]
+        except OSError:
+            return []
+        snapshots = []
+        for name in names:
+            snapshot = self.read(name)
+            if snapshot is None:
+                self.discard(name)
+            else:
+                snapshots.append(snapshot)
+        return sorted(snapshots, key=lambda snapshot: snapshot.saved_at, reverse=True)
+
+    def discard(self, name: str):
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
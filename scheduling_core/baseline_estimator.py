@@ -0,0 +1,117 @@
+"""按生产情况历史估算员工的基础产出（每小时件数）
+
+估算值取 姓名×P/N 各条记录每小时产出的中位数，不受个别异常记录影响；
+该员工没有做过此P/N时，依次退回到此P/N所有员工的中位数、该员工所有P/N的中位数。
+"""
+from collections import defaultdict
+from itertools import compress, repeat
+from operator import add, gt, mul, truediv
+from typing import Dict, List, Optional
+
+from .production_store import ProductionColumns
+
+
+def _median(values: List[float]) -> float:
+    values.sort()
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+class BaselineTable:
+    """一次估算的结果"""
+
+    def __init__(self, columns: ProductionColumns, by_name_pn: Dict[int, float],
+                 by_pn: Dict[int, float], by_name: Dict[int, float]):
+        self.names = columns.strings['姓名'].lookup
+        self.pns = columns.strings['P/N'].lookup
+        self._pn_count = len(columns.strings['P/N'].values)
+        self.by_name_pn = by_name_pn
+        self.by_pn = by_pn
+        self.by_name = by_name
+
+    def rate(self, name: str, pn: str, fallback: bool = True) -> Optional[float]:
+        """姓名×P/N 的每小时产出估算；没有历史数据时返回 None"""
+        name_code = self.names.get(name)
+        pn_code = self.pns.get(pn)
+        if name_code is not None and pn_code is not None:
+            rate = self.by_name_pn.get(name_code * self._pn_count + pn_code)
+            if rate is not None:
+                return rate
+        if not fallback:
+            return None
+        if pn_code is not None and pn_code in self.by_pn:
+            return self.by_pn[pn_code]
+        if name_code is not None and name_code in self.by_name:
+            return self.by_name[name_code]
+        return None
+
+    def base_output(self, name: str, pn: str, default: int = 0, fallback: bool = True) -> int:
+        """配置中使用的整数基础产出"""
+        rate = self.rate(name, pn, fallback)
+        return default if rate is None else int(round(rate))
+
+
+def estimate(columns: ProductionColumns) -> BaselineTable:
+    """一次遍历生产记录，按编码分组后取中位数"""
+    outputs = columns.numbers['产出']
+    hours = columns.numbers['工时']
+    name_codes = columns.strings['姓名'].codes
+    pn_codes = columns.strings['P/N'].codes
+    pn_count = max(len(columns.strings['P/N'].values), 1)
+
+    # 工时为0的记录无法计算每小时产出
+    valid = list(map(gt, hours, repeat(0.0)))
+    rates = list(compress(map(truediv, outputs, map(max, hours, repeat(1e-300))), valid))
+    names = list(compress(name_codes, valid))
+    pns = list(compress(pn_codes, valid))
+    keys = map(add, map(mul, names, repeat(pn_count)), pns)
+
+    grouped = defaultdict(list)
+    for key, rate in zip(keys, rates):
+        grouped[key].append(rate)
+    by_pn_values = defaultdict(list)
+    for pn, rate in zip(pns, rates):
+        by_pn_values[pn].append(rate)
+    by_name_values = defaultdict(list)
+    for name, rate in zip(names, rates):
+        by_name_values[name].append(rate)
+
+    return BaselineTable(
+        columns,
+        {key: _median(values) for key, values in grouped.items()},
+        {key: _median(values) for key, values in by_pn_values.items()},
+        {key: _median(values) for key, values in by_name_values.items()},
+    )
+
+
+class BaselineEstimator:
+    """缓存估算结果，生产记录未变化（同一 ProductionColumns 且 version 相同）时直接复用
+
+    百万条记录估算需要数秒，界面先用 cached() 查看缓存，没有时在后台线程对副本调用 estimate()，
+    完成后用 store() 记录结果。
+    """
+
+    def __init__(self):
+        self._columns: Optional[ProductionColumns] = None
+        self._version = -1
+        self._table: Optional[BaselineTable] = None
+
+    def cached(self, columns: ProductionColumns) -> Optional[BaselineTable]:
+        if columns is not self._columns or columns.version != self._version:
+            return None
+        return self._table
+
+    def store(self, columns: ProductionColumns, version: int, table: BaselineTable):
+        """记录按 columns 第 version 版数据估算的结果"""
+        self._columns = columns
+        self._version = version
+        self._table = table
+
+    def table(self, columns: ProductionColumns) -> BaselineTable:
+        table = self.cached(columns)
+        if table is None:
+            table = estimate(columns)
+            self.store(columns, columns.version, table)
+        return table
@@ -0,0 +1,132 @@
+"""排班命令行入口
+
+示例:
+    python -m scheduling_core solve --schedule schedule.yml --config config.yml -o result.yml
+    python -m scheduling_core validate --config config.yml
+
+只在执行具体命令时才导入YAML解析、求解等模块，保证 cron/流水线任务的启动开销很小。
+"""
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from . import __version__
+
+_START = time.perf_counter()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m scheduling_core', description="智能排班系统命令行工具")
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    parser.add_argument('--timings', action='store_true', help="在标准错误输出各阶段耗时")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    solve = commands.add_parser('solve', help="读取排班参数和管理配置，生成排班结果")
+    solve.add_argument('--schedule', required=True, help="排班参数YAML（schedule）")
+    solve.add_argument('--config', required=True, help="管理配置YAML（config）")
+    solve.add_argument('-o', '--output', help="结果输出文件，默认输出到标准输出")
+    solve.add_argument('--format', choices=('yaml', 'json', 'text'), default='yaml', help="结果格式")
+    solve.add_argument('--time-limit', type=float, default=None, help="求解时间上限（秒）")
+    solve.add_argument('--cache-dir', help="结果缓存目录，默认使用环境变量 AI_SCHEDULING_CACHE_DIR 或程序目录下的 cache/results")
+    solve.add_argument('--no-cache', action='store_true', help="不读取也不写入结果缓存")
+
+    validate = commands.add_parser('validate', help="校验排班参数或管理配置")
+    validate.add_argument('--schedule', help="排班参数YAML（schedule）")
+    validate.add_argument('--config', help="管理配置YAML（config）")
+    return parser
+
+
+class _Timer:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.last = _START
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        if self.enabled:
+            print(f"[timing] {stage}: {(now - self.last) * 1000:.1f} ms", file=sys.stderr)
+        self.last = now
+
+
+def _write_output(text: str, output: Optional[str]):
+    if output is None:
+        sys.stdout.write(text)
+        if not text.endswith('\n'):
+            sys.stdout.write('\n')
+        return
+    from .file_utils import atomic_write
+    with atomic_write(output) as f:
+        f.write(text)
+
+
+def _format_result(result, fmt: str) -> str:
+    if fmt == 'text':
+        return result.format_text()
+    if fmt == 'json':
+        import json
+        return json.dumps({'result': result.to_dict()}, ensure_ascii=False, indent=2)
+    from . import yaml_backend
+    return yaml_backend.dump({'result': result.to_dict()})
+
+
+def _cmd_solve(args, timer: _Timer) -> int:
+    from .config_data import load_config
+    from .schedule_data import load_schedule
+    from .result_cache import ResultCache, solve_cached
+
+    schedule = load_schedule(args.schedule)
+    config, warnings = load_config(args.config)
+    for message in warnings:
+        print(f"警告: {message}", file=sys.stderr)
+    timer.mark("load")
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    result = solve_cached(schedule, config, cache, time_limit=args.time_limit)
+    timer.mark("cached result" if result.from_cache else "solve")
+
+    _write_output(_format_result(result, args.format), args.output)
+    timer.mark("write")
+    print(f"求解状态: {result.status}，目标值: {result.objective:g}，使用人数: {result.employees_used}，"
+          f"求解耗时: {result.solve_time:.3f} 秒{'（缓存）' if result.from_cache else ''}", file=sys.stderr)
+    return 0
+
+
+def _cmd_validate(args, timer: _Timer) -> int:
+    if not args.schedule and not args.config:
+        print("请至少指定 --schedule 或 --config", file=sys.stderr)
+        return 2
+    if args.schedule:
+        from .schedule_data import load_schedule
+        load_schedule(args.schedule)
+        print(f"{args.schedule}: 排班参数有效")
+    if args.config:
+        from .config_data import load_config
+        _, warnings = load_config(args.config)
+        for message in warnings:
+            print(f"警告: {message}", file=sys.stderr)
+        print(f"{args.config}: 管理配置有效")
+    timer.mark("validate")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    timer = _Timer(args.timings)
+    timer.mark("startup")
+
+    from .config_data import ConfigDataError
+    from .schedule_data import ScheduleDataError
+    try:
+        if args.command == 'solve':
+            return _cmd_solve(args, timer)
+        return _cmd_validate(args, timer)
+    except (ConfigDataError, ScheduleDataError) as e:
+        print(f"{e.title}: {e.message}", file=sys.stderr)
+        return 1
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"排班数据无效: {str(e)}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"文件读写失败: {str(e)}", file=sys.stderr)
+        return 1
@@ -0,0 +1,69 @@
+"""管理配置在内存中的紧凑形式（不依赖Qt）
+
+YAML解析得到的每条记录都是单独的字典，每个字典里的中文键名和相同的 P/N、设备、班次、姓名
+都是新的字符串对象。加载后转换为紧凑形式：
+* 生产情况转换为 ProductionColumns：字符串列字典编码，产出/工时为 double 数组；
+* 员工、拉线、特殊工位条数少，界面和求解代码都按字典使用，仍保留字典，
+  只让相同的键和字符串值共用同一个对象。
+保存和写缓存时 ProductionColumns 逐条生成字典，不会整体转换回字典列表。
+"""
+from typing import Dict, List
+
+from .production_store import ProductionColumns
+
+SMALL_SECTIONS = ('employees', 'lines', 'special_stations')
+
+
+def intern_records(records: List) -> List:
+    """返回键和字符串值（含字符串列表的元素）都共用对象的记录，不是字典的项原样保留
+
+    用本次调用内的字典去重而不是 sys.intern，工号等不重复的值不会一直留在解释器的驻留表中。
+    """
+    pool: Dict[str, str] = {}
+    share = pool.setdefault
+
+    def compact(value):
+        if type(value) is str:
+            return share(value, value)
+        if type(value) is list:
+            return [share(item, item) if type(item) is str else item for item in value]
+        return value
+
+    return [{share(key, key) if type(key) is str else key: compact(value) for key, value in record.items()}
+            if type(record) is dict else record for record in records]
+
+
+def compact_config(config: Dict) -> Dict:
+    """把已经校验通过的配置就地转换为紧凑形式并返回；已经是紧凑形式的部分保持不变"""
+    for section in SMALL_SECTIONS:
+        records = config.get(section)
+        if type(records) is list:
+            config[section] = intern_records(records)
+    productions = config.get('productions')
+    if isinstance(productions, list):
+        config['productions'] = ProductionColumns.from_records(productions)
+    return config
+
+
+def expand_config(config: Dict) -> Dict:
+    """转换回YAML使用的字典形式（浅拷贝）"""
+    expanded = dict(config)
+    productions = expanded.get('productions')
+    if isinstance(productions, ProductionColumns):
+        expanded['productions'] = productions.to_records()
+    return expanded
+
+
+def yaml_view(config: Dict) -> Dict:
+    """保存用的浅拷贝：生产情况换成逐条生成字典的迭代器，供流式写出"""
+    productions = config.get('productions')
+    if isinstance(productions, ProductionColumns):
+        return dict(config, productions=productions.iter_records())
+    return config
+
+
+def schema_view(config: Dict) -> Dict:
+    """校验用的浅拷贝：列式的生产情况在构造时已把产出/工时转换为数值，不再逐条校验"""
+    if isinstance(config.get('productions'), ProductionColumns):
+        return {key: value for key, value in config.items() if key != 'productions'}
+    return config
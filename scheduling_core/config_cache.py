@@ -0,0 +1,184 @@
+"""管理配置的二进制列式缓存（不依赖Qt）
+
+每个配置文件旁边保存一个隐藏的 .cache 文件，其中生产情况按列保存
+（字符串列为字典+编码数组，产出/工时为double数组），加载时直接读取数组，
+不再解析YAML。YAML文件仍然是唯一的数据来源：缓存以YAML的大小、修改时间
+和内容哈希作为键，任何不一致或损坏都会被忽略并在下次解析后重建。
+write_file/read_file 也用于写入与YAML文件无关的快照（见 autosave）。
+"""
+import datetime
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Optional, Tuple
+
+from .file_utils import atomic_write
+from .production_store import NUMERIC_FIELDS, STRING_FIELDS, ProductionColumns
+
+MAGIC = b'AISCFG\x00'
+FORMAT_VERSION = 2
+_HEADER = struct.Struct('<7sBI')  # magic, 格式版本, 头部JSON长度
+
+
+def cache_path(file_path: str) -> str:
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, f".{name}.cache")
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def source_key(file_path: str) -> Dict:
+    info = os.stat(file_path)
+    return {'size': info.st_size, 'mtime_ns': info.st_mtime_ns}
+
+
+def _encode_value(value):
+    """json.dumps 的 default：YAML中不加引号的日期解析为日期对象，加标记后按ISO字符串保存"""
+    if isinstance(value, datetime.datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'$date': value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_value(obj: Dict):
+    """json.loads 的 object_hook：还原 _encode_value 加了标记的日期"""
+    if len(obj) == 1:
+        if '$date' in obj:
+            return datetime.date.fromisoformat(obj['$date'])
+        if '$datetime' in obj:
+            return datetime.datetime.fromisoformat(obj['$datetime'])
+    return obj
+
+
+def _encode_payload(config: Dict):
+    columns = config.get('productions', [])
+    if not isinstance(columns, ProductionColumns):
+        columns = ProductionColumns.from_records(columns)
+    rest = {key: value for key, value in config.items() if key != 'productions'}
+    blobs = [columns.strings[field].codes for field in STRING_FIELDS] + \
+            [columns.numbers[field] for field in NUMERIC_FIELDS]
+    meta = {
+        'config': rest,
+        'has_productions': 'productions' in config,
+        'rows': len(columns),
+        'strings': {field: columns.strings[field].values for field in STRING_FIELDS},
+        'blobs': [[blob.typecode, blob.itemsize, len(blob)] for blob in blobs],
+    }
+    meta_bytes = json.dumps(meta, ensure_ascii=False, default=_encode_value).encode('utf-8')
+    if json.loads(meta_bytes, object_hook=_decode_value)['config'] != rest:
+        # 含有JSON无法原样表示的值（如非字符串键），不缓存
+        raise ValueError("配置无法无损写入缓存")
+    return [struct.pack('<I', len(meta_bytes)), meta_bytes] + [blob.tobytes() for blob in blobs]
+
+
+def _decode_payload(payload: memoryview) -> Dict:
+    (meta_len,) = struct.unpack_from('<I', payload, 0)
+    meta = json.loads(bytes(payload[4:4 + meta_len]).decode('utf-8'), object_hook=_decode_value)
+    offset = 4 + meta_len
+
+    blobs = []
+    for typecode, itemsize, length in meta['blobs']:
+        blob = array(typecode)
+        if blob.itemsize != itemsize:
+            raise ValueError("缓存中的数组类型与当前平台不一致")
+        end = offset + itemsize * length
+        blob.frombytes(payload[offset:end])
+        blobs.append(blob)
+        offset = end
+
+    columns = ProductionColumns()
+    for field, codes in zip(STRING_FIELDS, blobs):
+        column = columns.strings[field]
+        column.values = meta['strings'][field]
+        column.lookup = {value: code for code, value in enumerate(column.values)}
+        column.codes = codes
+    for field, values in zip(NUMERIC_FIELDS, blobs[len(STRING_FIELDS):]):
+        columns.numbers[field] = values
+    columns.columns = [columns.strings[field] for field in STRING_FIELDS] + \
+                      [columns.numbers[field] for field in NUMERIC_FIELDS]
+    if len(columns) != meta['rows']:
+        raise ValueError("缓存中的行数不一致")
+
+    config = meta['config']
+    if meta['has_productions']:
+        # 直接使用列式数据，不转换为字典列表
+        config['productions'] = columns
+    return config
+
+
+def write_file(path: str, config: Dict, header: Dict):
+    """把配置按缓存格式写入 path（临时文件 fsync 后改名）；header 为写入文件头的附加字段
+
+    配置无法写入时抛出 OSError/ValueError/TypeError/OverflowError。
+    """
+    parts = _encode_payload(config)
+    crc = 0
+    for part in parts:
+        crc = zlib.crc32(part, crc)
+    header = dict(header, byteorder=sys.byteorder, crc32=crc, payload_size=sum(len(part) for part in parts))
+    header_bytes = json.dumps(header).encode('utf-8')
+    with atomic_write(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for part in parts:
+            f.write(part)
+
+
+def read_file(path: str) -> Tuple[Dict, memoryview]:
+    """读取 write_file 写入的文件，返回 (文件头, 负载)；负载用 decode 解码
+
+    文件不存在时抛出 OSError，格式或版本不符时抛出 ValueError。
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, header_len = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("不是当前版本的缓存文件")
+    header = json.loads(data[_HEADER.size:_HEADER.size + header_len].decode('utf-8'))
+    if header['byteorder'] != sys.byteorder:
+        raise ValueError("缓存文件的字节序与当前平台不一致")
+    return header, memoryview(data)[_HEADER.size + header_len:]
+
+
+def decode(header: Dict, payload: memoryview) -> Dict:
+    """校验并解码 read_file 返回的负载，损坏时抛出 ValueError"""
+    if len(payload) != header['payload_size'] or zlib.crc32(payload) != header['crc32']:
+        raise ValueError("缓存文件已损坏")
+    return _decode_payload(payload)
+
+
+def store(file_path: str, config: Dict, digest: Optional[str] = None, key: Optional[Dict] = None):
+    """为已经校验通过的配置写入缓存，失败时静默忽略"""
+    try:
+        if key is None:
+            key = source_key(file_path)
+        if digest is None:
+            with open(file_path, 'rb') as f:
+                digest = file_digest(f.read())
+        write_file(cache_path(file_path), config, dict(key, sha256=digest))
+    except (OSError, ValueError, TypeError, OverflowError):
+        pass
+
+
+def load(file_path: str) -> Optional[Dict]:
+    """读取与YAML文件一致的缓存，缓存不存在、过期或损坏时返回 None"""
+    try:
+        key = source_key(file_path)
+        header, payload = read_file(cache_path(file_path))
+        if header['size'] != key['size'] or header['mtime_ns'] != key['mtime_ns']:
+            # 修改时间变了但内容可能没变（例如复制或touch），用内容哈希确认
+            if header['size'] != key['size']:
+                return None
+            with open(file_path, 'rb') as f:
+                if file_digest(f.read()) != header['sha256']:
+                    return None
+        return decode(header, payload)
+    except (ValueError, KeyError, TypeError, IndexError, struct.error, UnicodeDecodeError, OSError):
+        return None
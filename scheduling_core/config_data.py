@@ -0,0 +1,141 @@
+"""管理配置YAML的读写（不依赖Qt），出错时抛出 ConfigDataError"""
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import config_cache, yaml_backend
+from .compact_records import compact_config, schema_view, yaml_view
+from .config_journal import ConfigJournal, apply_ops
+from .schema import ValidationReport, validate_config
+from .file_utils import Cancelled, Progress, ProgressReader, atomic_write, gc_paused, item_progress
+
+# 这些列表可能很长，保存时逐条流式写出
+STREAMED_KEYS = ('employees', 'productions')
+# 日志超过基础快照大小的一半（且不小于1MB）时压缩为新的快照
+COMPACT_MIN_BYTES = 1 << 20
+COMPACT_RATIO = 0.5
+# 解析得到的记录按块释放，每块释放期间持有GIL的时间很短
+RELEASE_CHUNK = 10000
+
+
+class ConfigDataError(Exception):
+    """配置无法保存或加载；title/message 用于界面提示，report 为校验报告（如有）"""
+
+    def __init__(self, title: str, message: str, report: Optional[ValidationReport] = None):
+        super().__init__(message)
+        self.title = title
+        self.message = message
+        self.report = report
+
+
+def create_empty_config() -> Dict:
+    return {
+        'employees_excel_path': "",
+        'employees': [],
+        'lines': [],
+        'special_stations': [],
+        'productions': []
+    }
+
+
+def save_config(config: Dict, file_path: str, progress: Optional[Progress] = None,
+                should_stop: Optional[Callable[[], bool]] = None):
+    """校验并保存完整配置快照，同时清空操作日志、更新二进制缓存；生产情况可以是 ProductionColumns
+
+    progress 按已写出的员工和生产记录条数报告进度；should_stop 返回 True 时抛出 Cancelled，原文件不变。
+    """
+    report = validate_config(schema_view(config))
+    if not report.ok:
+        raise ConfigDataError("配置错误", f"配置数据格式无效:\n{report.summary()}", report)
+
+    total = sum(len(config.get(key) or ()) for key in STREAMED_KEYS)
+    try:
+        with atomic_write(file_path) as f:
+            yaml_backend.dump_document_streaming(f, 'config', yaml_view(config), STREAMED_KEYS,
+                                                 progress=item_progress(total, progress, should_stop))
+        # 新快照已包含日志中的全部操作
+        ConfigJournal(file_path).discard()
+        config_cache.store(file_path, config)
+    except (IOError, OSError, yaml_backend.YAMLError) as e:
+        raise ConfigDataError("保存失败", f"保存YAML文件时出错: {str(e)}")
+
+
+def append_to_journal(journal: ConfigJournal, ops: List[Dict]):
+    """把增删操作追加到配置文件的日志中，不重写整个YAML"""
+    added: Dict[str, List[Dict]] = {}
+    for op in ops:
+        if op['op'] == 'add':
+            added.setdefault(op['section'], []).append(op['record'])
+    report = validate_config(added)
+    if not report.ok:
+        raise ConfigDataError("配置错误", f"新增数据格式无效:\n{report.summary()}", report)
+
+    try:
+        journal.append(ops)
+    except (IOError, OSError, TypeError, ValueError) as e:
+        raise ConfigDataError("保存失败", f"写入配置日志时出错: {str(e)}")
+
+
+def journal_needs_compaction(journal: ConfigJournal) -> bool:
+    try:
+        base_size = os.path.getsize(journal.file_path)
+    except OSError:
+        return False
+    return journal.size() > max(COMPACT_MIN_BYTES, base_size * COMPACT_RATIO)
+
+
+def load_snapshot(file_path: str, progress: Optional[Progress] = None,
+                  should_stop: Optional[Callable[[], bool]] = None) -> Dict:
+    """加载基础快照（紧凑形式），YAML未变化时直接读取二进制缓存；progress 按已解析的字节数报告"""
+    cached = config_cache.load(file_path)
+    if cached is not None:
+        return cached
+
+    try:
+        key = config_cache.source_key(file_path)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        with gc_paused():
+            data = yaml_backend.load(ProgressReader(raw, progress, should_stop))
+    except (IOError, OSError, UnicodeDecodeError, yaml_backend.YAMLError) as e:
+        raise ConfigDataError("加载失败", f"加载YAML文件时出错: {str(e)}")
+
+    if not isinstance(data, dict) or 'config' not in data:
+        raise ConfigDataError("加载失败", "YAML文件中缺少'config'键")
+
+    if should_stop is not None and should_stop():
+        raise Cancelled()
+    report = validate_config(data['config'])
+    if not report.ok:
+        raise ConfigDataError("加载失败", f"YAML文件内容格式无效:\n{report.summary()}", report)
+
+    # 解析得到的字典列表转换为列式数据后即可释放
+    with gc_paused():
+        parsed = data.pop('config')
+        productions = parsed.get('productions')
+        config = compact_config(parsed)
+        if isinstance(productions, list):
+            _release(productions)
+    del data
+    config_cache.store(file_path, config, config_cache.file_digest(raw), key)
+    return config
+
+
+def _release(records: List):
+    """逐块清空列表：一次释放几十万个对象会长时间持有GIL，界面线程随之卡顿"""
+    for end in range(len(records), 0, -RELEASE_CHUNK):
+        del records[max(0, end - RELEASE_CHUNK):end]
+
+
+def load_config(file_path: str, progress: Optional[Progress] = None,
+                should_stop: Optional[Callable[[], bool]] = None) -> Tuple[Dict, List[str]]:
+    """加载配置并回放操作日志，返回 (配置, 提示信息列表)；生产情况为 ProductionColumns
+
+    只读取文件，不修改YAML和日志。日志中有无法应用的操作时返回提示，之后追加的操作会排在它后面，
+    调用方继续修改前应先用 save_config 写入完整快照。解析YAML期间 should_stop 返回 True 时抛出 Cancelled。
+    """
+    config = load_snapshot(file_path, progress, should_stop)
+    warnings = []
+    ops = ConfigJournal(file_path).read_ops()
+    if ops and apply_ops(config, ops) < len(ops):
+        warnings.append("配置日志中有无法应用的操作，已忽略其后的修改；重新保存配置后写入完整的新快照")
+    return config, warnings
@@ -0,0 +1,190 @@
+"""管理配置的内存索引：P/N→拉线、设备编号→员工、工位→可上岗员工等，增删记录时增量更新
+
+记录ID在其他记录增删后保持不变，界面表格把ID保存在行中，删除行时按ID更新索引。
+"""
+from itertools import count
+from operator import itemgetter
+from typing import Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional
+
+
+class IndexKey(NamedTuple):
+    """索引键的取法；multi 为 True 时 getter 返回多个键，如拉线的所需工位"""
+    getter: Callable[[Dict], Hashable]
+    multi: bool = False
+
+
+def _list_keys(name: str) -> Callable[[Dict], Iterable[Hashable]]:
+    return lambda record: dict.fromkeys(record.get(name) or ())
+
+
+EMPLOYEE_KEYS: Dict[str, IndexKey] = {
+    'name': IndexKey(itemgetter('姓名')),
+    'device': IndexKey(itemgetter('设备编号')),
+    'pn': IndexKey(itemgetter('P/N')),
+    'station': IndexKey(itemgetter('工位')),
+    # 排班时按 工位+P/N+设备 / 工位+P/N / 工位+设备 的顺序挑选员工
+    'station_pn_device': IndexKey(itemgetter('工位', 'P/N', '设备编号')),
+    'station_pn': IndexKey(itemgetter('工位', 'P/N')),
+    'station_device': IndexKey(itemgetter('工位', '设备编号')),
+}
+LINE_KEYS: Dict[str, IndexKey] = {
+    'pn': IndexKey(itemgetter('P/N')),
+    'device': IndexKey(itemgetter('设备编号')),
+    'station': IndexKey(_list_keys('所需工位'), multi=True),
+}
+SPECIAL_STATION_KEYS: Dict[str, IndexKey] = {
+    'type': IndexKey(itemgetter('特殊工位类型')),
+}
+
+
+class RecordIndex:
+    """一个配置分区的记录及其字段索引，键对应的记录按加入顺序排列"""
+
+    def __init__(self, keys: Dict[str, IndexKey]):
+        self.keys_spec = keys
+        self.records: Dict[int, Dict] = {}
+        # 索引名 -> 键 -> 记录ID（用 dict 作为有序集合）
+        self.indexes: Dict[str, Dict[Hashable, Dict[int, None]]] = {name: {} for name in keys}
+        self._ids = count()
+
+    def _record_keys(self, spec: IndexKey, record: Dict) -> Iterable[Hashable]:
+        return spec.getter(record) if spec.multi else (spec.getter(record),)
+
+    def add(self, record: Dict) -> int:
+        return self.extend((record,))[0]
+
+    def extend(self, records: Iterable[Dict]) -> List[int]:
+        """批量加入记录，逐个索引一次性写入"""
+        if not isinstance(records, (list, tuple)):
+            records = list(records)
+        ids = [next(self._ids) for _ in records]
+        self.records.update(zip(ids, records))
+        for name, spec in self.keys_spec.items():
+            index = self.indexes[name]
+            if spec.multi:
+                pairs = ((record_id, key) for record_id, record in zip(ids, records)
+                         for key in spec.getter(record))
+            else:
+                pairs = zip(ids, map(spec.getter, records))
+            for record_id, key in pairs:
+                bucket = index.get(key)
+                if bucket is None:
+                    index[key] = {record_id: None}
+                else:
+                    bucket[record_id] = None
+        return ids
+
+    def remove(self, record_ids: Iterable[int]):
+        for record_id in record_ids:
+            record = self.records.pop(record_id, None)
+            if record is not None:
+                self._unindex(record_id, record)
+
+    def _unindex(self, record_id: int, record: Dict):
+        for name, spec in self.keys_spec.items():
+            index = self.indexes[name]
+            for key in self._record_keys(spec, record):
+                bucket = index.get(key)
+                if bucket is not None:
+                    bucket.pop(record_id, None)
+                    if not bucket:
+                        del index[key]
+
+    def update(self, record_id: int, record: Dict):
+        """替换记录内容，记录ID和记录顺序不变"""
+        if record_id not in self.records:
+            return
+        self._unindex(record_id, self.records[record_id])
+        self.records[record_id] = record
+        for name, spec in self.keys_spec.items():
+            index = self.indexes[name]
+            for key in self._record_keys(spec, record):
+                index.setdefault(key, {})[record_id] = None
+
+    def clear(self):
+        self.records.clear()
+        for index in self.indexes.values():
+            index.clear()
+
+    def get(self, record_id: int) -> Optional[Dict]:
+        return self.records.get(record_id)
+
+    def lookup_ids(self, index_name: str, key: Hashable) -> List[int]:
+        return list(self.indexes[index_name].get(key, ()))
+
+    def lookup(self, index_name: str, key: Hashable) -> List[Dict]:
+        records = self.records
+        return [records[record_id] for record_id in self.indexes[index_name].get(key, ())]
+
+    def count(self, index_name: str, key: Hashable) -> int:
+        return len(self.indexes[index_name].get(key, ()))
+
+    def keys(self, index_name: str) -> List[Hashable]:
+        return list(self.indexes[index_name])
+
+    def values(self) -> List[Dict]:
+        return list(self.records.values())
+
+    def positions(self, record_ids: Iterable[int]) -> List[int]:
+        """记录在 values() 中的位置（升序）"""
+        wanted = set(record_ids)
+        return [pos for pos, record_id in enumerate(self.records) if record_id in wanted]
+
+    def __contains__(self, record_id: int) -> bool:
+        return record_id in self.records
+
+    def __len__(self):
+        return len(self.records)
+
+
+class ConfigIndex:
+    """员工、拉线、特殊工位的索引"""
+
+    def __init__(self):
+        self.employees = RecordIndex(EMPLOYEE_KEYS)
+        self.lines = RecordIndex(LINE_KEYS)
+        self.special_stations = RecordIndex(SPECIAL_STATION_KEYS)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'ConfigIndex':
+        index = cls()
+        index.employees.extend(config.get('employees', []))
+        index.lines.extend(config.get('lines', []))
+        index.special_stations.extend(config.get('special_stations', []))
+        return index
+
+    def section(self, name: str) -> RecordIndex:
+        return {'employees': self.employees, 'lines': self.lines,
+                'special_stations': self.special_stations}[name]
+
+    def lines_for_pn(self, pn: str) -> List[Dict]:
+        return self.lines.lookup('pn', pn)
+
+    def employees_for_device(self, device: str) -> List[Dict]:
+        return self.employees.lookup('device', device)
+
+    def qualified_employee_ids(self, station: str, pn: Optional[str] = None,
+                               device: Optional[str] = None) -> List[int]:
+        """可在工位上岗的员工ID，指定 P/N 或设备时只返回完全匹配的员工"""
+        if pn is not None and device is not None:
+            return self.employees.lookup_ids('station_pn_device', (station, pn, device))
+        if pn is not None:
+            return self.employees.lookup_ids('station_pn', (station, pn))
+        if device is not None:
+            return self.employees.lookup_ids('station_device', (station, device))
+        return self.employees.lookup_ids('station', station)
+
+    def qualified_employees(self, station: str, pn: Optional[str] = None,
+                            device: Optional[str] = None) -> List[Dict]:
+        records = self.employees.records
+        return [records[i] for i in self.qualified_employee_ids(station, pn, device)]
+
+    def is_special_station(self, station: str) -> bool:
+        return self.special_stations.count('type', station) > 0
+
+    def to_config(self) -> Dict:
+        return {
+            'employees': self.employees.values(),
+            'lines': self.lines.values(),
+            'special_stations': self.special_stations.values()
+        }
@@ -0,0 +1,177 @@
+"""管理配置的追加式操作日志（不依赖Qt）
+
+配置YAML文件作为基础快照，之后的增删操作以一行一条的形式追加到旁边的
+隐藏 .journal 文件中，保存时只写入变化的部分。每行带CRC校验，进程崩溃
+留下的半行会在回放时被丢弃；日志头记录基础快照的大小、修改时间和哈希，
+与当前YAML不匹配的日志（例如压缩过程中崩溃留下的旧日志）不会被回放。
+"""
+import hashlib
+import json
+import os
+import zlib
+from typing import Dict, List, Optional
+
+JOURNAL_SECTIONS = ('employees', 'lines', 'special_stations', 'productions')
+FORMAT_VERSION = 1
+
+
+def journal_path(file_path: str) -> str:
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, f".{name}.journal")
+
+
+def add_op(section: str, record: Dict) -> Dict:
+    return {'op': 'add', 'section': section, 'record': record}
+
+
+def delete_op(section: str, rows: List[int]) -> Dict:
+    return {'op': 'delete', 'section': section, 'rows': sorted(set(rows))}
+
+
+def apply_ops(config: Dict, ops: List[Dict]) -> int:
+    """按顺序把操作应用到配置上，遇到无法应用的操作时停止，返回已应用的数量"""
+    for count, op in enumerate(ops):
+        try:
+            if op['section'] not in JOURNAL_SECTIONS:
+                return count
+            records = config.setdefault(op['section'], [])
+            # 生产情况可能是列式的 ProductionColumns
+            columnar = hasattr(records, 'remove_ranges')
+            if op['op'] == 'add':
+                if columnar:
+                    records.append_record(op['record'])
+                else:
+                    records.append(op['record'])
+            elif op['op'] == 'delete':
+                rows = op['rows']
+                if rows and (rows[0] < 0 or rows[-1] >= len(records)):
+                    return count
+                # 连续的行一次删除，避免逐行移动列表
+                ranges = []
+                for row in reversed(rows):
+                    if ranges and row == ranges[-1][0] - 1:
+                        ranges[-1][0] = row
+                    else:
+                        ranges.append([row, row])
+                if columnar:
+                    records.remove_ranges([(start, end - start + 1) for start, end in ranges])
+                else:
+                    for start, end in ranges:
+                        del records[start:end + 1]
+            else:
+                return count
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return count
+    return len(ops)
+
+
+def _encode_line(entry: Dict) -> bytes:
+    body = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b'%08x ' % zlib.crc32(body) + body + b'\n'
+
+
+def _decode_line(line: bytes) -> Optional[Dict]:
+    if not line.endswith(b'\n') or len(line) < 10 or line[8:9] != b' ':
+        return None
+    body = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(body):
+            return None
+        return json.loads(body.decode('utf-8'))
+    except ValueError:
+        return None
+
+
+def _base_identity(file_path: str) -> Dict:
+    info = os.stat(file_path)
+    with open(file_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {'size': info.st_size, 'mtime_ns': info.st_mtime_ns, 'sha256': digest}
+
+
+def _matches_base(file_path: str, base: Dict) -> bool:
+    info = os.stat(file_path)
+    if info.st_size != base['size']:
+        return False
+    if info.st_mtime_ns == base['mtime_ns']:
+        return True
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest() == base['sha256']
+
+
+class ConfigJournal:
+    """某个配置文件对应的操作日志"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.path = journal_path(file_path)
+        # 已确认有效的日志长度，None 表示尚未读取；追加时据此跳过重新读取
+        self._valid_length: Optional[int] = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def _read(self):
+        """返回 (有效操作列表, 有效内容的字节长度)，日志不属于当前快照时返回 (None, 0)"""
+        try:
+            with open(self.path, 'rb') as f:
+                header = _decode_line(f.readline())
+                if not header or header.get('format') != FORMAT_VERSION or \
+                        not _matches_base(self.file_path, header['base']):
+                    self._valid_length = None
+                    return None, 0
+                ops = []
+                valid_length = f.tell()
+                for line in f:
+                    entry = _decode_line(line)
+                    if entry is None:
+                        # 崩溃时写了一半的行，之后的内容全部丢弃
+                        break
+                    ops.append(entry)
+                    valid_length += len(line)
+        except (OSError, KeyError, TypeError):
+            ops, valid_length = None, 0
+        self._valid_length = valid_length if ops is not None else None
+        return ops, valid_length
+
+    def read_ops(self) -> List[Dict]:
+        """读取属于当前快照的全部有效操作"""
+        ops, _ = self._read()
+        return ops or []
+
+    def append(self, ops: List[Dict]):
+        """追加操作并同步到磁盘，耗时只与本次操作数量有关"""
+        if not ops:
+            return
+        if self._valid_length is None:
+            self._read()
+        data = b''.join(_encode_line(op) for op in ops)
+        if self._valid_length is None:
+            header = _encode_line({'format': FORMAT_VERSION, 'base': _base_identity(self.file_path)})
+            with open(self.path, 'wb') as f:
+                f.write(header + data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._valid_length = len(header) + len(data)
+            return
+        with open(self.path, 'r+b') as f:
+            # 截掉上次崩溃可能留下的半行
+            f.seek(self._valid_length)
+            f.truncate()
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._valid_length += len(data)
+
+    def discard(self):
+        self._valid_length = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,96 @@
+"""员工花名册Excel的流式读取（不依赖Qt）"""
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+EMPLOYEE_FIELDS = ['工号', '姓名', '设备编号', 'P/N', '工位', '基础产出']
+
+
+class ExcelImportError(Exception):
+    """Excel文件无法读取或列不符合员工数据格式"""
+
+
+def map_header(header_row) -> List[int]:
+    """根据表头找到每个员工字段所在的列号"""
+    header = [str(cell).strip() if cell is not None else "" for cell in header_row]
+    missing = [field for field in EMPLOYEE_FIELDS if field not in header]
+    if missing:
+        raise ExcelImportError(f"Excel表头缺少列: {', '.join(missing)}")
+    return [header.index(field) for field in EMPLOYEE_FIELDS]
+
+
+def _cell_text(value) -> str:
+    # Excel中的工号等数字列会被读成 float，例如 1001.0
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def normalize_employee_row(values, columns: List[int]) -> Optional[Dict]:
+    """把一行单元格转换为员工字典，缺少必填字段的行返回 None
+
+    基础产出不是必填字段：为空或不是数字时不写入该字段，之后可以按生产记录估算。
+    """
+    cells = [values[col] if col < len(values) else None for col in columns]
+    texts = ["" if cell is None else _cell_text(cell) for cell in cells]
+    if not all(texts[:5]):
+        return None
+    employee = dict(zip(EMPLOYEE_FIELDS[:5], texts[:5]))
+    try:
+        employee['基础产出'] = int(float(texts[5]))
+    except (ValueError, OverflowError):
+        pass
+    return employee
+
+
+def iter_employee_batches(file_path: str, batch_size: int = 1000,
+                          should_stop: Optional[Callable[[], bool]] = None
+                          ) -> Iterator[Tuple[List[Dict], int, int, List[int], List[int]]]:
+    """以只读模式逐行读取员工表，每 batch_size 行产出一次
+
+    产出 (batch, 已读行数, 总行数, 跳过的行号, 基础产出留空的行号)，总行数未知时为 0，
+    行号为Excel中的行号（表头为第1行），两个列表在读取过程中累积。
+    内存占用只与 batch_size 有关，与文件大小无关。
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ExcelImportError("未安装openpyxl，无法读取Excel文件")
+    if file_path.lower().endswith('.xls'):
+        raise ExcelImportError("不支持旧版.xls格式，请另存为.xlsx后再导入")
+
+    try:
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+    except (OSError, ValueError, KeyError) as e:
+        raise ExcelImportError(f"无法打开Excel文件: {str(e)}")
+
+    try:
+        sheet = workbook.active
+        total = max((sheet.max_row or 1) - 1, 0)
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = map_header(header)
+
+        batch = []
+        done = 0
+        skipped_rows: List[int] = []
+        no_output_rows: List[int] = []
+        for values in rows:
+            done += 1
+            if all(cell is None or cell == "" for cell in values):
+                continue
+            employee = normalize_employee_row(values, columns)
+            if employee is None:
+                skipped_rows.append(done + 1)
+            else:
+                if '基础产出' not in employee:
+                    no_output_rows.append(done + 1)
+                batch.append(employee)
+            if len(batch) >= batch_size:
+                yield batch, done, total, skipped_rows, no_output_rows
+                batch = []
+                if should_stop and should_stop():
+                    return
+        yield batch, done, total, skipped_rows, no_output_rows
+    finally:
+        workbook.close()
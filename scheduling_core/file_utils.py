@@ -0,0 +1,104 @@
+"""文件读写工具（不依赖Qt）"""
+import gc
+import io
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+# 进度回调: (已完成量, 总量)
+Progress = Callable[[int, int], None]
+
+
+class Cancelled(Exception):
+    """读写过程中被调用方取消，目标文件保持不变"""
+
+
+@contextmanager
+def atomic_write(file_path: str, mode: str = 'w', encoding: str = 'utf-8'):
+    """先写入同目录下的临时文件，成功后再替换目标文件
+
+    写入过程中出错或进程崩溃时，原文件保持不变。
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(file_path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            # mkstemp 创建的文件只有当前用户可读写，沿用原文件的权限
+            os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# gc_paused 的嵌套/并发计数，以及第一次进入前回收是否开启
+_gc_lock = threading.Lock()
+_gc_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def gc_paused():
+    """解析大文件期间暂停循环垃圾回收
+
+    解析会新建数百万个没有循环引用的对象，期间反复触发的全量回收越来越慢，
+    回收时一直持有GIL，界面线程会随之卡顿。
+    gc.disable() 作用于整个进程，暂停期间所有线程（包括界面线程）都不会做循环回收。
+    通常在文件线程中调用；可以嵌套或在多个线程中同时使用，最后一个退出时才恢复原来的状态。
+    """
+    global _gc_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_depth -= 1
+            if _gc_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+class ProgressReader:
+    """把内存中的文件内容按块交给解析器，每读一块报告进度并检查是否取消
+
+    YAML解析器从流中逐块读取，读取位置即解析进度；取消时在下一次读取中抛出 Cancelled。
+    """
+
+    def __init__(self, data: bytes, progress: Optional[Progress] = None,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        self._stream = io.BytesIO(data)
+        self.total = len(data)
+        self._progress = progress
+        self._should_stop = should_stop
+
+    def read(self, size: int = -1) -> bytes:
+        if self._should_stop is not None and self._should_stop():
+            raise Cancelled()
+        chunk = self._stream.read(size)
+        if self._progress is not None:
+            self._progress(self._stream.tell(), self.total)
+        return chunk
+
+
+def item_progress(total: int, progress: Optional[Progress] = None,
+                  should_stop: Optional[Callable[[], bool]] = None) -> Callable[[int], None]:
+    """返回按已写出条数调用的回调：报告 (条数, total)，已请求取消时抛出 Cancelled"""
+    def report(done: int):
+        if should_stop is not None and should_stop():
+            raise Cancelled()
+        if progress is not None:
+            progress(done, total)
+    return report
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""生产情况统计：按 P/N、设备、姓名、班次等分组的产出、工时、每小时产出及其分位数
+
+分组直接使用 ProductionColumns 字符串列的字典编码，不逐行解码字符串。
+增删单行时只更新对应分组；每组的每小时产出保存为有序列表，分位数随时可取。
+"""
+from bisect import bisect_left, insort
+from operator import truediv
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .production_store import ProductionColumns
+
+# 统计维度名称 -> 分组字段
+DIMENSIONS: Dict[str, Tuple[str, ...]] = {
+    'P/N': ('P/N',),
+    '设备': ('设备',),
+    '姓名': ('姓名',),
+    '班次': ('班次',),
+    '姓名+P/N': ('姓名', 'P/N'),
+}
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """有序序列的分位数（线性插值），q 取 0~100"""
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100.0
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+class GroupStats:
+    """一个分组的累计值；工时为0的记录计入产出和工时，但不计入每小时产出分布"""
+    __slots__ = ('count', 'output', 'hours', 'rates', 'rate_sum')
+
+    def __init__(self):
+        self.count = 0
+        self.output = 0.0
+        self.hours = 0.0
+        self.rates: List[float] = []
+        self.rate_sum = 0.0
+
+    def add(self, output: float, hours: float):
+        self.count += 1
+        self.output += output
+        self.hours += hours
+        if hours > 0:
+            rate = output / hours
+            insort(self.rates, rate)
+            self.rate_sum += rate
+
+    def remove(self, output: float, hours: float):
+        self.count -= 1
+        self.output -= output
+        self.hours -= hours
+        if hours > 0:
+            rate = output / hours
+            rates = self.rates
+            i = bisect_left(rates, rate)
+            if i < len(rates):
+                del rates[i]
+                self.rate_sum -= rate
+
+    @property
+    def rate(self) -> Optional[float]:
+        """总产出 / 总工时"""
+        return self.output / self.hours if self.hours > 0 else None
+
+    @property
+    def mean_rate(self) -> Optional[float]:
+        """各条记录每小时产出的平均值"""
+        return self.rate_sum / len(self.rates) if self.rates else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        return percentile(self.rates, q)
+
+
+class SummaryRow(NamedTuple):
+    key: Tuple[str, ...]
+    count: int
+    output: float
+    hours: float
+    rate: Optional[float]
+    mean_rate: Optional[float]
+    percentiles: Tuple[Optional[float], ...]
+
+
+class ProductionAnalytics:
+    """按一个维度分组的统计，随生产记录的增删增量更新
+
+    分组键为字段的字典编码：单字段维度直接使用整数编码，多字段维度使用编码元组。
+    """
+
+    def __init__(self, columns: ProductionColumns, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self.columns = columns
+        self.groups: Dict[Hashable, GroupStats] = {}
+        # 按分组值排序的键，分组增减时失效；group_version 随分组增减递增
+        self._sorted_keys: Optional[List[Hashable]] = None
+        self.group_version = 0
+        self.rebuild(columns)
+
+    def _keys(self, start: int, end: int) -> Iterable[Hashable]:
+        codes = [self.columns.strings[field].codes[start:end] for field in self.fields]
+        return codes[0] if len(codes) == 1 else zip(*codes)
+
+    def rebuild(self, columns: Optional[ProductionColumns] = None):
+        """重新计算全部分组：先按编码分组收集，每组排序一次"""
+        if columns is not None:
+            self.columns = columns
+        outputs = self.columns.numbers['产出']
+        hours = self.columns.numbers['工时']
+        groups: Dict[tuple, GroupStats] = {}
+        for key, output, hour in zip(self._keys(0, len(self.columns)), outputs, hours):
+            stats = groups.get(key)
+            if stats is None:
+                groups[key] = stats = GroupStats()
+            stats.count += 1
+            stats.output += output
+            stats.hours += hour
+            if hour > 0:
+                stats.rates.append(output / hour)
+        for stats in groups.values():
+            stats.rates.sort()
+            stats.rate_sum = sum(stats.rates)
+        self.groups = groups
+        self._groups_changed()
+
+    def add_rows(self, start: int, end: int):
+        """行 [start, end) 已加入 columns 后调用"""
+        self._apply(start, end, GroupStats.add)
+
+    def remove_rows(self, start: int, end: int):
+        """行 [start, end) 从 columns 删除之前调用"""
+        touched = self._apply(start, end, GroupStats.remove)
+        for key in touched:
+            if self.groups[key].count <= 0:
+                del self.groups[key]
+                self._groups_changed()
+
+    def _apply(self, start: int, end: int, update) -> set:
+        outputs = self.columns.numbers['产出'][start:end]
+        hours = self.columns.numbers['工时'][start:end]
+        touched = set()
+        for key, output, hour in zip(self._keys(start, end), outputs, hours):
+            stats = self.groups.get(key)
+            if stats is None:
+                self.groups[key] = stats = GroupStats()
+                self._groups_changed()
+            update(stats, output, hour)
+            touched.add(key)
+        return touched
+
+    def _groups_changed(self):
+        self._sorted_keys = None
+        self.group_version += 1
+
+    def decode(self, key: Hashable) -> Tuple[str, ...]:
+        if len(self.fields) == 1:
+            return (self.columns.strings[self.fields[0]].values[key],)
+        return tuple(self.columns.strings[field].values[code] for field, code in zip(self.fields, key))
+
+    def sorted_keys(self) -> List[Hashable]:
+        """按分组值排序的分组键（供界面按行显示）"""
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.groups, key=lambda key: tuple(map(str, self.decode(key))))
+        return self._sorted_keys
+
+    def row(self, key: Hashable, percentiles: Sequence[float] = (50, 90)) -> SummaryRow:
+        stats = self.groups[key]
+        return SummaryRow(self.decode(key), stats.count, stats.output, stats.hours, stats.rate,
+                          stats.mean_rate, tuple(stats.percentile(q) for q in percentiles))
+
+    def get(self, *values: str) -> Optional[GroupStats]:
+        """按字段值查询分组，如 get('张三', 'PN1')"""
+        key = []
+        for field, value in zip(self.fields, values):
+            code = self.columns.strings[field].lookup.get(value)
+            if code is None:
+                return None
+            key.append(code)
+        return self.groups.get(key[0] if len(key) == 1 else tuple(key))
+
+    def summary(self, percentiles: Sequence[float] = (50, 90)) -> List[SummaryRow]:
+        """各分组的汇总，按分组值排序"""
+        return [self.row(key, percentiles) for key in self.sorted_keys()]
+
+    def total(self) -> GroupStats:
+        """全部记录的合计（不含分位数）"""
+        total = GroupStats()
+        for stats in self.groups.values():
+            total.count += stats.count
+            total.output += stats.output
+            total.hours += stats.hours
+        return total
+
+
+def rates_for(columns: ProductionColumns, rows: Iterable[int]) -> List[float]:
+    """指定行的每小时产出（跳过工时为0的记录）"""
+    outputs = columns.numbers['产出']
+    hours = columns.numbers['工时']
+    return [truediv(outputs[row], hours[row]) for row in rows if hours[row] > 0]
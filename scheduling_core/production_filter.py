@@ -0,0 +1,154 @@
+"""生产情况的筛选与排序（不依赖Qt）
+
+筛选条件先在各字符串列的字典上求值，每个不同的取值只比较一次，得到"编码是否匹配"的掩码，
+再按编码数组逐行过滤。字典值的小写形式和规范化日期缓存在 ProductionSearchIndex 中，
+字典增长时只补充新增的取值，输入筛选条件时不再重复转换。
+"""
+import re
+import threading
+from array import array
+from itertools import compress, islice
+from operator import or_
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .production_store import NUMERIC_FIELDS, STRING_FIELDS, ProductionColumns
+
+_DATE_PARTS = re.compile(r'(\d{4})\D(\d{1,2})\D(\d{1,2})')
+
+
+def normalize_date(value) -> str:
+    """把 2024/1/5、2024-01-05 00:00:00 等写法统一为 2024-01-05，无法识别时返回空字符串"""
+    match = _DATE_PARTS.match(str(value).strip())
+    if not match:
+        return ''
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+class ProductionQuery(NamedTuple):
+    """筛选条件，空字符串表示不限"""
+    date_from: str = ''
+    date_to: str = ''
+    shift: str = ''  # 班次，完全相同
+    pn: str = ''  # P/N 包含（不区分大小写）
+    name: str = ''  # 姓名 包含
+    text: str = ''  # 以空格分隔的关键词，每个词须出现在某个文本列中
+
+    def is_empty(self) -> bool:
+        return not any(part.strip() for part in self)
+
+
+class ProductionSearchIndex:
+    """各字符串列字典值的小写形式和日期的规范形式，字典增长时增量补充；可在多个线程中使用"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 字段 -> (字典列表对象, 转换后的值)
+        self._lowered: Dict[str, Tuple[List, List[str]]] = {}
+        self._dates: Tuple[Optional[List], List[str]] = (None, [])
+
+    @staticmethod
+    def _extend(cache: Tuple[Optional[List], List[str]], values: List, convert) -> Tuple[List, List[str]]:
+        source, converted = cache
+        if source is not values or len(converted) > len(values):
+            converted = []
+        if len(converted) < len(values):
+            converted.extend(map(convert, islice(values, len(converted), None)))
+        return values, converted
+
+    def lowered(self, columns: ProductionColumns, field: str) -> List[str]:
+        values = columns.strings[field].values
+        with self._lock:
+            cache = self._extend(self._lowered.get(field, (None, [])), values, lambda value: str(value).lower())
+            self._lowered[field] = cache
+        return cache[1]
+
+    def dates(self, columns: ProductionColumns) -> List[str]:
+        with self._lock:
+            self._dates = self._extend(self._dates, columns.strings['日期'].values, normalize_date)
+            return self._dates[1]
+
+
+def _mask(values: Sequence, predicate: Callable[[str], bool]) -> bytearray:
+    return bytearray(map(predicate, values))
+
+
+def _code_masks(columns: ProductionColumns, query: ProductionQuery,
+                index: ProductionSearchIndex) -> List[Tuple[str, bytearray]]:
+    """各筛选条件对应的 (字段, 编码掩码)；关键词条件单独处理"""
+    masks = []
+    date_from = normalize_date(query.date_from) if query.date_from.strip() else ''
+    date_to = normalize_date(query.date_to) if query.date_to.strip() else ''
+    if query.date_from.strip() and not date_from or query.date_to.strip() and not date_to:
+        raise ValueError("日期格式应为 年-月-日，如 2024-01-31")
+    if date_from or date_to:
+        upper = date_to or '9999-99-99'
+        masks.append(('日期', _mask(index.dates(columns), lambda date: bool(date) and date_from <= date <= upper)))
+    if query.shift.strip():
+        shift = query.shift.strip()
+        masks.append(('班次', _mask(columns.strings['班次'].values, lambda value: str(value) == shift)))
+    for field, text in (('P/N', query.pn), ('姓名', query.name)):
+        needle = text.strip().lower()
+        if needle:
+            masks.append((field, _mask(index.lowered(columns, field), lambda value: needle in value)))
+    # 匹配的取值越少越先过滤，后面的条件需要检查的行更少
+    masks.sort(key=lambda item: sum(item[1]))
+    return masks
+
+
+def filter_rows(columns: ProductionColumns, query: ProductionQuery, index: ProductionSearchIndex,
+                start: int = 0, end: Optional[int] = None,
+                should_stop: Optional[Callable[[], bool]] = None) -> Optional[array]:
+    """返回 [start, end) 中满足条件的行号（升序）；should_stop 返回 True 时放弃并返回 None"""
+    end = len(columns) if end is None else end
+    rows: Optional[array] = None
+    for field, mask in _code_masks(columns, query, index):
+        if should_stop and should_stop():
+            return None
+        if all(mask):
+            continue
+        codes = columns.strings[field].codes
+        if rows is None:
+            rows = array('I', compress(range(start, end), map(mask.__getitem__, codes[start:end])))
+        else:
+            rows = array('I', compress(rows, map(mask.__getitem__, map(codes.__getitem__, rows))))
+        if not rows:
+            return rows
+
+    for word in query.text.lower().split():
+        if should_stop and should_stop():
+            return None
+        if rows is None:
+            rows = array('I', range(start, end))
+        # 关键词出现在任一文本列即可
+        hits = None
+        for field in STRING_FIELDS:
+            mask = _mask(index.lowered(columns, field), lambda value: word in value)
+            if not any(mask):
+                continue
+            codes = columns.strings[field].codes
+            found = bytes(map(mask.__getitem__, map(codes.__getitem__, rows)))
+            hits = found if hits is None else bytes(map(or_, hits, found))
+        rows = array('I', compress(rows, hits)) if hits is not None else array('I')
+        if not rows:
+            return rows
+
+    return rows if rows is not None else array('I', range(start, end))
+
+
+def sort_rows(columns: ProductionColumns, rows: Optional[Sequence[int]], field: str,
+              descending: bool = False) -> array:
+    """按一列排序行号（稳定排序），rows 为 None 时排序全部行"""
+    if rows is None:
+        rows = range(len(columns))
+    if field in NUMERIC_FIELDS:
+        keys = columns.numbers[field]
+    else:
+        # 先给字典值排名，行比较整数名次而不是字符串
+        column = columns.strings[field]
+        order = sorted(range(len(column.values)), key=lambda code: str(column.values[code]))
+        rank = [0] * len(order)
+        for position, code in enumerate(order):
+            rank[code] = position
+        keys = list(map(rank.__getitem__, column.codes))
+    return array('I', sorted(rows, key=keys.__getitem__, reverse=descending))
\ No newline at end of file
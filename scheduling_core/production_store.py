@@ -0,0 +1,194 @@
+"""生产情况数据的列式存储（不依赖Qt，可供界面与算法代码共用）"""
+import sys
+from array import array
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+PRODUCTION_FIELDS = ['排班批次', '日期', '班次', 'P/N', '设备', '姓名', '产出', '工时']
+STRING_FIELDS = PRODUCTION_FIELDS[:6]
+NUMERIC_FIELDS = PRODUCTION_FIELDS[6:]
+
+
+class StringColumn:
+    """字典编码的字符串列：每个不同的值只保存一份，每行只存一个整数编码"""
+    __slots__ = ('values', 'lookup', 'codes')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.lookup: Dict[str, int] = {}
+        self.codes = array('I')
+
+    def encode(self, value) -> int:
+        """返回值对应的编码，新值会加入字典"""
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            if type(value) is str:
+                value = sys.intern(value)
+            self.values.append(value)
+            self.lookup[value] = code
+        return code
+
+    def append(self, value):
+        self.codes.append(self.encode(value))
+
+    def extend(self, values: Iterable):
+        self.codes.extend(map(self.encode, values))
+
+    def to_list(self) -> List:
+        return list(map(self.values.__getitem__, self.codes))
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class ProductionColumns:
+    """按列保存生产情况记录：字符串列做字典编码，产出/工时使用 double 数组"""
+
+    def __init__(self):
+        self.strings = {field: StringColumn() for field in STRING_FIELDS}
+        self.numbers = {field: array('d') for field in NUMERIC_FIELDS}
+        # 按表格列顺序排列，便于模型按列号取值
+        self.columns = [self.strings[field] for field in STRING_FIELDS] + \
+                       [self.numbers[field] for field in NUMERIC_FIELDS]
+        # 每次修改数据时递增，供依赖历史数据的缓存判断是否失效
+        self.version = 0
+        # 字段 -> 编码 -> 行号，第一次按字段查询时建立；追加行时增量更新，删除行后在下次查询时重建
+        self._row_index: Dict[str, Dict[int, array]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'ProductionColumns':
+        columns = cls()
+        columns.extend_records(records)
+        return columns
+
+    def extend_records(self, records: Iterable[Dict]):
+        """批量追加记录，逐列一次性写入"""
+        if not isinstance(records, list):
+            records = list(records)
+        if not records:
+            return
+        start = len(self)
+        for field, column in self.strings.items():
+            column.extend(map(itemgetter(field), records))
+        for field, column in self.numbers.items():
+            column.extend(map(float, map(itemgetter(field), records)))
+        self._index_rows(start)
+        self.version += 1
+
+    def append_record(self, record: Dict):
+        # 先取出全部值，缺少字段或数值无效时不会只追加一部分列
+        strings = [record[field] for field in STRING_FIELDS]
+        numbers = [float(record[field]) for field in NUMERIC_FIELDS]
+        for column, value in zip(self.strings.values(), strings):
+            column.append(value)
+        for column, value in zip(self.numbers.values(), numbers):
+            column.append(value)
+        self._index_rows(len(self) - 1)
+        self.version += 1
+
+    def remove_range(self, start: int, count: int):
+        """删除从 start 开始的连续 count 行"""
+        end = start + count
+        for column in self.strings.values():
+            del column.codes[start:end]
+        for column in self.numbers.values():
+            del column[start:end]
+        self._row_index.clear()
+        self.version += 1
+
+    def remove_ranges(self, ranges: Iterable[Tuple[int, int]]):
+        """删除多个互不相交的 (起始行, 行数) 区间，每列只重建一次"""
+        kept = []
+        pos = 0
+        for start, count in sorted(ranges):
+            if start > pos:
+                kept.append((pos, start))
+            pos = max(pos, start + count)
+        if pos < len(self):
+            kept.append((pos, len(self)))
+
+        for column in self.strings.values():
+            column.codes[:] = self._compact(column.codes, kept)
+        for column in self.numbers.values():
+            column[:] = self._compact(column, kept)
+        self._row_index.clear()
+        self.version += 1
+
+    @staticmethod
+    def _compact(values: array, kept: List[Tuple[int, int]]) -> array:
+        result = array(values.typecode)
+        for start, end in kept:
+            result.extend(values[start:end])
+        return result
+
+    def copy(self) -> 'ProductionColumns':
+        """数据的独立副本（数组整块复制，不含行索引），可以交给后台线程读取"""
+        columns = ProductionColumns()
+        for field, column in self.strings.items():
+            target = columns.strings[field]
+            target.values = list(column.values)
+            target.lookup = dict(column.lookup)
+            target.codes.extend(column.codes)
+        for field, values in self.numbers.items():
+            columns.numbers[field].extend(values)
+        columns.version = self.version
+        return columns
+
+    def clear(self):
+        version = self.version
+        self.__init__()
+        self.version = version + 1
+
+    def rows_for(self, field: str, value) -> List[int]:
+        """字符串列等于 value 的行号，如某员工的全部生产记录"""
+        column = self.strings[field]
+        code = column.lookup.get(value)
+        if code is None:
+            return []
+        index = self._row_index.get(field)
+        if index is None:
+            index = self._row_index[field] = {}
+            self._add_to_row_index(index, column.codes, 0)
+        rows = index.get(code)
+        return rows.tolist() if rows is not None else []
+
+    def _index_rows(self, start: int):
+        for field, index in self._row_index.items():
+            self._add_to_row_index(index, self.strings[field].codes[start:], start)
+
+    @staticmethod
+    def _add_to_row_index(index: Dict[int, array], codes: Iterable[int], start: int):
+        for row, code in enumerate(codes, start):
+            rows = index.get(code)
+            if rows is None:
+                index[code] = rows = array('I')
+            rows.append(row)
+
+    def value(self, row: int, col: int):
+        return self.columns[col][row]
+
+    def record(self, row: int) -> Dict:
+        return {field: column[row] for field, column in zip(PRODUCTION_FIELDS, self.columns)}
+
+    def to_records(self) -> List[Dict]:
+        """转换回YAML使用的字典列表"""
+        lists = [self.strings[field].to_list() for field in STRING_FIELDS] + \
+                [self.numbers[field].tolist() for field in NUMERIC_FIELDS]
+        return [dict(zip(PRODUCTION_FIELDS, values)) for values in zip(*lists)]
+
+    def iter_records(self, chunk_size: int = 1000) -> Iterator[Dict]:
+        """逐条生成字典形式的记录，同一时间只有 chunk_size 条记录在内存中，用于流式保存"""
+        for start in range(0, len(self), chunk_size):
+            end = min(start + chunk_size, len(self))
+            lists = [list(map(column.values.__getitem__, column.codes[start:end]))
+                     for column in self.strings.values()] + \
+                    [column[start:end].tolist() for column in self.numbers.values()]
+            for values in zip(*lists):
+                yield dict(zip(PRODUCTION_FIELDS, values))
+
+    def __len__(self):
+        return len(self.numbers['产出'])
@@ -0,0 +1,167 @@
+"""排班结果缓存（不依赖Qt）
+
+键为排班参数和管理配置（只含求解用到的员工、拉线、特殊工位）规范化后的SHA-256，
+并包含求解器版本号，输入或求解逻辑任何变化都会得到新的键。
+结果以压缩JSON保存在本地目录中，总大小超过上限时按最近使用时间淘汰。
+只缓存完整求解的结果，超时或取消的结果与当时的机器负载有关，不缓存。
+"""
+import hashlib
+import json
+import os
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .config_index import ConfigIndex
+from .file_utils import atomic_write
+from .scheduling_engine import SOLVER_VERSION, ScheduleResult, solve
+
+CACHE_DIR_ENV = 'AI_SCHEDULING_CACHE_DIR'
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'results')
+DEFAULT_MAX_BYTES = 256 << 20
+FORMAT_VERSION = 1
+# 求解只用到配置中的这些部分，生产情况等变化不影响结果
+CONFIG_KEYS = ('employees', 'lines', 'special_stations')
+SUFFIX = '.result'
+
+
+def _canonical(data) -> bytes:
+    try:
+        # 不指定 default 时使用C实现的编码器，大配置的哈希快得多
+        return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('ascii')
+    except TypeError:
+        # 含有日期等JSON不支持的值
+        return json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode('ascii')
+
+
+def config_digest(config: Dict) -> str:
+    """管理配置中与求解有关部分的哈希；多次求解同一配置时只需计算一次"""
+    digest = hashlib.sha256()
+    for key in CONFIG_KEYS:
+        digest.update(key.encode('utf-8'))
+        digest.update(_canonical(config.get(key, [])))
+    return digest.hexdigest()
+
+
+def normalize_schedule(schedule: Dict) -> Dict:
+    """按求解时的方式把数值统一为浮点数，40 与 40.0 得到相同的键"""
+    return {
+        'total_work_hours': float(schedule['total_work_hours']),
+        'day_shift_hours': float(schedule['day_shift_hours']),
+        'night_shift_hours': float(schedule['night_shift_hours']),
+        # 需求顺序决定结果中的产品顺序，保留原顺序；求解按字符串匹配P/N，1001 与 '1001' 得到相同的键
+        'demands': [[str(item['P_N']), float(item['demand'])] for item in schedule['demands']],
+    }
+
+
+def cache_key(schedule: Dict, config_hash: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"solver={SOLVER_VERSION};format={FORMAT_VERSION};config={config_hash};".encode('utf-8'))
+    digest.update(_canonical(normalize_schedule(schedule)))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """本地磁盘上的排班结果缓存，读写失败时视为未命中"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Optional[ScheduleResult]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+            result = ScheduleResult.from_dict(data)
+        except OSError:
+            return None
+        except (ValueError, KeyError, TypeError, zlib.error):
+            # 损坏的缓存文件直接删除
+            self._remove(path)
+            return None
+        try:
+            # 更新访问时间，淘汰时按最近使用排序
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: ScheduleResult):
+        if result.status != 'solved':
+            return
+        try:
+            payload = zlib.compress(json.dumps(result.to_dict(), ensure_ascii=False).encode('utf-8'), 1)
+            if len(payload) > self.max_bytes:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            with atomic_write(self._path(key), 'wb') as f:
+                f.write(payload)
+            self.evict()
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(SUFFIX):
+                        try:
+                            info = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((info.st_mtime, info.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """删除最久未使用的结果，直到总大小不超过上限"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_cached(cache: ResultCache, key: str, schedule: Dict) -> Optional[ScheduleResult]:
+    """读取缓存结果，并在结果中显示本次输入的原始数值"""
+    result = cache.get(key)
+    if result is not None:
+        result.schedule = dict(schedule)
+        result.from_cache = True
+    return result
+
+
+def solve_cached(schedule: Dict, config: Dict, cache: Optional[ResultCache],
+                 should_stop: Optional[Callable[[], bool]] = None, time_limit: Optional[float] = None,
+                 index: Optional[ConfigIndex] = None, config_hash: Optional[str] = None) -> ScheduleResult:
+    """先查缓存，未命中时求解并写入缓存；cache 为 None 时等同于 solve"""
+    if cache is None:
+        return solve(schedule, config, should_stop, time_limit, index)
+    key = cache_key(schedule, config_hash or config_digest(config))
+    result = load_cached(cache, key, schedule)
+    if result is not None:
+        return result
+    result = solve(schedule, config, should_stop, time_limit, index)
+    cache.put(key, result)
+    return result
\ No newline at end of file
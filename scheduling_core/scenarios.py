@@ -0,0 +1,138 @@
+"""排班方案对比：由当前排班参数生成多个变体，在进程池中并行求解（不依赖Qt）
+
+变体由两部分组合而成：白班时长（夜班 = 总工时 - 白班）和需求系数（各P/N需求同时乘以该系数）。
+管理配置只在每个工作进程启动时传入一次，并在进程内建立一次索引，之后的方案共用；
+传入结果缓存时，已经求解过的方案直接取缓存结果。
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import product
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from .config_index import ConfigIndex
+from .result_cache import ResultCache, config_digest, solve_cached
+from .scheduling_engine import ScheduleResult
+
+
+class Scenario(NamedTuple):
+    name: str
+    schedule: Dict
+    demand_factor: float
+
+
+class ScenarioOutcome(NamedTuple):
+    """一个方案的求解结果；求解出错时 result 为 None，error 为错误信息"""
+    scenario: Scenario
+    result: Optional[ScheduleResult]
+    error: str
+    wall_time: float
+
+
+def scale_demands(schedule: Dict, factor: float) -> Dict:
+    data = dict(schedule)
+    data['demands'] = [{**item, 'demand': item['demand'] * factor} for item in schedule['demands']]
+    return data
+
+
+def split_shifts(schedule: Dict, day_hours: float) -> Dict:
+    data = dict(schedule)
+    data['day_shift_hours'] = day_hours
+    data['night_shift_hours'] = schedule['total_work_hours'] - day_hours
+    return data
+
+
+def build_scenarios(schedule: Dict, day_hours: Sequence[float] = (),
+                    demand_factors: Sequence[float] = (1.0,)) -> List[Scenario]:
+    """白班时长 × 需求系数 的全部组合；day_hours 为空时只用当前的班次划分"""
+    total = float(schedule['total_work_hours'])
+    splits = list(dict.fromkeys(day_hours)) or [float(schedule['day_shift_hours'])]
+    for hours in splits:
+        if not 0 <= hours <= total:
+            raise ValueError(f"白班时间 {hours:g} 应在 0 到总工作时间 {total:g} 之间")
+    for factor in demand_factors:
+        if factor <= 0:
+            raise ValueError(f"需求系数 {factor:g} 应为正数")
+
+    scenarios = []
+    for hours, factor in product(splits, dict.fromkeys(demand_factors)):
+        name = f"白班{hours:g}h/夜班{total - hours:g}h 需求{(factor - 1) * 100:+.4g}%"
+        scenarios.append(Scenario(name, scale_demands(split_shifts(schedule, hours), factor), factor))
+    return scenarios
+
+
+# 工作进程内的配置、索引和结果缓存，由 _init_worker 设置
+_worker_config: Optional[Dict] = None
+_worker_index: Optional[ConfigIndex] = None
+_worker_cache: Optional[ResultCache] = None
+_worker_config_hash: Optional[str] = None
+
+
+def _init_worker(config: Dict, cache: Optional[ResultCache], config_hash: Optional[str]):
+    global _worker_config, _worker_index, _worker_cache, _worker_config_hash
+    _worker_config = config
+    _worker_index = ConfigIndex.from_config(config)
+    _worker_cache = cache
+    _worker_config_hash = config_hash
+
+
+def _solve_in_worker(schedule: Dict, time_limit: Optional[float]) -> ScheduleResult:
+    return solve_cached(schedule, _worker_config, _worker_cache, time_limit=time_limit,
+                        index=_worker_index, config_hash=_worker_config_hash)
+
+
+def default_workers(count: int) -> int:
+    return max(1, min(count, os.cpu_count() or 1))
+
+
+def iter_scenario_results(scenarios: Iterable[Scenario], config: Dict,
+                          time_limit: Optional[float] = None, max_workers: Optional[int] = None,
+                          should_stop: Optional[Callable[[], bool]] = None,
+                          cache: Optional[ResultCache] = None) -> Iterator[ScenarioOutcome]:
+    """并行求解各方案，按完成顺序逐个返回
+
+    should_stop 返回 True 时不再启动尚未开始的方案；正在求解的方案最多再运行 time_limit 秒。
+    """
+    scenarios = list(scenarios)
+    if not scenarios:
+        return
+    workers = max_workers or default_workers(len(scenarios))
+    config_hash = config_digest(config) if cache is not None else None
+    # 界面进程中已有其他线程，使用 spawn 避免 fork 带来的死锁风险，行为也与 Windows 一致
+    executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_init_worker, initargs=(config, cache, config_hash))
+    pending = {}
+    try:
+        start = time.perf_counter()
+        pending = {executor.submit(_solve_in_worker, scenario.schedule, time_limit): scenario
+                   for scenario in scenarios}
+        while pending:
+            done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            if should_stop and should_stop():
+                break
+            for future in done:
+                scenario = pending.pop(future)
+                wall_time = time.perf_counter() - start
+                try:
+                    yield ScenarioOutcome(scenario, future.result(), "", wall_time)
+                except (KeyError, TypeError, ValueError) as e:
+                    yield ScenarioOutcome(scenario, None, f"排班数据无效: {str(e)}", wall_time)
+                except Exception as e:
+                    yield ScenarioOutcome(scenario, None, f"排班求解失败: {str(e)}", wall_time)
+    finally:
+        # 取消时不等待正在求解的方案结束
+        executor.shutdown(wait=not pending, cancel_futures=True)
+
+
+def scenario_metrics(result: ScheduleResult) -> Dict[str, float]:
+    """方案对比表中的关键指标"""
+    total_demand = sum(result.demand.values())
+    produced = sum(min(result.produced.get(pn, 0.0), demand) for pn, demand in result.demand.items())
+    return {
+        'objective': result.objective,
+        'fill_rate': produced / total_demand if total_demand else 1.0,
+        'employees_used': result.employees_used,
+        'runs': len({(a.shift, a.pn, a.device) for a in result.assignments}),
+        'solve_time': result.solve_time,
+    }
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""排班参数YAML的读写与校验（不依赖Qt），出错时抛出 ScheduleDataError"""
+from typing import Callable, Dict, Optional
+
+from . import yaml_backend
+from .file_utils import Progress, ProgressReader, atomic_write, gc_paused, item_progress
+from .schema import coerce_schedule, validate_schedule
+
+
+class ScheduleDataError(Exception):
+    """排班数据无效或无法读写；title/message 用于界面提示"""
+
+    def __init__(self, title: str, message: str):
+        super().__init__(message)
+        self.title = title
+        self.message = message
+
+
+def check_schedule_data(data: Dict) -> Optional[str]:
+    """检查排班数据，返回错误摘要，数据有效时返回 None"""
+    report = validate_schedule(data)
+    return None if report.ok else report.summary()
+
+
+def save_schedule(data: Dict, file_path: str, progress: Optional[Progress] = None,
+                  should_stop: Optional[Callable[[], bool]] = None):
+    """校验并保存排班数据；should_stop 返回 True 时抛出 Cancelled，原文件不变"""
+    message = check_schedule_data(data)
+    if message:
+        raise ScheduleDataError("数据验证错误", message)
+
+    try:
+        with atomic_write(file_path) as f:
+            yaml_backend.dump_document_streaming(
+                f, 'schedule', data, ('demands',),
+                progress=item_progress(len(data['demands']), progress, should_stop))
+    except (IOError, OSError, yaml_backend.YAMLError) as e:
+        raise ScheduleDataError("保存错误", f"保存YAML文件时出错: {str(e)}")
+
+
+def load_schedule(file_path: str, progress: Optional[Progress] = None,
+                  should_stop: Optional[Callable[[], bool]] = None) -> Dict:
+    """加载并校验排班数据；progress 按已解析的字节数报告，should_stop 返回 True 时抛出 Cancelled"""
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        with gc_paused():
+            yaml_data = yaml_backend.load(ProgressReader(raw, progress, should_stop))
+    except (IOError, OSError, UnicodeDecodeError, yaml_backend.YAMLError) as e:
+        raise ScheduleDataError("加载错误", f"加载YAML文件时出错: {str(e)}")
+
+    if not isinstance(yaml_data, dict) or 'schedule' not in yaml_data:
+        raise ScheduleDataError("加载错误", "YAML文件中缺少'schedule'键")
+
+    message = check_schedule_data(yaml_data['schedule'])
+    if message:
+        raise ScheduleDataError("数据验证错误", message)
+
+    return coerce_schedule(yaml_data['schedule'])
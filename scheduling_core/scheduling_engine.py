@@ -0,0 +1,377 @@
+"""排班求解引擎（不依赖Qt）
+
+输入为排班参数（一周总工时、白班/夜班时长、各P/N需求）和管理配置
+（员工、拉线、特殊工位），输出员工到 拉线×班次×工位 的分配。
+
+模型约定：
+* 每条拉线在每个班次可以开线一次，开线时其所需工位必须全部有人；
+* 每名员工在一个排班周期内只安排一个班次的一个工位；
+* 员工的工位必须与岗位一致，特殊工位只安排做过该P/N的员工；
+* 员工的基础产出按每小时件数计，一次开线的产出为
+  所有在岗员工基础产出的最小值（瓶颈工位）× 班次时长。
+目标是最小化各P/N的需求缺口之和，其次尽量少用人。
+"""
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from .config_index import ConfigIndex
+
+SHIFTS = ('白班', '夜班')
+# 求解逻辑变化（结果可能不同）时递增，旧的缓存结果随之失效
+SOLVER_VERSION = 2
+
+STATUS_TEXT = {
+    'solved': "完成",
+    'timeout': "超时（返回当前最好结果）",
+    'cancelled': "已取消",
+}
+
+
+class Assignment(NamedTuple):
+    shift: str
+    pn: str
+    device: str
+    station: str
+    employee_id: str
+    employee_name: str
+
+
+class ScheduleResult:
+    """一次求解的结果"""
+
+    def __init__(self, status: str, assignments: List[Assignment], produced: Dict[str, float],
+                 demand: Dict[str, float], schedule: Dict, solve_time: float):
+        self.status = status
+        self.assignments = assignments
+        self.produced = produced
+        self.demand = demand
+        self.schedule = schedule
+        self.solve_time = solve_time
+        # 是否取自结果缓存，此时 solve_time 为当初求解的耗时
+        self.from_cache = False
+        # 是否在上一次结果的基础上增量调整得到
+        self.incremental = False
+
+    def shortfall(self, pn: str) -> float:
+        return max(self.demand.get(pn, 0.0) - self.produced.get(pn, 0.0), 0.0)
+
+    @property
+    def objective(self) -> float:
+        """目标值：各P/N需求缺口之和"""
+        return sum(self.shortfall(pn) for pn in self.demand)
+
+    @property
+    def employees_used(self) -> int:
+        return len({assignment.employee_id for assignment in self.assignments})
+
+    def to_dict(self) -> Dict:
+        return {
+            'status': self.status,
+            'objective': self.objective,
+            'employees_used': self.employees_used,
+            'solve_time': self.solve_time,
+            'schedule': self.schedule,
+            'demand': self.demand,
+            'produced': self.produced,
+            'assignments': [
+                {'班次': a.shift, 'P/N': a.pn, '设备编号': a.device, '工位': a.station,
+                 '工号': a.employee_id, '姓名': a.employee_name}
+                for a in self.assignments
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScheduleResult':
+        assignments = [
+            Assignment(a['班次'], a['P/N'], a['设备编号'], a['工位'], a['工号'], a['姓名'])
+            for a in data['assignments']
+        ]
+        return cls(data['status'], assignments, dict(data['produced']), dict(data['demand']),
+                   data['schedule'], data['solve_time'])
+
+    def iter_text_lines(self) -> Iterator[str]:
+        """逐行生成在排班结果框中显示的文本"""
+        yield "排班结果："
+        yield ""
+        yield f"总工作时间: {self.schedule['total_work_hours']} 小时"
+        yield f"白班时间: {self.schedule['day_shift_hours']} 小时"
+        yield f"夜班时间: {self.schedule['night_shift_hours']} 小时"
+        yield ""
+        yield "产品需求:"
+        for pn, demand in self.demand.items():
+            yield (f"- {pn}: 需求 {demand:g} 件，计划产出 {self.produced.get(pn, 0.0):g} 件，"
+                   f"缺口 {self.shortfall(pn):g} 件")
+        yield ""
+        yield "排班明细:"
+        runs: Dict[tuple, List[Assignment]] = {}
+        for assignment in self.assignments:
+            runs.setdefault((assignment.shift, assignment.pn, assignment.device), []).append(assignment)
+        for (shift, pn, device), members in runs.items():
+            staff = "，".join(f"{a.station}-{a.employee_name}({a.employee_id})" for a in members)
+            yield f"[{shift}] {pn} / {device}: {staff}"
+        if not runs:
+            yield "（无可开线的拉线）"
+        yield ""
+        yield f"求解状态: {STATUS_TEXT.get(self.status, self.status)}"
+        yield f"目标值(需求缺口合计): {self.objective:g} 件"
+        yield f"使用人数: {self.employees_used}"
+        yield f"求解耗时: {self.solve_time:.3f} 秒"
+        if self.from_cache:
+            yield "（输入与之前的求解相同，结果取自缓存）"
+        elif self.incremental:
+            yield "（在上一次排班结果的基础上增量调整，未重新完整求解）"
+
+    def format_text(self) -> str:
+        """生成在排班结果框中显示的文本"""
+        return "\n".join(self.iter_text_lines())
+
+
+def _base_output(employee: Dict) -> float:
+    try:
+        return float(employee.get('基础产出', 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _EmployeePool:
+    """按 工位 / 工位+P/N / 工位+设备 分组的候选员工，组内按基础产出从高到低排列；分组在第一次用到时从索引取出"""
+
+    # 挑选顺序：同设备同P/N、同P/N、同设备、仅工位
+    TIERS = ((True, True), (True, False), (False, True), (False, False))
+
+    def __init__(self, index: ConfigIndex):
+        self.index = index
+        self.employees = index.employees.records
+        self.used = set()
+        self.base_output: Dict[int, float] = {}
+        self.groups: Dict[tuple, List[int]] = {}
+        # 每名员工所在的 (分组, 组内位置)，撤销挑选时用于回退游标
+        self.positions: Dict[int, List[tuple]] = {}
+        # 每个分组中已跳过的位置，已使用的员工不会再被检查
+        self.cursor: Dict[tuple, int] = {}
+
+    def rate(self, i: int) -> float:
+        rate = self.base_output.get(i)
+        if rate is None:
+            rate = self.base_output[i] = _base_output(self.employees[i])
+        return rate
+
+    def _group(self, key: tuple) -> List[int]:
+        members = self.groups.get(key)
+        if members is None:
+            station, pn, device = key
+            # 索引按加入顺序返回，稳定排序保证基础产出相同的员工按名单顺序挑选
+            members = sorted(self.index.qualified_employee_ids(station, pn, device), key=lambda i: -self.rate(i))
+            self.groups[key] = members
+            for pos, i in enumerate(members):
+                self.positions.setdefault(i, []).append((key, pos))
+        return members
+
+    def take(self, station: str, pn: str, device: str, special: bool) -> Optional[int]:
+        """为拉线的某个工位挑选一名员工，优先同设备同P/N，其次同P/N、同设备"""
+        tiers = self.TIERS[:2] if special else self.TIERS
+        for with_pn, with_device in tiers:
+            key = (station, pn if with_pn else None, device if with_device else None)
+            members = self._group(key)
+            if not members:
+                continue
+            pos = self.cursor.get(key, 0)
+            while pos < len(members) and members[pos] in self.used:
+                pos += 1
+            self.cursor[key] = pos
+            if pos < len(members):
+                self.used.add(members[pos])
+                return members[pos]
+        return None
+
+    def release(self, indexes: List[int]):
+        """撤销本次挑选（开线失败时调用）"""
+        for i in indexes:
+            self.used.discard(i)
+            for key, pos in self.positions.get(i, ()):
+                if self.cursor.get(key, 0) > pos:
+                    self.cursor[key] = pos
+
+
+class _Run(NamedTuple):
+    """一次开线"""
+    shift: str
+    line_id: int
+    members: List[int]  # 与拉线所需工位一一对应的员工
+    rate: float  # 瓶颈工位的每小时产出
+
+
+def _parse_schedule(schedule: Dict):
+    shift_hours = {'白班': float(schedule['day_shift_hours']), '夜班': float(schedule['night_shift_hours'])}
+    demand: Dict[str, float] = {}
+    for item in schedule['demands']:
+        # 直接传入的数据中P/N可能是整数，按字符串与拉线的P/N匹配
+        pn = str(item['P_N'])
+        demand[pn] = demand.get(pn, 0.0) + float(item['demand'])
+    return shift_hours, demand
+
+
+class IncrementalSolver:
+    """保留上一次求解的开线和员工占用状态，排班参数小幅修改后从原分配出发只修复受影响的P/N
+
+    修复规则：删除的P/N撤掉全部开线；产出超过需求的P/N从最后开的拉线撤起；有缺口的P/N
+    （含之前就没有补满的）用空闲员工继续开线。班次时长变化影响所有P/N，直接完整求解。
+    修复结果可行但不保证与完整求解相同；管理配置变化时应新建求解器。
+    """
+
+    # 需求变化的P/N超过这个比例时直接完整求解
+    FULL_SOLVE_RATIO = 0.5
+
+    def __init__(self, config: Dict, index: Optional[ConfigIndex] = None):
+        self.config = config
+        self.index = index if index is not None else ConfigIndex.from_config(config)
+        self.reset()
+
+    def reset(self):
+        self.pool = _EmployeePool(self.index)
+        self.runs: Dict[str, List[_Run]] = {}
+        self.produced: Dict[str, float] = {}
+        self.demand: Dict[str, float] = {}
+        self.shift_hours: Dict[str, float] = {}
+        self.has_solution = False
+
+    def _order(self) -> List[str]:
+        # 需求大的产品优先占用人员
+        return sorted(self.demand, key=lambda p: (-self.demand[p], p))
+
+    def solve(self, schedule: Dict, should_stop: Optional[Callable[[], bool]] = None,
+              time_limit: Optional[float] = None) -> ScheduleResult:
+        """丢弃之前的状态，完整求解"""
+        start = time.perf_counter()
+        self.reset()
+        self.shift_hours, self.demand = _parse_schedule(schedule)
+        self.runs = {pn: [] for pn in self.demand}
+        self.produced = {pn: 0.0 for pn in self.demand}
+        status = self._fill_all(self._order(), start, should_stop, time_limit)
+        self.has_solution = True
+        return self._result(status, schedule, start)
+
+    def resolve(self, schedule: Dict, should_stop: Optional[Callable[[], bool]] = None,
+                time_limit: Optional[float] = None) -> ScheduleResult:
+        """在上一次求解结果的基础上求解修改后的排班参数"""
+        if not self.has_solution:
+            return self.solve(schedule, should_stop, time_limit)
+        start = time.perf_counter()
+        shift_hours, demand = _parse_schedule(schedule)
+        if shift_hours != self.shift_hours:
+            # 班次时长变化时每个P/N的开线都要重新安排，在旧开线上修补的结果明显差于完整求解
+            return self.solve(schedule, should_stop, time_limit)
+        changed = [pn for pn in demand.keys() | self.demand.keys() if demand.get(pn) != self.demand.get(pn)]
+        if len(changed) > self.FULL_SOLVE_RATIO * max(len(demand), 1):
+            return self.solve(schedule, should_stop, time_limit)
+
+        for pn in self.demand.keys() - demand.keys():
+            self._drop_runs(pn, 0)
+            del self.runs[pn], self.produced[pn]
+        self.demand = demand
+        for pn in demand:
+            self.runs.setdefault(pn, [])
+            self.produced.setdefault(pn, 0.0)
+
+        for pn in demand:
+            self._trim(pn)
+        short = [pn for pn in self._order() if self.produced[pn] < self.demand[pn]]
+        status = self._fill_all(short, start, should_stop, time_limit)
+        result = self._result(status, schedule, start)
+        result.incremental = True
+        return result
+
+    def _drop_runs(self, pn: str, keep: int):
+        runs = self.runs[pn]
+        while len(runs) > keep:
+            run = runs.pop()
+            self.pool.release(run.members)
+            self.produced[pn] -= run.rate * self.shift_hours[run.shift]
+
+    def _trim(self, pn: str):
+        """撤掉多余的开线：从最后开的拉线起，撤掉后仍满足需求就撤"""
+        runs = self.runs[pn]
+        keep = len(runs)
+        produced = self.produced[pn]
+        while keep:
+            run = runs[keep - 1]
+            remaining = produced - run.rate * self.shift_hours[run.shift]
+            if remaining < self.demand[pn]:
+                break
+            produced = remaining
+            keep -= 1
+        self._drop_runs(pn, keep)
+
+    def _fill_all(self, pns: List[str], start: float, should_stop: Optional[Callable[[], bool]],
+                  time_limit: Optional[float]) -> str:
+        for pn in pns:
+            status = self._fill(pn, start, should_stop, time_limit)
+            if status != 'solved':
+                return status
+        return 'solved'
+
+    def _fill(self, pn: str, start: float, should_stop: Optional[Callable[[], bool]],
+              time_limit: Optional[float]) -> str:
+        """为一个P/N继续开线直到满足需求或没有可用的拉线/员工"""
+        pool = self.pool
+        runs = self.runs[pn]
+        opened = {(run.shift, run.line_id) for run in runs}
+        lines = self.index.lines
+        # 班次按时长从长到短尝试
+        for shift in sorted(SHIFTS, key=lambda shift: -self.shift_hours[shift]):
+            hours = self.shift_hours[shift]
+            if hours <= 0:
+                continue
+            for line_id in lines.lookup_ids('pn', pn):
+                if self.produced[pn] >= self.demand[pn]:
+                    break
+                if should_stop and should_stop():
+                    return 'cancelled'
+                if time_limit is not None and time.perf_counter() - start > time_limit:
+                    return 'timeout'
+                if (shift, line_id) in opened:
+                    continue
+
+                line = lines.get(line_id)
+                chosen = []
+                for station in line['所需工位']:
+                    i = pool.take(station, pn, line['设备编号'], self.index.is_special_station(station))
+                    if i is None:
+                        break
+                    chosen.append(i)
+                if len(chosen) < len(line['所需工位']) or not chosen:
+                    pool.release(chosen)
+                    continue
+
+                rate = min(pool.rate(i) for i in chosen)
+                runs.append(_Run(shift, line_id, chosen, rate))
+                self.produced[pn] += rate * hours
+        return 'solved'
+
+    def _result(self, status: str, schedule: Dict, start: float) -> ScheduleResult:
+        employees = self.pool.employees
+        lines = self.index.lines
+        assignments: List[Assignment] = []
+        for pn in self._order():
+            for run in self.runs[pn]:
+                line = lines.get(run.line_id)
+                for station, i in zip(line['所需工位'], run.members):
+                    emp = employees[i]
+                    assignments.append(Assignment(run.shift, pn, line['设备编号'], station,
+                                                  str(emp.get('工号', '')), str(emp.get('姓名', ''))))
+        produced = {pn: self.produced[pn] for pn in self.demand}
+        return ScheduleResult(status, assignments, produced, dict(self.demand), dict(schedule),
+                              time.perf_counter() - start)
+
+
+def solve(schedule: Dict, config: Dict, should_stop: Optional[Callable[[], bool]] = None,
+          time_limit: Optional[float] = None, index: Optional[ConfigIndex] = None) -> ScheduleResult:
+    """求解排班，可通过 should_stop 取消，超过 time_limit 秒时返回当前结果
+
+    已有配置索引（如管理界面维护的索引）时通过 index 传入，不再重新建立。
+    """
+    start = time.perf_counter()
+    result = IncrementalSolver(config, index).solve(schedule, should_stop, time_limit)
+    # 求解耗时包括建立索引
+    result.solve_time = time.perf_counter() - start
+    return result
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""界面中连续多次求解排班（不依赖Qt）
+
+先查结果缓存；未命中时，如果管理配置与上一次相同，则在上一次求解状态的基础上增量求解，
+否则完整求解。只有完整求解的结果写入缓存，缓存中的结果始终与 solve() 一致。
+"""
+from typing import Callable, Dict, Optional
+
+from .result_cache import ResultCache, cache_key, config_digest, load_cached
+from .scheduling_engine import IncrementalSolver, ScheduleResult
+
+
+class SchedulingSession:
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = cache
+        self.solver: Optional[IncrementalSolver] = None
+        self.config_hash: Optional[str] = None
+
+    def reset(self):
+        """丢弃上一次的求解状态，下次完整求解"""
+        self.solver = None
+        self.config_hash = None
+
+    def solve(self, schedule: Dict, config: Dict, should_stop: Optional[Callable[[], bool]] = None,
+              time_limit: Optional[float] = None, incremental: bool = True) -> ScheduleResult:
+        config_hash = config_digest(config)
+        key = cache_key(schedule, config_hash)
+        if self.cache is not None:
+            result = load_cached(self.cache, key, schedule)
+            if result is not None:
+                return result
+
+        if incremental and self.solver is not None and config_hash == self.config_hash:
+            result = self.solver.resolve(schedule, should_stop, time_limit)
+        else:
+            self.solver = IncrementalSolver(config)
+            self.config_hash = config_hash
+            result = self.solver.solve(schedule, should_stop, time_limit)
+        if self.cache is not None and not result.incremental:
+            self.cache.put(key, result)
+        return result
@@ -0,0 +1,290 @@
+"""管理配置和排班参数的数据格式（不依赖Qt）
+
+两种文档的字段和类型在 CONFIG_SCHEMA / SCHEDULE_SCHEMA 中声明一次，导入时编译为校验函数：
+每个字段的检查函数预先选好，校验时按列检查，整列快速检查失败才逐个查找出错的行，
+不会对每条记录查找格式定义。校验收集全部错误，而不是遇到第一个错误就返回。
+"""
+import datetime
+from array import array
+from operator import itemgetter, methodcaller
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+SECTION_NAMES = {
+    'config': "配置",
+    'employees_excel_path': "Excel路径",
+    'employees': "员工",
+    'lines': "拉线",
+    'special_stations': "特殊工位",
+    'productions': "生产情况",
+    'schedule': "排班参数",
+    'total_work_hours': "一周工作总时间",
+    'day_shift_hours': "白班时间",
+    'night_shift_hours': "夜班时间",
+    'demands': "需求",
+}
+
+_MISSING = object()
+
+
+class ValidationIssue(NamedTuple):
+    section: str
+    index: Optional[int]  # 出错的行号（从0开始），整段出错时为 None
+    field: Optional[str]
+    message: str
+
+
+class ValidationReport:
+    """校验结果：记录所有出错的行和字段"""
+
+    def __init__(self):
+        self.issues: List[ValidationIssue] = []
+
+    def add(self, section: str, index: Optional[int], field: Optional[str], message: str):
+        self.issues.append(ValidationIssue(section, index, field, message))
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def bad_rows(self, section: str) -> List[int]:
+        """返回某一部分中所有出错的行号"""
+        return sorted({issue.index for issue in self.issues
+                       if issue.section == section and issue.index is not None})
+
+    def summary(self, limit: int = 20) -> str:
+        """生成适合在消息框中显示的错误摘要"""
+        lines = []
+        for issue in self.issues[:limit]:
+            text = SECTION_NAMES.get(issue.section, issue.section)
+            if issue.index is not None:
+                text += f" 第{issue.index + 1}行"
+            if issue.field is not None:
+                text += f" [{issue.field}]"
+            lines.append(f"{text}: {issue.message}")
+        if len(self.issues) > limit:
+            lines.append(f"... 另有 {len(self.issues) - limit} 处错误")
+        return "\n".join(lines)
+
+
+# ---- 格式声明 ----
+
+class Field(NamedTuple):
+    """单个值；kind 见 KINDS"""
+    kind: str
+    required: bool = True
+
+
+class Records(NamedTuple):
+    """记录列表，每条记录是字段名到 Field 的字典"""
+    fields: Dict[str, Field]
+    required: bool = False
+
+
+Schema = Dict[str, Union[Field, Records]]
+
+CONFIG_SCHEMA: Schema = {
+    'employees_excel_path': Field('str', required=False),
+    'employees': Records({
+        '工号': Field('id'), '姓名': Field('str'), '设备编号': Field('str'), 'P/N': Field('str'),
+        '工位': Field('str'),
+        # 界面中基础产出不是整数时不写入记录，求解时按0计
+        '基础产出': Field('int', required=False),
+    }),
+    'lines': Records({'设备编号': Field('str'), 'P/N': Field('str'), '所需工位': Field('str_list')}),
+    'special_stations': Records({'特殊工位类型': Field('str')}),
+    'productions': Records({
+        '排班批次': Field('str'),
+        # 手工编辑的YAML中不加引号的日期会被解析为日期对象
+        '日期': Field('date'),
+        '班次': Field('str'), 'P/N': Field('str'), '设备': Field('str'), '姓名': Field('str'),
+        '产出': Field('number'), '工时': Field('number'),
+    }),
+}
+
+SCHEDULE_SCHEMA: Schema = {
+    'total_work_hours': Field('real'),
+    'day_shift_hours': Field('real'),
+    'night_shift_hours': Field('real'),
+    # 不加引号的数字P/N也接受，加载后由 coerce_schedule 转换为字符串
+    'demands': Records({'P_N': Field('id'), 'demand': Field('positive')}, required=True),
+}
+
+
+# ---- 各类型的检查函数 ----
+
+class _Kind(NamedTuple):
+    column_ok: Callable[[List], bool]  # 整列快速检查，由C代码完成大部分工作
+    is_valid: Callable[[Any], bool]  # 快速检查失败时逐个检查
+    message: str
+
+
+def _type_kind(types: tuple, message: str) -> _Kind:
+    allowed = frozenset(types)
+    return _Kind(lambda column: allowed.issuperset(map(type, column)),
+                 lambda value: type(value) in allowed, message)
+
+
+def _is_number(value) -> bool:
+    try:
+        float(value)
+    except (ValueError, TypeError, OverflowError):
+        return False
+    return True
+
+
+def _number_column_ok(column: List) -> bool:
+    try:
+        # 整列转换由C代码完成
+        array('d', column)
+    except (TypeError, OverflowError):
+        return False
+    return True
+
+
+_REAL_TYPES = frozenset((int, float))
+
+
+def _positive_column_ok(column: List) -> bool:
+    return _REAL_TYPES.issuperset(map(type, column)) and (not column or min(column) > 0)
+
+
+def _is_str_list(value) -> bool:
+    return type(value) is list and all(type(item) is str for item in value)
+
+
+def _str_list_column_ok(column: List) -> bool:
+    return {list}.issuperset(map(type, column)) and \
+        {str}.issuperset(map(type, (item for value in column for item in value)))
+
+
+KINDS: Dict[str, _Kind] = {
+    'str': _type_kind((str,), "应为字符串"),
+    'id': _type_kind((str, int), "应为字符串或整数"),
+    'int': _type_kind((int,), "应为整数"),
+    'real': _type_kind((int, float), "应为数字"),
+    'date': _type_kind((str, datetime.date, datetime.datetime), "应为日期字符串"),
+    'number': _Kind(_number_column_ok, _is_number, "应为数字"),
+    'positive': _Kind(_positive_column_ok, lambda value: type(value) in _REAL_TYPES and value > 0, "应为正数"),
+    'str_list': _Kind(_str_list_column_ok, _is_str_list, "应为字符串列表"),
+}
+
+
+# ---- 编译 ----
+
+_Check = Callable[[ValidationReport, Any], None]
+
+
+def _kind(field: Field) -> _Kind:
+    try:
+        return KINDS[field.kind]
+    except KeyError:
+        raise ValueError(f"未知的字段类型: {field.kind}")
+
+
+def _extract_column(records: List[Dict], field: str) -> Tuple[List, bool]:
+    """返回 (列, 是否每条记录都有该字段)"""
+    try:
+        return list(map(itemgetter(field), records)), True
+    except KeyError:
+        # 有记录缺少该字段时用占位对象补齐，后续逐行处理
+        return list(map(methodcaller('get', field, _MISSING), records)), False
+
+
+def _compile_value(section: str, field: Field) -> _Check:
+    kind = _kind(field)
+    is_valid, message = kind.is_valid, kind.message
+
+    def check(report: ValidationReport, value):
+        if not is_valid(value):
+            report.add(section, None, None, message)
+    return check
+
+
+def _compile_records(section: str, records_spec: Records) -> _Check:
+    # (字段, 是否必填, 整列检查, 逐个检查, 错误信息)，校验时不再查找格式定义
+    columns = [(name, field.required) + tuple(_kind(field))
+               for name, field in records_spec.fields.items()]
+    only_dict = frozenset((dict,))
+
+    def check(report: ValidationReport, records):
+        if type(records) is not list:
+            report.add(section, None, None, "应为列表")
+            return
+
+        rows = range(len(records))
+        if not only_dict.issuperset(map(type, records)):
+            rows = [row for row, record in enumerate(records) if type(record) is dict]
+            for row in sorted(set(range(len(records))) - set(rows)):
+                report.add(section, row, None, "应为字典")
+            records = [records[row] for row in rows]
+
+        for name, required, column_ok, is_valid, message in columns:
+            column, complete = _extract_column(records, name)
+            field_rows = rows
+            if not complete:
+                present = [value is not _MISSING for value in column]
+                if required:
+                    for row, has_value in zip(rows, present):
+                        if not has_value:
+                            report.add(section, row, name, "缺少字段")
+                field_rows = [row for row, has_value in zip(rows, present) if has_value]
+                column = [value for value in column if value is not _MISSING]
+            if column_ok(column):
+                continue
+            for row, value in zip(field_rows, column):
+                if not is_valid(value):
+                    report.add(section, row, name, message)
+    return check
+
+
+def compile_schema(schema: Schema, root: str) -> Callable[[Any], ValidationReport]:
+    """把格式声明编译为校验函数；root 为整个文档在报告中的名称"""
+    checks = []
+    for key, spec in schema.items():
+        compile_spec = _compile_records if isinstance(spec, Records) else _compile_value
+        checks.append((key, spec.required, compile_spec(key, spec)))
+
+    def validate(document) -> ValidationReport:
+        report = ValidationReport()
+        if not isinstance(document, dict):
+            report.add(root, None, None, "应为字典")
+            return report
+        for key, required, check in checks:
+            value = document.get(key, _MISSING)
+            if value is not _MISSING:
+                check(report, value)
+            elif required:
+                report.add(root, None, key, "缺少字段")
+        return report
+    return validate
+
+
+_validate_config = compile_schema(CONFIG_SCHEMA, 'config')
+_validate_schedule = compile_schema(SCHEDULE_SCHEMA, 'schedule')
+
+
+def validate_config(config) -> ValidationReport:
+    """校验管理配置，返回包含所有错误的报告"""
+    return _validate_config(config)
+
+
+def validate_schedule(schedule) -> ValidationReport:
+    """校验排班参数，返回包含所有错误的报告"""
+    report = _validate_schedule(schedule)
+    if report.ok:
+        total = schedule['day_shift_hours'] + schedule['night_shift_hours']
+        if abs(total - schedule['total_work_hours']) > 1e-6:
+            report.add('schedule', None, None, "白班和夜班时间总和应与总工作时间一致")
+    return report
+
+
+def coerce_schedule(schedule: Dict) -> Dict:
+    """把校验通过的排班参数中的 P_N 就地统一为字符串并返回
+
+    YAML中不加引号的数字P/N会解析为整数，而拉线的P/N、界面表格和求解都按字符串处理；
+    加载时统一后，求解和结果缓存的键看到的都是字符串。
+    """
+    for item in schedule['demands']:
+        if type(item['P_N']) is not str:
+            item['P_N'] = str(item['P_N'])
+    return schedule
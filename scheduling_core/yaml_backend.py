@@ -0,0 +1,97 @@
+"""YAML读写后端：优先使用libyaml的C实现，不可用时回退到纯Python实现"""
+from itertools import islice
+from typing import Callable, Dict, Iterable, Optional, TextIO
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML_AVAILABLE = False
+
+YAMLError = yaml.YAMLError
+# 释放节点树时每次释放的子节点数
+RELEASE_CHUNK = 1000
+
+
+def load(stream, loader=SafeLoader):
+    """解析YAML文档
+
+    与 yaml.load 相同，但解析完成后逐块释放节点树：大文件有数百万个节点，
+    一次性释放会长时间持有GIL，在后台线程加载时界面线程会随之卡顿。
+    """
+    parser = loader(stream)
+    try:
+        node = parser.get_single_node()
+        data = parser.construct_document(node) if node is not None else None
+    finally:
+        parser.dispose()
+    if node is not None:
+        _release_nodes(node)
+    return data
+
+
+def _release_nodes(node: yaml.Node):
+    items = node.value
+    if not isinstance(items, list):
+        return
+    while items:
+        chunk = items[-RELEASE_CHUNK:]
+        del items[-RELEASE_CHUNK:]
+        for item in chunk:
+            # 映射节点的子项是 (键节点, 值节点)
+            for child in (item if isinstance(item, tuple) else (item,)):
+                if isinstance(child.value, list) and len(child.value) > RELEASE_CHUNK:
+                    _release_nodes(child)
+        del chunk
+
+
+def dump(data, stream=None, dumper=SafeDumper):
+    """按项目统一格式输出YAML（保留中文和键顺序）"""
+    return yaml.dump(data, stream, Dumper=dumper, allow_unicode=True, sort_keys=False)
+
+
+def _indent(text: str) -> str:
+    return ''.join('  ' + line for line in text.splitlines(True))
+
+
+def _key_line(key, dumper) -> str:
+    """返回 "key:" 行，键名的引号规则与 yaml.dump 一致"""
+    return dump({key: [None]}, dumper=dumper).split('\n', 1)[0] + '\n'
+
+
+def dump_document_streaming(stream: TextIO, root_key: str, mapping: Dict,
+                            stream_keys: Iterable[str] = (), chunk_size: int = 1000,
+                            dumper=SafeDumper, progress: Optional[Callable[[int], None]] = None):
+    """输出 {root_key: mapping} 文档，stream_keys 中的长序列分块逐条写出
+
+    结果与 dump({root_key: mapping}) 解析后完全一致，但长序列不会在内存中
+    拼接成一个完整的文档字符串，可以传入生成器。
+    每写出一块后以累计写出的序列项数调用 progress，回调中抛出的异常会中止写出。
+    """
+    written = 0
+    stream_keys = set(stream_keys)
+    if not mapping:
+        dump({root_key: {}}, stream, dumper)
+        return
+
+    stream.write(_key_line(root_key, dumper))
+    for key, value in mapping.items():
+        if key not in stream_keys or isinstance(value, (str, dict)):
+            stream.write(_indent(dump({key: value}, dumper=dumper)))
+            continue
+
+        iterator = iter(value)
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            stream.write(_indent(dump({key: []}, dumper=dumper)))
+            continue
+        # "key:" 行，后面的序列项与键保持同一缩进
+        stream.write(_indent(_key_line(key, dumper)))
+        while chunk:
+            stream.write(_indent(dump(chunk, dumper=dumper)))
+            written += len(chunk)
+            if progress is not None:
+                progress(written)
+            chunk = list(islice(iterator, chunk_size))
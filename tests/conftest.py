@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 与 benchmarks 相同，直接从仓库根目录导入 scheduling_core 和界面模块
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
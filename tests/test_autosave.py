@@ -0,0 +1,51 @@
+"""自动保存快照的测试"""
+import datetime
+
+from scheduling_core.autosave import AutosaveStore
+from scheduling_core.compact_records import compact_config
+from scheduling_core.production_store import ProductionColumns
+
+
+def _config(date):
+    return compact_config({
+        'employees_excel_path': '', 'employees': [{'工号': '1', '姓名': '张三', '设备编号': 'D1', 'P/N': 'A',
+                                                   '工位': '焊接', '基础产出': 10}],
+        'lines': [], 'special_stations': [],
+        'productions': [{'排班批次': 'B1', '日期': date, '班次': '白班', 'P/N': 'A', '设备': 'D1',
+                         '姓名': '张三', '产出': 100.0, '工时': 8.0}],
+    })
+
+
+def test_round_trip(tmp_path):
+    store = AutosaveStore(str(tmp_path))
+    store.write('management_page', _config('2024-01-02'), '/data/config.yml')
+    snapshot = store.read('management_page')
+    assert snapshot.source_path == '/data/config.yml'
+    assert isinstance(snapshot.data['productions'], ProductionColumns)
+    assert snapshot.data['productions'].record(0)['日期'] == '2024-01-02'
+    assert snapshot.data['employees'][0]['基础产出'] == 10
+
+
+def test_yaml_dates_round_trip(tmp_path):
+    # YAML中不加引号的日期加载为 datetime.date
+    store = AutosaveStore(str(tmp_path))
+    store.write('management_page', _config(datetime.date(2024, 1, 2)))
+    snapshot = store.read('management_page')
+    assert snapshot.data['productions'].record(0)['日期'] == datetime.date(2024, 1, 2)
+
+
+def test_snapshots_newest_first_and_corrupt_discarded(tmp_path):
+    store = AutosaveStore(str(tmp_path))
+    store.write('scheduling_page', {'fields': {}, 'demands': []})
+    store.write('management_page', _config('2024-01-02'))
+    (tmp_path / 'broken.autosave').write_bytes(b'not a snapshot')
+    assert [snapshot.name for snapshot in store.snapshots()] == ['management_page', 'scheduling_page']
+    assert not (tmp_path / 'broken.autosave').exists()
+
+
+def test_discard(tmp_path):
+    store = AutosaveStore(str(tmp_path))
+    store.write('scheduling_page', {'fields': {}, 'demands': []})
+    store.discard('scheduling_page')
+    assert store.read('scheduling_page') is None
+    assert store.snapshots() == []
@@ -0,0 +1,91 @@
+"""基础产出估算的测试"""
+import statistics
+from collections import defaultdict
+
+from benchmarks.datagen import generate_productions
+from scheduling_core.baseline_estimator import BaselineEstimator, estimate
+from scheduling_core.production_store import ProductionColumns
+
+
+def _record(name, pn, output, hours=10.0):
+    return {'排班批次': 'B1', '日期': '2024-01-01', '班次': '白班', 'P/N': pn, '设备': 'D1',
+            '姓名': name, '产出': output, '工时': hours}
+
+
+def _columns():
+    return ProductionColumns.from_records([
+        # 张三做A：奇数条记录取中间值
+        _record('张三', 'A', 100.0), _record('张三', 'A', 300.0), _record('张三', 'A', 5000.0),
+        # 李四做A：偶数条记录取中间两条的平均
+        _record('李四', 'A', 200.0), _record('李四', 'A', 400.0),
+        # 李四做B，另有一条工时为0的记录不参与估算
+        _record('李四', 'B', 600.0), _record('李四', 'B', 999.0, hours=0.0),
+    ])
+
+
+def test_median_per_name_and_pn():
+    table = estimate(_columns())
+    assert table.rate('张三', 'A') == 30.0
+    assert table.rate('李四', 'A') == 30.0
+    assert table.rate('李四', 'B') == 60.0
+    assert table.base_output('张三', 'A') == 30
+
+
+def test_fallback_order():
+    table = estimate(_columns())
+    # 张三没做过B：退回到B所有员工的中位数
+    assert table.rate('张三', 'B') == 60.0
+    # 没有C的记录：退回到张三所有P/N的中位数
+    assert table.rate('张三', 'C') == 30.0
+    # 新员工做A：退回到A所有员工的中位数
+    assert table.rate('王五', 'A') == 30.0
+    assert table.rate('王五', 'C') is None
+    assert table.base_output('王五', 'C', default=7) == 7
+
+
+def test_no_fallback():
+    table = estimate(_columns())
+    assert table.rate('张三', 'B', fallback=False) is None
+    assert table.base_output('张三', 'B', default=5, fallback=False) == 5
+    assert table.rate('李四', 'B', fallback=False) == 60.0
+
+
+def test_zero_hour_only_records_give_no_estimate():
+    table = estimate(ProductionColumns.from_records([_record('张三', 'A', 100.0, hours=0.0)]))
+    assert table.rate('张三', 'A') is None
+
+
+def test_matches_statistics_median():
+    records = generate_productions(5000, seed=3)
+    table = estimate(ProductionColumns.from_records(records))
+    expected = defaultdict(list)
+    for record in records:
+        expected[record['姓名'], record['P/N']].append(record['产出'] / record['工时'])
+    for (name, pn), rates in expected.items():
+        assert table.rate(name, pn, fallback=False) == statistics.median(rates)
+
+
+def test_estimator_reuses_table_until_data_changes():
+    columns = _columns()
+    estimator = BaselineEstimator()
+    assert estimator.cached(columns) is None
+    table = estimator.table(columns)
+    assert estimator.cached(columns) is table
+    assert estimator.table(columns) is table
+    # 同样内容的另一份数据不复用
+    assert estimator.cached(columns.copy()) is None
+
+    columns.append_record(_record('王五', 'C', 800.0))
+    assert estimator.cached(columns) is None
+    assert estimator.table(columns).rate('王五', 'C') == 80.0
+
+
+def test_store_result_computed_on_a_copy():
+    columns = _columns()
+    estimator = BaselineEstimator()
+    snapshot = columns.copy()
+    estimator.store(columns, snapshot.version, estimate(snapshot))
+    assert estimator.cached(columns).rate('张三', 'A') == 30.0
+    # 后台估算期间数据被修改时，结果不再视为有效
+    estimator.store(columns, snapshot.version - 1, estimate(snapshot))
+    assert estimator.cached(columns) is None
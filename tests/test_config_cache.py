@@ -0,0 +1,69 @@
+"""管理配置二进制缓存的测试"""
+import os
+
+from scheduling_core import config_cache
+from scheduling_core.config_data import load_snapshot, save_config
+from scheduling_core.production_store import ProductionColumns
+
+
+def _config():
+    return {'employees_excel_path': '',
+            'employees': [{'工号': '1', '姓名': '张三', '设备编号': 'D1', 'P/N': 'A', '工位': '焊接', '基础产出': 20}],
+            'lines': [{'设备编号': 'D1', 'P/N': 'A', '所需工位': ['焊接']}],
+            'special_stations': [],
+            'productions': [{'排班批次': 'B1', '日期': '2024-01-01', '班次': '白班', 'P/N': 'A', '设备': 'D1',
+                             '姓名': '张三', '产出': 100.0, '工时': 8.0}]}
+
+
+def _saved(tmp_path):
+    path = str(tmp_path / 'config.yml')
+    save_config(_config(), path)
+    return path
+
+
+def test_cache_round_trip(tmp_path):
+    path = _saved(tmp_path)
+    cached = config_cache.load(path)
+    assert isinstance(cached['productions'], ProductionColumns)
+    assert cached['productions'].to_records() == _config()['productions']
+    assert cached['employees'] == _config()['employees']
+
+
+def test_touched_file_with_same_content_still_hits(tmp_path):
+    path = _saved(tmp_path)
+    info = os.stat(path)
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + 10 ** 9))
+    assert config_cache.load(path) is not None
+
+
+def test_changed_content_misses(tmp_path):
+    path = _saved(tmp_path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    # 大小不变、内容变化
+    with open(path, 'wb') as f:
+        f.write(data.replace('张三'.encode('utf-8'), '李四'.encode('utf-8')))
+    assert config_cache.load(path) is None
+    # 重新解析YAML并重建缓存
+    config = load_snapshot(path)
+    assert config['employees'][0]['姓名'] == '李四'
+    assert config_cache.load(path)['employees'][0]['姓名'] == '李四'
+
+
+def test_corrupt_or_truncated_cache_is_ignored(tmp_path):
+    path = _saved(tmp_path)
+    sidecar = config_cache.cache_path(path)
+    with open(sidecar, 'rb') as f:
+        data = f.read()
+    for broken in (data[:-3], data[:-1] + bytes([data[-1] ^ 0xFF]), b'', b'AISCFG\x00\x63' + data[8:]):
+        with open(sidecar, 'wb') as f:
+            f.write(broken)
+        assert config_cache.load(path) is None
+        assert load_snapshot(path)['employees'] == _config()['employees']
+
+
+def test_missing_yaml_or_cache(tmp_path):
+    path = _saved(tmp_path)
+    os.remove(config_cache.cache_path(path))
+    assert config_cache.load(path) is None
+    assert config_cache.load(str(tmp_path / 'missing.yml')) is None
@@ -0,0 +1,48 @@
+"""管理配置加载、操作日志回放的测试"""
+from scheduling_core.config_data import append_to_journal, load_config, save_config
+from scheduling_core.config_journal import ConfigJournal, add_op, delete_op
+
+
+def _config():
+    return {'employees_excel_path': '',
+            'employees': [{'工号': '1', '姓名': '张三', '设备编号': 'D1', 'P/N': 'A', '工位': '焊接', '基础产出': 20}],
+            'lines': [{'设备编号': 'D1', 'P/N': 'A', '所需工位': ['焊接']}],
+            'special_stations': [], 'productions': []}
+
+
+def test_journal_ops_replayed_on_load(tmp_path):
+    path = str(tmp_path / 'config.yml')
+    save_config(_config(), path)
+    journal = ConfigJournal(path)
+    append_to_journal(journal, [add_op('lines', {'设备编号': 'D2', 'P/N': 'B', '所需工位': ['检测']}),
+                                delete_op('employees', [0])])
+
+    config, warnings = load_config(path)
+    assert warnings == []
+    assert [line['设备编号'] for line in config['lines']] == ['D1', 'D2']
+    assert list(config['employees']) == []
+
+
+def test_load_with_bad_journal_leaves_files_unchanged(tmp_path):
+    path = str(tmp_path / 'config.yml')
+    save_config(_config(), path)
+    journal = ConfigJournal(path)
+    append_to_journal(journal, [delete_op('lines', [5]),
+                                add_op('lines', {'设备编号': 'D2', 'P/N': 'B', '所需工位': ['检测']})])
+    with open(path, 'rb') as f:
+        yaml_before = f.read()
+    with open(journal.path, 'rb') as f:
+        journal_before = f.read()
+
+    config, warnings = load_config(path)
+    assert len(warnings) == 1
+    assert [line['设备编号'] for line in config['lines']] == ['D1']
+    with open(path, 'rb') as f:
+        assert f.read() == yaml_before
+    with open(journal.path, 'rb') as f:
+        assert f.read() == journal_before
+
+    # 显式保存完整快照后日志清空，再次加载没有提示
+    save_config(config, path)
+    assert not journal.exists()
+    assert load_config(path)[1] == []
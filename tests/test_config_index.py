@@ -0,0 +1,64 @@
+"""管理配置内存索引的测试"""
+from scheduling_core.config_index import ConfigIndex
+
+
+def _employee(emp_id, station, pn='A', device='D1'):
+    return {'工号': emp_id, '姓名': f'员工{emp_id}', '设备编号': device, 'P/N': pn, '工位': station}
+
+
+def _config():
+    return {'employees': [_employee('1', '焊接'), _employee('2', '焊接', pn='B'),
+                          _employee('3', '检测', device='D2'), _employee('4', '焊接', device='D2')],
+            'lines': [{'设备编号': 'D1', 'P/N': 'A', '所需工位': ['焊接', '检测', '焊接']},
+                      {'设备编号': 'D2', 'P/N': 'A', '所需工位': ['检测']}],
+            'special_stations': [{'特殊工位类型': '焊接'}]}
+
+
+def _ids(records):
+    return [record['工号'] for record in records]
+
+
+def test_lookups_follow_insertion_order():
+    index = ConfigIndex.from_config(_config())
+    assert [line['设备编号'] for line in index.lines_for_pn('A')] == ['D1', 'D2']
+    # 所需工位中重复的工位只索引一次
+    assert index.lines.count('station', '焊接') == 1
+    assert index.lines.count('station', '检测') == 2
+    assert _ids(index.qualified_employees('焊接')) == ['1', '2', '4']
+    assert _ids(index.qualified_employees('焊接', pn='A')) == ['1', '4']
+    assert _ids(index.qualified_employees('焊接', device='D2')) == ['4']
+    assert _ids(index.qualified_employees('焊接', pn='A', device='D1')) == ['1']
+    assert index.is_special_station('焊接') and not index.is_special_station('检测')
+
+
+def test_remove_and_update_keep_ids_and_indexes_in_step():
+    config = _config()
+    index = ConfigIndex.from_config(config)
+    employees = index.employees
+    ids = list(employees.records)
+    employees.remove([ids[0]])
+    assert _ids(index.qualified_employees('焊接', pn='A')) == ['4']
+    assert employees.keys('name').count('员工1') == 0
+
+    employees.update(ids[3], _employee('4', '检测', device='D2'))
+    assert _ids(index.qualified_employees('检测')) == ['3', '4']
+    assert index.qualified_employees('焊接', device='D2') == []
+    # 记录ID和顺序不变
+    assert list(employees.records) == ids[1:]
+    assert employees.positions([ids[3], ids[2]]) == [1, 2]
+
+    new_id = employees.add(_employee('5', '焊接'))
+    assert new_id not in ids
+    assert index.to_config()['employees'][-1]['工号'] == '5'
+
+
+def test_index_matches_rebuild_after_edits():
+    index = ConfigIndex.from_config(_config())
+    ids = list(index.employees.records)
+    index.employees.remove(ids[1:3])
+    index.employees.extend([_employee('6', '检测', pn='B'), _employee('7', '包装')])
+    rebuilt = ConfigIndex.from_config(index.to_config())
+    for name in index.employees.indexes:
+        for key in rebuilt.employees.keys(name):
+            assert _ids(index.employees.lookup(name, key)) == _ids(rebuilt.employees.lookup(name, key))
+        assert sorted(map(str, index.employees.keys(name))) == sorted(map(str, rebuilt.employees.keys(name)))
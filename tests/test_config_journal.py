@@ -0,0 +1,56 @@
+"""配置操作日志的测试"""
+from scheduling_core.config_journal import ConfigJournal, add_op, apply_ops, delete_op
+from scheduling_core.production_store import ProductionColumns
+
+
+def _production(name):
+    return {'排班批次': 'B1', '日期': '2024-01-01', '班次': '白班', 'P/N': 'A', '设备': 'D1', '姓名': name,
+            '产出': 100, '工时': 8}
+
+
+def test_apply_ops_to_lists_and_columns():
+    config = {'lines': [{'设备编号': f'D{i}'} for i in range(5)],
+              'productions': ProductionColumns.from_records([_production(f'员工{i}') for i in range(5)])}
+    ops = [delete_op('lines', [1, 2, 4]), add_op('lines', {'设备编号': 'D9'}),
+           delete_op('productions', [0, 3]), add_op('productions', _production('新员工'))]
+    assert apply_ops(config, ops) == len(ops)
+    assert [line['设备编号'] for line in config['lines']] == ['D0', 'D3', 'D9']
+    assert config['productions'].strings['姓名'].to_list() == ['员工1', '员工2', '员工4', '新员工']
+
+
+def test_apply_ops_stops_at_first_bad_op():
+    config = {'lines': [{'设备编号': 'D0'}]}
+    ops = [add_op('lines', {'设备编号': 'D1'}), delete_op('lines', [7]), add_op('lines', {'设备编号': 'D2'}),
+           {'op': 'rename', 'section': 'lines'}]
+    assert apply_ops(config, ops) == 1
+    assert [line['设备编号'] for line in config['lines']] == ['D0', 'D1']
+    assert apply_ops({}, [add_op('unknown', {})]) == 0
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = tmp_path / 'config.yml'
+    path.write_text('config: {}\n', encoding='utf-8')
+    journal = ConfigJournal(str(path))
+    journal.append([add_op('lines', {'设备编号': 'D1'})])
+    journal.append([add_op('lines', {'设备编号': 'D2'})])
+    with open(journal.path, 'rb+') as f:
+        data = f.read()
+        # 模拟写到一半时崩溃：最后一行缺少结尾
+        f.seek(0)
+        f.truncate()
+        f.write(data[:-5])
+
+    reopened = ConfigJournal(str(path))
+    assert [op['record']['设备编号'] for op in reopened.read_ops()] == ['D1']
+    # 追加时截掉半行，之后的操作可以正常回放
+    reopened.append([add_op('lines', {'设备编号': 'D3'})])
+    assert [op['record']['设备编号'] for op in ConfigJournal(str(path)).read_ops()] == ['D1', 'D3']
+
+
+def test_journal_of_replaced_base_is_ignored(tmp_path):
+    path = tmp_path / 'config.yml'
+    path.write_text('config: {}\n', encoding='utf-8')
+    journal = ConfigJournal(str(path))
+    journal.append([add_op('lines', {'设备编号': 'D1'})])
+    path.write_text('config: {lines: []}\n', encoding='utf-8')
+    assert ConfigJournal(str(path)).read_ops() == []
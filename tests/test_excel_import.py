@@ -0,0 +1,26 @@
+"""员工Excel导入的测试"""
+from openpyxl import Workbook
+
+from scheduling_core.excel_import import EMPLOYEE_FIELDS, iter_employee_batches
+
+
+def test_blank_or_invalid_base_output_imported_and_reported(tmp_path):
+    path = str(tmp_path / 'employees.xlsx')
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(EMPLOYEE_FIELDS)
+    sheet.append([1001.0, '张三', 'D1', 'A', '焊接', 20])
+    sheet.append([1002, '李四', 'D1', 'A', '焊接', None])
+    sheet.append([1003, '王五', 'D1', 'A', '焊接', '未知'])
+    sheet.append([None, '赵六', 'D1', 'A', '焊接', 20])
+    workbook.save(path)
+
+    employees, skipped_rows, no_output_rows = [], [], []
+    for batch, _, _, skipped_rows, no_output_rows in iter_employee_batches(path, batch_size=2):
+        employees.extend(batch)
+
+    assert [employee['工号'] for employee in employees] == ['1001', '1002', '1003']
+    assert employees[0]['基础产出'] == 20
+    assert '基础产出' not in employees[1] and '基础产出' not in employees[2]
+    assert skipped_rows == [5]
+    assert no_output_rows == [3, 4]
@@ -0,0 +1,24 @@
+"""文件读写工具的测试"""
+import gc
+
+from scheduling_core.file_utils import gc_paused
+
+
+def test_gc_paused_nested_restores_on_last_exit():
+    assert gc.isenabled()
+    with gc_paused():
+        with gc_paused():
+            assert not gc.isenabled()
+        # 内层退出时外层仍在解析
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_gc_paused_keeps_disabled_state():
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
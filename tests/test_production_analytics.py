@@ -0,0 +1,61 @@
+"""生产统计增量更新的测试"""
+import random
+
+import pytest
+
+from benchmarks.datagen import generate_productions
+from scheduling_core.production_analytics import DIMENSIONS, ProductionAnalytics, percentile
+from scheduling_core.production_store import ProductionColumns
+
+
+def _snapshot(analytics):
+    return [(row.key, row.count, round(row.output, 6), round(row.hours, 6),
+             None if row.mean_rate is None else round(row.mean_rate, 6),
+             tuple(None if value is None else round(value, 6) for value in row.percentiles))
+            for row in analytics.summary()]
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+
+@pytest.mark.parametrize('dimension', list(DIMENSIONS))
+def test_incremental_add_remove_matches_rebuild(dimension):
+    records = generate_productions(3000, seed=1)
+    for record in records[::50]:
+        # 工时为0的记录不计入每小时产出分布
+        record['工时'] = 0.0
+    columns = ProductionColumns.from_records(records[:2000])
+    analytics = ProductionAnalytics(columns, DIMENSIONS[dimension])
+
+    start = len(columns)
+    columns.extend_records(records[2000:])
+    analytics.add_rows(start, len(columns))
+
+    rng = random.Random(0)
+    for _ in range(20):
+        first = rng.randrange(len(columns) - 50)
+        count = rng.randint(1, 50)
+        analytics.remove_rows(first, first + count)
+        columns.remove_range(first, count)
+
+    rebuilt = ProductionAnalytics(columns, DIMENSIONS[dimension])
+    assert _snapshot(analytics) == _snapshot(rebuilt)
+    assert analytics.total().count == len(columns)
+
+
+def test_removing_last_row_of_group_drops_group():
+    records = generate_productions(10, seed=2)
+    records[-1]['姓名'] = '只出现一次'
+    columns = ProductionColumns.from_records(records)
+    analytics = ProductionAnalytics(columns, ('姓名',))
+    version = analytics.group_version
+    assert analytics.get('只出现一次').count == 1
+
+    analytics.remove_rows(9, 10)
+    columns.remove_range(9, 1)
+    assert analytics.get('只出现一次') is None
+    assert analytics.group_version > version
+    assert len(analytics.sorted_keys()) == len(analytics.groups)
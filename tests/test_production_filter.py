@@ -0,0 +1,37 @@
+"""生产情况筛选和排序的测试"""
+import datetime
+
+from scheduling_core.production_filter import (
+    ProductionQuery, ProductionSearchIndex, filter_rows, normalize_date, sort_rows
+)
+from scheduling_core.production_store import ProductionColumns
+
+
+def _columns():
+    dates = ['2024/1/5', '2024-01-06', datetime.date(2024, 1, 7), '2024-01-08 00:00:00']
+    return ProductionColumns.from_records([
+        {'排班批次': 'B1', '日期': dates[i % 4], '班次': '白班' if i % 2 else '夜班', 'P/N': f'pn-{i % 3}',
+         '设备': 'D1', '姓名': f'员工{i}', '产出': float(10 - i), '工时': 8.0} for i in range(8)])
+
+
+def test_normalize_date():
+    assert normalize_date('2024/1/5') == '2024-01-05'
+    assert normalize_date(datetime.date(2024, 1, 7)) == '2024-01-07'
+    assert normalize_date('昨天') == ''
+
+
+def test_filter_by_date_shift_and_text():
+    columns = _columns()
+    index = ProductionSearchIndex()
+    query = ProductionQuery(date_from='2024-01-06', date_to='2024-01-07', shift='白班')
+    assert list(filter_rows(columns, query, index)) == [1, 5]
+    assert list(filter_rows(columns, ProductionQuery(pn='PN-1', text='员工'), index)) == [1, 4, 7]
+    assert list(filter_rows(columns, ProductionQuery(text='员工3'), index, start=2, end=6)) == [3]
+    assert filter_rows(columns, ProductionQuery(name='员工'), index, should_stop=lambda: True) is None
+
+
+def test_sort_rows_is_stable():
+    columns = _columns()
+    assert list(sort_rows(columns, None, '产出')) == [7, 6, 5, 4, 3, 2, 1, 0]
+    # P/N 相同的行保持原有顺序
+    assert list(sort_rows(columns, [0, 1, 2, 3, 4, 5], 'P/N', descending=True)) == [2, 5, 1, 4, 0, 3]
@@ -0,0 +1,40 @@
+"""生产情况列式存储的测试"""
+from scheduling_core.production_store import PRODUCTION_FIELDS, ProductionColumns
+
+
+def _records(count):
+    return [{'排班批次': f'B{i % 3}', '日期': '2024-01-01', '班次': '白班', 'P/N': f'PN{i % 2}',
+             '设备': 'D1', '姓名': f'员工{i}', '产出': float(i), '工时': 8.0} for i in range(count)]
+
+
+def test_round_trip_and_iter_records():
+    records = _records(7)
+    columns = ProductionColumns.from_records(records)
+    assert len(columns) == 7
+    assert columns.to_records() == records
+    assert list(columns.iter_records(chunk_size=3)) == records
+    assert columns.record(2) == records[2]
+    assert columns.value(4, PRODUCTION_FIELDS.index('姓名')) == '员工4'
+
+
+def test_remove_ranges_and_row_index():
+    columns = ProductionColumns.from_records(_records(10))
+    assert columns.rows_for('P/N', 'PN1') == [1, 3, 5, 7, 9]
+    version = columns.version
+    columns.remove_ranges([(6, 2), (0, 3)])
+    assert columns.version > version
+    assert columns.strings['姓名'].to_list() == ['员工3', '员工4', '员工5', '员工8', '员工9']
+    assert columns.rows_for('P/N', 'PN1') == [0, 2, 4]
+    columns.append_record(_records(12)[11])
+    assert columns.rows_for('P/N', 'PN1') == [0, 2, 4, 5]
+    assert columns.rows_for('P/N', '不存在') == []
+
+
+def test_copy_is_independent():
+    columns = ProductionColumns.from_records(_records(4))
+    copy = columns.copy()
+    assert copy.version == columns.version
+    columns.remove_range(0, 2)
+    columns.append_record({**_records(1)[0], '姓名': '新员工'})
+    assert len(copy) == 4
+    assert copy.to_records() == _records(4)
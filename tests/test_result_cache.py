@@ -0,0 +1,53 @@
+"""排班结果缓存的测试"""
+from scheduling_core.result_cache import ResultCache, cache_key, config_digest, solve_cached
+
+
+def _schedule(pn, demand=200.0):
+    return {'total_work_hours': 20, 'day_shift_hours': 10, 'night_shift_hours': 10,
+            'demands': [{'P_N': pn, 'demand': demand}]}
+
+
+def _config():
+    lines = [{'设备编号': 'D1', 'P/N': '1001', '所需工位': ['焊接']}]
+    employees = [{'工号': str(i), '姓名': f'员工{i}', '设备编号': 'D1', 'P/N': '1001',
+                  '工位': '焊接', '基础产出': 20} for i in range(2)]
+    return {'employees': employees, 'lines': lines, 'special_stations': []}
+
+
+def test_numeric_and_string_pn_share_a_key():
+    # 求解时P/N按字符串匹配，两种写法的结果相同
+    digest = config_digest(_config())
+    assert cache_key(_schedule(1001), digest) == cache_key(_schedule('1001'), digest)
+
+
+def test_equivalent_numbers_share_a_key():
+    digest = config_digest(_config())
+    schedule = _schedule('1001', 200)
+    same = dict(schedule, total_work_hours=20.0)
+    assert cache_key(schedule, digest) == cache_key(same, digest)
+
+
+def test_config_change_changes_key():
+    config = _config()
+    changed = _config()
+    changed['employees'][0]['基础产出'] = 30
+    assert config_digest(config) != config_digest(changed)
+
+
+def test_solve_cached_hits_after_first_solve(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    first = solve_cached(_schedule('1001'), _config(), cache)
+    second = solve_cached(_schedule('1001'), _config(), cache)
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.objective == first.objective == 0
+
+
+def test_cached_result_matches_uncached_for_numeric_pn(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    solve_cached(_schedule(1001), _config(), cache)
+    cached = solve_cached(_schedule('1001'), _config(), cache)
+    uncached = solve_cached(_schedule('1001'), _config(), None)
+    assert cached.from_cache
+    assert cached.objective == uncached.objective
+    assert cached.produced == uncached.produced
@@ -0,0 +1,64 @@
+"""排班参数读写与P/N类型的测试"""
+import pytest
+
+from scheduling_core.schedule_data import ScheduleDataError, load_schedule, save_schedule
+from scheduling_core.scheduling_engine import IncrementalSolver, solve
+
+SCHEDULE_YAML = """\
+schedule:
+  total_work_hours: 20
+  day_shift_hours: 10
+  night_shift_hours: 10
+  demands:
+  - P_N: 1001
+    demand: 200
+  - P_N: A
+    demand: 200
+"""
+
+
+def _config():
+    lines = [{'设备编号': 'D1', 'P/N': '1001', '所需工位': ['焊接']},
+             {'设备编号': 'D2', 'P/N': 'A', '所需工位': ['焊接']}]
+    employees = [{'工号': str(i), '姓名': f'员工{i}', '设备编号': line['设备编号'], 'P/N': line['P/N'],
+                  '工位': '焊接', '基础产出': 20} for i, line in enumerate(lines * 2)]
+    return {'employees_excel_path': '', 'employees': employees, 'lines': lines,
+            'special_stations': [], 'productions': []}
+
+
+def test_unquoted_numeric_pn_loads_as_string(tmp_path):
+    path = tmp_path / 'schedule.yml'
+    path.write_text(SCHEDULE_YAML, encoding='utf-8')
+    schedule = load_schedule(str(path))
+    assert [item['P_N'] for item in schedule['demands']] == ['1001', 'A']
+
+
+def test_unquoted_numeric_pn_matches_line_pn(tmp_path):
+    path = tmp_path / 'schedule.yml'
+    path.write_text(SCHEDULE_YAML, encoding='utf-8')
+    result = solve(load_schedule(str(path)), _config())
+    assert result.shortfall('1001') == 0
+    assert result.shortfall('A') == 0
+
+
+def test_solver_accepts_mixed_pn_types():
+    # 直接调用求解时P/N可能仍是整数，与字符串P/N需求相同时排序不能出错
+    schedule = {'total_work_hours': 20, 'day_shift_hours': 10, 'night_shift_hours': 10,
+                'demands': [{'P_N': 1001, 'demand': 200.0}, {'P_N': 'A', 'demand': 200.0}]}
+    result = IncrementalSolver(_config()).solve(schedule)
+    assert result.produced['1001'] >= 200
+    assert result.objective == 0
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'schedule.yml')
+    data = {'total_work_hours': 60.0, 'day_shift_hours': 40.0, 'night_shift_hours': 20.0,
+            'demands': [{'P_N': 'PN-1', 'demand': 12.5}]}
+    save_schedule(data, path)
+    assert load_schedule(path) == data
+
+
+def test_invalid_schedule_is_rejected(tmp_path):
+    with pytest.raises(ScheduleDataError):
+        save_schedule({'total_work_hours': 60.0, 'day_shift_hours': 40.0, 'night_shift_hours': 10.0,
+                       'demands': [{'P_N': 'PN-1', 'demand': 0}]}, str(tmp_path / 'schedule.yml'))
@@ -0,0 +1,76 @@
+"""增量求解与完整求解的对比测试"""
+import copy
+import random
+
+import pytest
+
+from benchmarks.datagen import generate_factory
+from scheduling_core.scheduling_engine import IncrementalSolver, solve
+
+# 增量修复是启发式的，允许目标值比完整求解差总需求的这个比例
+TOLERANCE = 0.02
+
+
+def _check_valid(result):
+    """每名员工最多出现在一次开线中"""
+    ids = [(assignment.employee_id, assignment.shift, assignment.device) for assignment in result.assignments]
+    assert len({employee_id for employee_id, _, _ in ids}) == len({(e, s, d) for e, s, d in ids})
+
+
+def _compare(solver, schedule, config):
+    result = solver.resolve(schedule)
+    full = solve(schedule, config)
+    _check_valid(result)
+    assert result.objective <= full.objective + TOLERANCE * sum(full.demand.values())
+    return result, full
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_resolve_after_demand_edits(seed):
+    schedule, config = generate_factory(1500, 30, seed=seed)
+    solver = IncrementalSolver(config)
+    solver.solve(schedule)
+    rng = random.Random(seed)
+    for _ in range(10):
+        schedule = copy.deepcopy(schedule)
+        for item in rng.sample(schedule['demands'], 2):
+            item['demand'] = float(rng.randint(200, 4000))
+        result, _ = _compare(solver, schedule, config)
+        assert result.incremental
+
+
+def test_resolve_after_pn_removed_and_added():
+    schedule, config = generate_factory(1500, 30, seed=4)
+    solver = IncrementalSolver(config)
+    solver.solve(schedule)
+
+    removed = copy.deepcopy(schedule)
+    item = removed['demands'].pop(0)
+    result, _ = _compare(solver, removed, config)
+    assert result.incremental
+    assert item['P_N'] not in result.produced
+    assert all(assignment.pn != item['P_N'] for assignment in result.assignments)
+
+    result, _ = _compare(solver, schedule, config)
+    assert result.incremental
+    assert result.produced[item['P_N']] > 0
+
+
+@pytest.mark.parametrize('day_hours', [0, 10, 60])
+def test_shift_hours_edit_solves_from_scratch(day_hours):
+    schedule, config = generate_factory(3000, 60, seed=2)
+    solver = IncrementalSolver(config)
+    solver.solve(schedule)
+    schedule = copy.deepcopy(schedule)
+    schedule['day_shift_hours'] = day_hours
+    schedule['total_work_hours'] = day_hours + schedule['night_shift_hours']
+
+    result, full = _compare(solver, schedule, config)
+    assert not result.incremental
+    assert result.objective == full.objective
+    assert result.assignments == full.assignments
+
+    # 之后的小修改从完整求解的结果出发
+    schedule = copy.deepcopy(schedule)
+    schedule['demands'][0]['demand'] += 500
+    _compare(solver, schedule, config)
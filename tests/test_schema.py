@@ -0,0 +1,43 @@
+"""数据格式校验的测试"""
+import datetime
+
+from scheduling_core.schema import coerce_schedule, validate_config, validate_schedule
+
+
+def _config():
+    return {'employees': [{'工号': 1001, '姓名': '张三', '设备编号': 'D1', 'P/N': 'A', '工位': '焊接'}],
+            'lines': [{'设备编号': 'D1', 'P/N': 'A', '所需工位': ['焊接']}],
+            'productions': [{'排班批次': 'B1', '日期': datetime.date(2024, 1, 1), '班次': '白班', 'P/N': 'A',
+                             '设备': 'D1', '姓名': '张三', '产出': 100, '工时': 8.0}]}
+
+
+def test_valid_config_with_optional_fields():
+    # 工号可以是数字，基础产出可以省略，日期可以是日期对象
+    assert validate_config(_config()).ok
+
+
+def test_config_reports_every_bad_row():
+    config = _config()
+    config['employees'] += [{'工号': '2', '姓名': 3, '设备编号': 'D1', 'P/N': 'A', '工位': '焊接'},
+                            {'工号': '3', '姓名': '李四', 'P/N': 'A', '工位': '焊接', '基础产出': 'x'}]
+    config['lines'][0]['所需工位'] = '焊接'
+    report = validate_config(config)
+    assert not report.ok
+    assert report.bad_rows('employees') == [1, 2]
+    assert report.bad_rows('lines') == [0]
+    assert "员工 第2行 [姓名]" in report.summary()
+
+
+def test_schedule_hours_must_add_up():
+    schedule = {'total_work_hours': 60, 'day_shift_hours': 40, 'night_shift_hours': 10,
+                'demands': [{'P_N': 'A', 'demand': 10}]}
+    assert not validate_schedule(schedule).ok
+    schedule['night_shift_hours'] = 20
+    assert validate_schedule(schedule).ok
+    schedule['demands'].append({'P_N': 'B', 'demand': 0})
+    assert validate_schedule(schedule).bad_rows('demands') == [1]
+
+
+def test_coerce_schedule_makes_pn_strings():
+    schedule = {'demands': [{'P_N': 1001, 'demand': 1}, {'P_N': 'A', 'demand': 1}]}
+    assert [item['P_N'] for item in coerce_schedule(schedule)['demands']] == ['1001', 'A']
@@ -0,0 +1,85 @@
+"""YAML读写后端的测试"""
+import datetime
+import importlib.util
+import io
+
+import pytest
+import yaml
+
+from scheduling_core import yaml_backend
+
+
+@pytest.fixture
+def pure_python_backend(monkeypatch):
+    """没有libyaml时的后端：屏蔽C实现后单独加载一份模块，不影响其他测试"""
+    monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+    monkeypatch.delattr(yaml, 'CSafeDumper', raising=False)
+    spec = importlib.util.spec_from_file_location('yaml_backend_pure', yaml_backend.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _document(rows):
+    return {
+        'employees_excel_path': 'C:/数据/员工.xlsx',
+        'employees': ({'工号': str(1000 + i), '姓名': f'员工{i}', 'P/N': '1001' if i % 2 else 'yes',
+                       '基础产出': i} for i in range(rows)),
+        'lines': [{'设备编号': 'D1', 'P/N': 'A', '所需工位': ['焊接', '检测']}],
+        'special_stations': [],
+        'productions': [{'日期': datetime.date(2024, 1, i % 28 + 1), '产出': 1.5 * i, '班次': '白班'}
+                        for i in range(rows)],
+    }
+
+
+def _expected(rows):
+    document = _document(rows)
+    document['employees'] = list(document['employees'])
+    return {'config': document}
+
+
+def _backends():
+    backends = [(yaml.SafeDumper, yaml.SafeLoader)]
+    if yaml_backend.LIBYAML_AVAILABLE:
+        backends.append((yaml.CSafeDumper, yaml.CSafeLoader))
+    return backends
+
+
+def test_fallback_without_libyaml(pure_python_backend):
+    assert not pure_python_backend.LIBYAML_AVAILABLE
+    assert pure_python_backend.SafeLoader is yaml.SafeLoader
+    text = pure_python_backend.dump(_expected(5))
+    assert pure_python_backend.load(text) == _expected(5)
+    # 两种实现写出的文件可以互相读取
+    assert yaml_backend.load(text) == _expected(5)
+
+
+@pytest.mark.parametrize('dumper, loader', _backends())
+@pytest.mark.parametrize('rows', [0, 1, 7, 25])
+def test_streaming_dump_round_trip(dumper, loader, rows):
+    stream = io.StringIO()
+    progress = []
+    yaml_backend.dump_document_streaming(stream, 'config', _document(rows), ('employees', 'productions'),
+                                         chunk_size=4, dumper=dumper, progress=progress.append)
+    assert yaml_backend.load(stream.getvalue(), loader=loader) == _expected(rows)
+    # 两个长序列各自按块报告累计写出的条数
+    assert progress == [min(n, rows) for n in range(4, rows + 4, 4)] + \
+        [rows + min(n, rows) for n in range(4, rows + 4, 4)]
+
+
+def test_streaming_dump_of_empty_mapping():
+    stream = io.StringIO()
+    yaml_backend.dump_document_streaming(stream, 'config', {})
+    assert yaml_backend.load(stream.getvalue()) == {'config': {}}
+
+
+def test_progress_exception_stops_writing():
+    stream = io.StringIO()
+
+    def stop(written):
+        raise RuntimeError(written)
+
+    with pytest.raises(RuntimeError):
+        yaml_backend.dump_document_streaming(stream, 'config', _document(10), ('employees',),
+                                             chunk_size=4, progress=stop)
+    assert '员工4' not in stream.getvalue()